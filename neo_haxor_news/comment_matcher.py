@@ -0,0 +1,319 @@
+import re
+from collections.abc import Callable
+from datetime import datetime
+from functools import cached_property
+
+from hackernews import Item
+
+from neo_haxor_news.pretty_date_time import pretty_date_time
+
+FIELD_TERM = re.compile(r"^(age|by|text):(.+)$", re.DOTALL)
+AGE_TERM = re.compile(r"^(<=|>=|<|>)?(\d+(?:\.\d+)?)([smhdw])$")
+
+
+class QuerySyntaxError(ValueError):
+    """Raised when a comment query is not a valid boolean query."""
+
+
+class CommentFields:
+    """Hold the fields of a comment that queries match against.
+
+    Each field is computed at most once per comment, and the friendly
+    submission time only if an unscoped term gets to look at it.
+
+    :type age: float
+    :param age: The comment's age in seconds, or None if unknown.
+
+    :type by: str
+    :param by: The comment's author.
+
+    :type text: str
+    :param text: The comment's text, as html.
+    """
+
+    def __init__(self, item: Item, now: datetime):
+        self.item = item
+        self.by = item.by or ""
+        self.text = item.text or ""
+        submission_time = item.submission_time
+        if isinstance(submission_time, int):
+            submission_time = datetime.fromtimestamp(submission_time)
+        self.age = (
+            (now - submission_time).total_seconds()
+            if isinstance(submission_time, datetime)
+            else None
+        )
+
+    @cached_property
+    def time(self) -> str:
+        """The friendly submission time, such as 5 minutes ago."""
+        return str(pretty_date_time(self.item.submission_time))
+
+
+class CommentMatcher:
+    """Match comments against a query, compiled once per command.
+
+    A query is a regex matched against each comment's text, author and
+    friendly submission time, as in:
+
+        (?i)(Python|JavaScript).*(remote)
+
+    Queries can also combine several terms with AND, OR, NOT and
+    parentheses, where terms next to each other are ANDed, and scope a
+    term to one field with by:, text: or age:, as in:
+
+        (?i)remote AND ((?i)python OR (?i)rust) NOT by:recruiter age:<2d
+
+    Ages are compared with <, <=, > or >= (defaults to <) against a number
+    of s(econds), m(inutes), h(ours), d(ays) or w(eeks).  Double quotes
+    keep spaces and parentheses inside a term.  A query using neither
+    operators nor field scopes, or that isn't a valid boolean query, is
+    matched as a single regex.
+
+    :type AGE_UNITS: dict (const)
+    :param AGE_UNITS: The number of seconds in each age unit.
+
+    :type OPERATORS: tuple (const)
+    :param OPERATORS: The boolean operator keywords.
+
+    :type is_boolean: bool
+    :param is_boolean: Determines whether the query was parsed as a boolean
+        query rather than matched as a single regex.
+
+    :type now: :class:`datetime.datetime`
+    :param now: The time ages are measured from.
+
+    :type query: str
+    :param query: The query.
+    """
+
+    AGE_UNITS = {
+        "s": 1,
+        "m": 60,
+        "h": 60 * 60,
+        "d": 24 * 60 * 60,
+        "w": 7 * 24 * 60 * 60,
+    }
+    OPERATORS = ("AND", "OR", "NOT")
+
+    def __init__(self, query: str, now: datetime | None = None):
+        self.query = query
+        self.now = now or datetime.now()
+        self.is_boolean = False
+        try:
+            tokens = self.tokenize(query)
+            if any(
+                kind in self.OPERATORS or FIELD_TERM.match(value)
+                for kind, value in tokens
+                if kind != "(" and kind != ")"
+            ):
+                self._predicate = self.parse(tokens)
+                self.is_boolean = True
+        except (QuerySyntaxError, re.error):
+            pass
+        if not self.is_boolean:
+            self._predicate = self.compile_term(query, scoped=False)
+
+    def match(self, item: Item) -> bool:
+        """Determine whether the given comment matches the query.
+
+        Args:
+            item (Item): The comment.
+
+        Returns:
+            bool: True if the comment matches.
+        """
+        return self._predicate(CommentFields(item, self.now))
+
+    def tokenize(self, query: str) -> list[tuple[str, str]]:
+        """Split the given query into parentheses, operators and terms.
+
+        A ( opens a group unless it starts a regex extension such as (?i),
+        a ) closes one unless it closes a regex group within the term.
+
+        Args:
+            query (str): The query.
+
+        Returns:
+            list[tuple[str, str]]: The (kind, value) tokens, where kind is
+                (, ), an operator or TERM.
+
+        Raises:
+            QuerySyntaxError: If a double quote is left open.
+        """
+        tokens = []
+        index = 0
+        while index < len(query):
+            char = query[index]
+            if char.isspace():
+                index += 1
+                continue
+            if (char == "(" and not query.startswith("(?", index)) or char == ")":
+                tokens.append((char, char))
+                index += 1
+                continue
+            term = []
+            depth = 0
+            in_class = False
+            in_quotes = False
+            while index < len(query):
+                char = query[index]
+                if char == "\\":
+                    term.append(query[index : index + 2])
+                    index += 2
+                    continue
+                if char == '"':
+                    in_quotes = not in_quotes
+                    index += 1
+                    continue
+                if not in_quotes:
+                    if in_class:
+                        in_class = char != "]"
+                    elif char == "[":
+                        in_class = True
+                    elif char == "(":
+                        depth += 1
+                    elif char == ")":
+                        if depth == 0:
+                            break
+                        depth -= 1
+                    elif char.isspace() and depth == 0:
+                        break
+                term.append(char)
+                index += 1
+            if in_quotes:
+                raise QuerySyntaxError(f"Unterminated quote in {query!r}")
+            value = "".join(term)
+            tokens.append((value if value in self.OPERATORS else "TERM", value))
+        return tokens
+
+    def parse(self, tokens: list[tuple[str, str]]) -> Callable[[CommentFields], bool]:
+        """Compile the given tokens into a predicate.
+
+        NOT binds tightest, then AND, including the implicit AND between
+        adjacent terms, then OR.
+
+        Args:
+            tokens (list[tuple[str, str]]): The tokens of the query.
+
+        Returns:
+            Callable[[CommentFields], bool]: The compiled query.
+
+        Raises:
+            QuerySyntaxError: If the tokens don't form a valid query.
+            re.error: If a term isn't a valid regex.
+        """
+        position = 0
+
+        def peek() -> str | None:
+            return tokens[position][0] if position < len(tokens) else None
+
+        def parse_or():
+            nonlocal position
+            operands = [parse_and()]
+            while peek() == "OR":
+                position += 1
+                operands.append(parse_and())
+            if len(operands) == 1:
+                return operands[0]
+            return lambda fields: any(operand(fields) for operand in operands)
+
+        def parse_and():
+            nonlocal position
+            operands = [parse_not()]
+            while peek() in ("AND", "NOT", "(", "TERM"):
+                if peek() == "AND":
+                    position += 1
+                operands.append(parse_not())
+            if len(operands) == 1:
+                return operands[0]
+            return lambda fields: all(operand(fields) for operand in operands)
+
+        def parse_not():
+            nonlocal position
+            if peek() == "NOT":
+                position += 1
+                operand = parse_not()
+                return lambda fields: not operand(fields)
+            return parse_atom()
+
+        def parse_atom():
+            nonlocal position
+            kind = peek()
+            if kind == "(":
+                position += 1
+                operand = parse_or()
+                if peek() != ")":
+                    raise QuerySyntaxError("Unbalanced parentheses")
+                position += 1
+                return operand
+            if kind != "TERM":
+                raise QuerySyntaxError(f"Expected a term, got {kind}")
+            value = tokens[position][1]
+            position += 1
+            return self.compile_term(value)
+
+        predicate = parse_or()
+        if position != len(tokens):
+            raise QuerySyntaxError(f"Unexpected {tokens[position][1]!r}")
+        return predicate
+
+    def compile_term(
+        self, term: str, scoped: bool = True
+    ) -> Callable[[CommentFields], bool]:
+        """Compile a single, possibly field scoped, term.
+
+        Args:
+            term (str): The term, such as python, by:pg or age:<1h.
+            scoped (bool, optional): Determines whether a field prefix
+                scopes the term, rather than being part of its regex.
+                Defaults to True.
+
+        Returns:
+            Callable[[CommentFields], bool]: The compiled term.
+
+        Raises:
+            QuerySyntaxError: If an age term is invalid.
+            re.error: If the term isn't a valid regex.
+        """
+        match = FIELD_TERM.match(term) if scoped else None
+        field, value = match.groups() if match else (None, term)
+        if field == "age":
+            return self.compile_age(value)
+        pattern = re.compile(value)
+        if field == "by":
+            return lambda fields: pattern.search(fields.by) is not None
+        if field == "text":
+            return lambda fields: pattern.search(fields.text) is not None
+        return lambda fields: (
+            pattern.search(fields.text) is not None
+            or pattern.search(fields.by) is not None
+            or pattern.search(fields.time) is not None
+        )
+
+    def compile_age(self, value: str) -> Callable[[CommentFields], bool]:
+        """Compile the value of an age: term, such as <1h.
+
+        Args:
+            value (str): The comparison, number and unit.
+
+        Returns:
+            Callable[[CommentFields], bool]: The compiled term, which never
+                matches comments of unknown age.
+
+        Raises:
+            QuerySyntaxError: If the value is invalid.
+        """
+        match = AGE_TERM.match(value)
+        if match is None:
+            raise QuerySyntaxError(f"Invalid age {value!r}")
+        comparison, number, unit = match.groups()
+        limit = float(number) * self.AGE_UNITS[unit]
+        compare = {
+            None: lambda age: age < limit,
+            "<": lambda age: age < limit,
+            "<=": lambda age: age <= limit,
+            ">": lambda age: age > limit,
+            ">=": lambda age: age >= limit,
+        }[comparison]
+        return lambda fields: fields.age is not None and compare(fields.age)
@@ -0,0 +1,248 @@
+import re
+from html import unescape
+
+import click
+
+TOKEN = re.compile(r"<(/?)([a-zA-Z]+)([^>]*)>|[^<]+|<")
+HREF = re.compile(r"""href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+
+
+class CommentLayout:
+    """Wrap styled words into indented lines as they are added.
+
+    Words are made of one or more chunks of text and their color, so a word
+    can change color midway, as in <i>do</i>n't, without being split across
+    lines.  Lines are styled once per run of the same color.
+
+    :type indent: str
+    :param indent: The prefix of every line.
+
+    :type lines: list
+    :param lines: The finished lines.
+
+    :type width: int
+    :param width: The maximum visible line length, excluding the indent.
+    """
+
+    def __init__(self, indent: str, width: int):
+        self.indent = indent
+        self.width = max(width - len(indent), 1)
+        self.lines: list[str] = []
+        self._line: list[str] = []
+        self._line_length = 0
+        self._run: list[str] = []
+        self._run_color: str | None = None
+        self._word: list[tuple[str, str | None]] = []
+        self._word_length = 0
+        self._space = False
+
+    def add_text(self, text: str, color: str | None = None):
+        """Add text, collapsing whitespace and wrapping at word boundaries.
+
+        Words that are followed by whitespace are placed right away, only
+        the first and last words may have to wait for the next chunk.
+
+        Args:
+            text (str): The plain text.
+            color (str, optional): The text color. Defaults to None.
+        """
+        words = text.split()
+        if words and not text[0].isspace():
+            self._word.append((words[0], color))
+            self._word_length += len(words[0])
+            del words[0]
+        if not words:
+            if text[-1].isspace():
+                self.end_word()
+                self._space = True
+            return
+        self.end_word()
+        last = None if text[-1].isspace() else words.pop()
+        for word in words:
+            length = len(word)
+            if not self._line_length:
+                self._append(word, color)
+                self._line_length = length
+            elif self._line_length + 1 + length > self.width:
+                self.end_line()
+                self._append(word, color)
+                self._line_length = length
+            elif color == self._run_color:
+                self._run.append(" ")
+                self._run.append(word)
+                self._line_length += 1 + length
+            else:
+                self._append(" ", None)
+                self._append(word, color)
+                self._line_length += 1 + length
+        self._space = True
+        if last is not None:
+            self._word.append((last, color))
+            self._word_length = len(last)
+
+    def end_word(self):
+        """Move the word being built to the current line, wrapping first if
+        it doesn't fit."""
+        if not self._word:
+            return
+        if self._line_length:
+            space = 1 if self._space else 0
+            if self._line_length + space + self._word_length > self.width:
+                self.end_line()
+            elif space:
+                color = self._word[0][1]
+                self._append(" ", color if color == self._run_color else None)
+                self._line_length += 1
+        for chunk, color in self._word:
+            self._append(chunk, color)
+        self._line_length += self._word_length
+        self._word = []
+        self._word_length = 0
+        self._space = False
+
+    def _append(self, chunk: str, color: str | None):
+        """Append a chunk to the current line, extending the run of its color.
+
+        Args:
+            chunk (str): The plain text.
+            color (str | None): The text color.
+        """
+        if color != self._run_color:
+            self._end_run()
+            self._run_color = color
+        self._run.append(chunk)
+
+    def _end_run(self):
+        """Style the current run of the same color and add it to the line."""
+        if self._run:
+            text = "".join(self._run)
+            color = self._run_color
+            self._line.append(click.style(text, fg=color) if color else text)
+            self._run = []
+
+    def end_line(self):
+        """Finish the current line, if any."""
+        self._end_run()
+        if self._line:
+            self.lines.append(self.indent + "".join(self._line))
+        self._line = []
+        self._line_length = 0
+
+    def end_paragraph(self):
+        """Finish the current paragraph, separating it from the next one."""
+        self.end_word()
+        self.end_line()
+        self._space = False
+        if self.lines and self.lines[-1]:
+            self.lines.append("")
+
+    def add_preformatted(self, text: str):
+        """Add a block of preformatted text, kept as is and unwrapped.
+
+        Args:
+            text (str): The plain text.
+        """
+        self.end_paragraph()
+        for line in text.strip("\n").split("\n"):
+            self.lines.append((self.indent + line).rstrip())
+        self.end_paragraph()
+
+    def render(self) -> str:
+        """Finish the layout.
+
+        Returns:
+            str: The lines joined by newlines.
+        """
+        self.end_word()
+        self.end_line()
+        while self.lines and not self.lines[-1]:
+            self.lines.pop()
+        return "\n".join(self.lines)
+
+
+class CommentRenderer:
+    """Render the html of Hacker News comments for the terminal in one pass.
+
+    Comments use a small subset of html: <p> starts a paragraph, <a> is a
+    link, <i> is emphasis and <pre><code> is a code block.  Each comment is
+    tokenized once, and every token is styled and wrapped as it is read.
+    Links are shown as their full url, since the link text is often a
+    truncated copy of it.  Other tags are dropped, keeping their text.
+
+    :type WIDTH: int (const)
+    :param WIDTH: The default maximum line length, as `click.wrap_text`.
+
+    :type italic_color: str
+    :param italic_color: The color of emphasized text.
+
+    :type link_color: str
+    :param link_color: The color of links.
+
+    :type width: int
+    :param width: The maximum visible line length, including the indent.
+    """
+
+    WIDTH = 78
+
+    def __init__(
+        self,
+        link_color: str | None = None,
+        italic_color: str | None = None,
+        width: int = WIDTH,
+    ):
+        self.link_color = link_color
+        self.italic_color = italic_color
+        self.width = width
+
+    def render(self, html: str | None, indent: str = "") -> str:
+        """Render the given comment html.
+
+        Args:
+            html (str | None): The comment's text, as html.
+            indent (str, optional): The prefix of every line. Defaults to "".
+
+        Returns:
+            str: The styled and wrapped comment.
+        """
+        layout = CommentLayout(indent, self.width)
+        if not html:
+            return ""
+        italic_depth = 0
+        in_link = False
+        preformatted: list[str] | None = None
+        for match in TOKEN.finditer(html):
+            tag = match.group(2)
+            if tag is None:
+                text = unescape(match.group(0))
+                if preformatted is not None:
+                    preformatted.append(text)
+                elif not in_link:
+                    layout.add_text(text, self.italic_color if italic_depth else None)
+                continue
+            tag = tag.lower()
+            closing = match.group(1) == "/"
+            if tag == "pre":
+                if closing and preformatted is not None:
+                    layout.add_preformatted("".join(preformatted))
+                    preformatted = None
+                elif not closing:
+                    preformatted = []
+            elif preformatted is not None:
+                continue
+            elif tag == "p":
+                layout.end_paragraph()
+            elif tag == "a":
+                if closing:
+                    in_link = False
+                    continue
+                href = HREF.search(match.group(3))
+                url = unescape(href.group(href.lastindex)) if href else ""
+                url = "".join(url.split())
+                if url:
+                    layout.add_text(url, self.link_color)
+                    in_link = True
+            elif tag == "i":
+                italic_depth = max(italic_depth + (-1 if closing else 1), 0)
+        if preformatted is not None:
+            layout.add_preformatted("".join(preformatted))
+        return layout.render()
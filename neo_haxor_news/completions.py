@@ -17,17 +17,31 @@ SUBCOMMANDS: dict[str, str] = {
     "hiring": "Monthly hiring post",
     "jobs": "Jobs posts",
     "new": "Newest posts",
+    "search": "Search cached posts and comments",
     "show": "Show HN posts",
+    "sync": "Mirror recent items locally",
     "top": "Top posts",
     "user": "User info",
     "view": "View specified post",
 }
+JOB_POST_OPTS = [
+    "--replies matching",
+    "-r matching",
+    "--reprint",
+    "-p",
+    "--remote",
+    "--visa",
+    "--tech python",
+    "--min-salary 150k",
+    '--location ""',
+]
 ARGS_OPTS_LOOKUP: dict[str, OptsLookup] = {
     "freelance": OptsLookup(
         '"(?i)(Python|Django)"',
         [
             "--id_post " + FREELANCER_POST_ID,
             "-i " + FREELANCER_POST_ID,
+            *JOB_POST_OPTS,
         ],
     ),
     "hiring": OptsLookup(
@@ -35,6 +49,7 @@ ARGS_OPTS_LOOKUP: dict[str, OptsLookup] = {
         [
             "--id_post " + WHO_IS_HIRING_POST_ID,
             "-i " + WHO_IS_HIRING_POST_ID,
+            *JOB_POST_OPTS,
         ],
     ),
     "user": OptsLookup(
@@ -99,6 +114,21 @@ META_LOOKUP: dict[str, str] = {
         "the (optional) post id instead"
         " of the latest post (int)"
     ),
+    "--replies matching": (
+        "Also show the replies to matching posts, or all to search every "
+        "reply (none, matching or all)"
+    ),
+    "-r matching": (
+        "Also show the replies to matching posts, or all to search every "
+        "reply (none, matching or all)"
+    ),
+    "--reprint": "Also show the matches found by earlier runs (flag)",
+    "-p": "Also show the matches found by earlier runs (flag)",
+    "--remote": "Only show posts offering remote work (flag)",
+    "--visa": "Only show posts offering visa sponsorship (flag)",
+    "--tech python": "Only show posts mentioning the tech (string)",
+    "--min-salary 150k": "Only show posts whose salary reaches the amount (string)",
+    '--location ""': "Only show posts whose location contains the text (string)",
     "--limit 10": "Limits the number of user submissions displayed (int)",
     "-l 10": "Limits the number of user submissions displayed (int)",
 }
@@ -1,10 +1,14 @@
+import copy
+import io
 import os
+import time
+from datetime import datetime
 from pathlib import Path
 
 import click
 import configparser
-from urllib.request import urlretrieve
-from urllib.error import URLError
+from neo_haxor_news.atomic_files import atomic_write
+from neo_haxor_news.state_store import StateStore
 from neo_haxor_news.settings import freelancer_post_id, who_is_hiring_post_id
 from collections.abc import Callable
 
@@ -12,9 +16,18 @@ from collections.abc import Callable
 class Config:
     """Hacker News config.
 
+    The settings are read from ~/.haxornewsconfig up front.  The state and
+    the colors are loaded in sections, on the first access to one of their
+    attributes, so `hn top` never loads the seen comment ids and `hn hiring`
+    never loads item_ids.  Only the loaded or assigned state is saved, and
+    only if it changed.
+
     :type clr_x: str
     :param clr_x: Various ansi color config colors to use for highlights.
 
+    :type CACHE_DIR: str
+    :param CACHE_DIR: The directory name within the user cache directory.
+
     :type CONFIG: str
     :param CONFIG: The config file name.
 
@@ -25,16 +38,45 @@ class Config:
     :param CONFIG_CLR_X: Various ansi color config labels to use for highlights.
 
     :type CONFIG_IDS: str
-    :param CONFIG_IDS: The last list of seen post ids config label.
+    :param CONFIG_IDS: The last list of seen post ids state label.
 
     :type CONFIG_CACHE: str
     :param CONFIG_CACHE: The list of seen comments config label.
 
     :type CONFIG_HIRING_ID: str
-    :param CONFIG_HIRING_ID: The monthly freelancer post id config label.
+    :param CONFIG_HIRING_ID: The monthly who's hiring post id state label.
 
     :type CONFIG_FREELANCE_ID: str
-    :param CONFIG_FREELANCE_ID: The monthly who's hiring post id config label.
+    :param CONFIG_FREELANCE_ID: The monthly freelancer post id state label.
+
+    :type CONFIG_HIRING_MONTH: str
+    :param CONFIG_HIRING_MONTH: The month of the hiring post state label.
+
+    :type CONFIG_HIRING_CHECKED: str
+    :param CONFIG_HIRING_CHECKED: The last hiring post lookup state label.
+
+    :type HIRING_RECHECK_INTERVAL: int (const)
+    :param HIRING_RECHECK_INTERVAL: The minimum time in seconds between two
+            lookups of the hiring and freelance posts while the cached ones
+            are from an earlier month, as they are posted on the first
+            weekday of the month.
+
+    :type COLOR_DEFAULTS: dict (const)
+    :param COLOR_DEFAULTS: The default color by color config label.
+
+    :type LAZY_SECTIONS: dict (const)
+    :param LAZY_SECTIONS: The name of the method loading each lazy attribute.
+
+    :type LAZY_STATE: tuple (const)
+    :param LAZY_STATE: The state labels loaded with `state_store`.
+
+    :type STATE_DEFAULTS: dict (const)
+    :param STATE_DEFAULTS: The default value by state label, which is not
+            saved unless the state store holds another value.
+
+    :type LEGACY_STATE: tuple
+    :param LEGACY_STATE: The labels of the state older versions kept in
+            ~/.haxornewsconfig, which is moved to `state_store` on load.
 
     :type CONFIG_SHOW_TIP: bool
     :param CONFIG_SHOW_TIP: determines whether to show the tip.
@@ -45,20 +87,107 @@ class Config:
     :type hiring_id: int
     :param hiring_id: The monthly who's hiring post id.
 
-    :type item_cache: list
-    :param item_cache: A list of seen comment ids.
-            TODO: Look into an OrderedSet for improved lookup performance
-            http://code.activestate.com/recipes/576694/
+    :type hiring_month: str
+    :param hiring_month: The YYYY-MM month the cached who's hiring post was
+            posted in, empty if it was never looked up.
+
+    :type hiring_checked: int
+    :param hiring_checked: The time of the last lookup of the hiring and
+            freelance posts.
 
     :type item_ids: list
     :param item_ids: The last set of ids the user has seen,
             which allows the user to quickly access an item with the
             gh view [#] [-u/--url] command.
 
-    :type MAX_ITEM_CACHE_SIZE: int
-    :param MAX_ITEM_CACHE_SIZE: The maximum size of seen comment ids cache.
+    :type seen_ids: :class:`seen_ids.SeenIds`
+    :param seen_ids: The ids of the comments the user has seen.
+
+    :type parser: :class:`configparser.RawConfigParser`
+    :param parser: The parsed ~/.haxornewsconfig, kept to load the colors.
+
+    :type settings_changed: bool
+    :param settings_changed: Determines whether ~/.haxornewsconfig is
+            missing or holds legacy state, and needs to be written.
+
+    :type state_store: :class:`state_store.StateStore`
+    :param state_store: The state kept between commands, in the user state
+            directory: item_ids, seen_ids and the hiring and freelance posts.
+
+    :type CONFIG_MAX_WORKERS: str
+    :param CONFIG_MAX_WORKERS: The number of concurrent fetches config label.
+
+    :type max_workers: int
+    :param max_workers: The maximum number of items fetched concurrently.
+
+    :type CONFIG_STREAM_COMMENTS: str
+    :param CONFIG_STREAM_COMMENTS: The streaming comments config label.
+
+    :type stream_comments: bool
+    :param stream_comments: Determines whether to print comments while the
+            rest of the thread is still being fetched.
+
+    :type CONFIG_POOL_SIZE: str
+    :param CONFIG_POOL_SIZE: The connection pool size config label.
+
+    :type CONFIG_TIMEOUT: str
+    :param CONFIG_TIMEOUT: The request timeout config label.
+
+    :type CONFIG_KEEP_ALIVE: str
+    :param CONFIG_KEEP_ALIVE: The keep-alive config label.
+
+    :type pool_size: int
+    :param pool_size: The number of connections kept open per host.
+
+    :type timeout: float
+    :param timeout: The connect and read timeout of each request in seconds.
+
+    :type keep_alive: bool
+    :param keep_alive: Determines whether to reuse connections across requests.
+
+    :type CONFIG_REQUESTS_PER_SECOND: str
+    :param CONFIG_REQUESTS_PER_SECOND: The API rate limit config label.
+
+    :type CONFIG_MAX_RETRIES: str
+    :param CONFIG_MAX_RETRIES: The API retries config label.
+
+    :type requests_per_second: float
+    :param requests_per_second: The maximum average rate of API requests,
+        or 0 to leave it uncapped and only back off on errors.
+
+    :type max_retries: int
+    :param max_retries: The number of times a failed API request is retried.
+
+    :type CONFIG_PREFETCH_COMMENTS: str
+    :param CONFIG_PREFETCH_COMMENTS: The comment prefetch config label.
+
+    :type prefetch_comments: int
+    :param prefetch_comments: The number of listed items whose comments are
+            fetched into the item cache in the background, 0 to disable.
+
+    :type CONFIG_SYNC_UPDATES: str
+    :param CONFIG_SYNC_UPDATES: The updates feed sync config label.
+
+    :type sync_updates: bool
+    :param sync_updates: Determines whether to invalidate the item cache
+            from the Hacker News updates feed.
+
+    :type CONFIG_API_BASE_URL: str
+    :param CONFIG_API_BASE_URL: The API base url config label.
+
+    :type api_base_url: str
+    :param api_base_url: The base url of the Hacker News API, which can point
+            at a local server such as tests/hn_api_server.py.
+
+    :type CONFIG_SYNC_LOOKBACK: str
+    :param CONFIG_SYNC_LOOKBACK: The mirror window config label.
+
+    :type sync_lookback: int
+    :param sync_lookback: The number of most recent item ids hn sync keeps
+            mirrored in the item cache.
     """
 
+    CACHE_DIR = "haxor-news"
     CONFIG = ".haxornewsconfig"
     CONFIG_CLR_BOLD = "clr_bold"
     CONFIG_CLR_CODE = "clr_code"
@@ -80,48 +209,171 @@ class Config:
     CONFIG_CACHE = "item_cache"
     CONFIG_HIRING_ID = "hiring_id"
     CONFIG_FREELANCE_ID = "freelance_id"
+    CONFIG_HIRING_MONTH = "hiring_month"
+    CONFIG_HIRING_CHECKED = "hiring_checked"
+    HIRING_RECHECK_INTERVAL = 60 * 60
     CONFIG_SHOW_TIP = "show_tip"
-    MAX_ITEM_CACHE_SIZE = 20000
+    CONFIG_MAX_WORKERS = "max_workers"
+    CONFIG_STREAM_COMMENTS = "stream_comments"
+    CONFIG_POOL_SIZE = "pool_size"
+    CONFIG_TIMEOUT = "timeout"
+    CONFIG_KEEP_ALIVE = "keep_alive"
+    CONFIG_PREFETCH_COMMENTS = "prefetch_comments"
+    CONFIG_REQUESTS_PER_SECOND = "requests_per_second"
+    CONFIG_MAX_RETRIES = "max_retries"
+    CONFIG_SYNC_UPDATES = "sync_updates"
+    CONFIG_SYNC_LOOKBACK = "sync_lookback"
+    CONFIG_API_BASE_URL = "api_base_url"
+    LEGACY_STATE = (CONFIG_IDS, CONFIG_CACHE, CONFIG_HIRING_ID, CONFIG_FREELANCE_ID)
+
+    STATE_DEFAULTS = {
+        CONFIG_IDS: [],
+        CONFIG_HIRING_ID: 0,
+        CONFIG_FREELANCE_ID: 0,
+        CONFIG_HIRING_MONTH: "",
+        CONFIG_HIRING_CHECKED: 0,
+    }
+    LAZY_STATE = tuple(STATE_DEFAULTS)
+    COLOR_DEFAULTS = {
+        CONFIG_CLR_BOLD: "cyan",
+        CONFIG_CLR_CODE: "cyan",
+        CONFIG_CLR_GENERAL: None,
+        CONFIG_CLR_HEADER: "yellow",
+        CONFIG_CLR_LINK: "green",
+        CONFIG_CLR_LIST: "cyan",
+        CONFIG_CLR_NUM_COMMENTS: "green",
+        CONFIG_CLR_NUM_POINTS: "green",
+        CONFIG_CLR_TAG: "cyan",
+        CONFIG_CLR_TIME: "yellow",
+        CONFIG_CLR_TITLE: None,
+        CONFIG_CLR_TOOLTIP: None,
+        CONFIG_CLR_USER: "cyan",
+        CONFIG_CLR_VIEW_LINK: "magenta",
+        CONFIG_CLR_VIEW_INDEX: "magenta",
+    }
+    LAZY_SECTIONS = {
+        "state_store": "load_state",
+        **dict.fromkeys(LAZY_STATE, "load_state"),
+        "seen_ids": "load_seen_ids",
+        **dict.fromkeys(COLOR_DEFAULTS, "load_config_colors"),
+    }
 
     def __init__(self):
-        self.item_ids = []
-        self.item_cache = []
-        self.hiring_id = 0
-        self.freelance_id = 0
+        self.settings_changed = False
         self.show_tip = True
-        self._init_colors()
+        self.max_workers = 8
+        self.stream_comments = True
+        self.pool_size = 10
+        self.timeout = 10.0
+        self.keep_alive = True
+        self.requests_per_second = 0.0
+        self.max_retries = 4
+        self.prefetch_comments = 0
+        self.sync_updates = True
+        self.sync_lookback = 10000
+        self.api_base_url = "https://hacker-news.firebaseio.com/v0/"
+        self.parser = configparser.RawConfigParser()
         self.load_config(
             [
-                self.load_config_item_ids,
-                self.load_config_item_cache,
-                self.load_config_colors,
+                self.load_config_legacy_state,
                 self.load_config_show_tip,
+                self.load_config_max_workers,
+                self.load_config_stream_comments,
+                self.load_config_transport,
+                self.load_config_prefetch_comments,
+                self.load_config_sync_updates,
+                self.load_config_sync_lookback,
+                self.load_config_api_base_url,
             ]
         )
 
-    def _init_colors(self):
-        """Initialize colors to their defaults."""
-        self.clr_bold = "cyan"
-        self.clr_code = "cyan"
-        self.clr_general = None
-        self.clr_header = "yellow"
-        self.clr_link = "green"
-        self.clr_list = "cyan"
-        self.clr_num_comments = "green"
-        self.clr_num_points = "green"
-        self.clr_tag = "cyan"
-        self.clr_time = "yellow"
-        self.clr_title = None
-        self.clr_tooltip = None
-        self.clr_user = "cyan"
-        self.clr_view_link = "magenta"
-        self.clr_view_index = "magenta"
+    def __getattr__(self, name: str):
+        """Load the lazy section holding the given attribute.
+
+        Only called while the attribute is not set, so each section is
+        loaded on the first access to one of its attributes.
+
+        Args:
+            name (str): The attribute name.
+
+        Returns:
+            The attribute value.
+
+        Raises:
+            AttributeError: If the attribute is not in a lazy section.
+        """
+        loader = self.LAZY_SECTIONS.get(name)
+        if loader is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        getattr(self, loader)()
+        return self.__dict__[name]
+
+    def is_loaded(self, name: str) -> bool:
+        """Determine whether the given attribute was loaded or assigned.
+
+        Args:
+            name (str): The attribute name.
+
+        Returns:
+            bool: True if accessing the attribute won't load its section.
+        """
+        return name in self.__dict__
+
+    def load_state(self):
+        """Load item_ids and the hiring and freelance posts from the state
+        store.
+
+        Values assigned before the section is loaded are kept.
+        """
+        self.state_store = StateStore(self.get_state_dir())
+        values = self.state_store.values
+        for name, default in self.STATE_DEFAULTS.items():
+            if not self.is_loaded(name):
+                # Copied, as the store diffs the next save against its values.
+                self.__dict__[name] = copy.copy(values.get(name, default))
+
+    def load_seen_ids(self):
+        """Load the seen comment ids from the state store."""
+        self.seen_ids = self.state_store.seen_ids
 
     def clear_item_cache(self):
-        """Clear the item cache."""
-        self.item_cache = []
+        """Clear the seen comment ids."""
+        self.seen_ids.clear()
         self.save_cache()
 
+    def get_cache_path(self, cache_file_name: str) -> str:
+        """Get the path of a file in the user cache directory.
+
+        The directory is $XDG_CACHE_HOME/haxor-news, ~/.cache/haxor-news
+        if unset, or %LOCALAPPDATA%\\haxor-news on Windows.
+
+        Args:
+            cache_file_name (str): The cache file name.
+
+        Returns:
+            str: The cache file path.
+        """
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+        if not cache_home:
+            cache_home = os.path.join(Path.home(), ".cache")
+        return os.path.join(cache_home, self.CACHE_DIR, cache_file_name)
+
+    def get_state_dir(self) -> str:
+        """Get the user state directory.
+
+        The directory is $XDG_STATE_HOME/haxor-news, ~/.local/state/haxor-news
+        if unset, or %LOCALAPPDATA%\\haxor-news on Windows.
+
+        Returns:
+            str: The state directory path.
+        """
+        state_home = os.environ.get("XDG_STATE_HOME") or os.environ.get("LOCALAPPDATA")
+        if not state_home:
+            state_home = os.path.join(Path.home(), ".local", "state")
+        return os.path.join(state_home, self.CACHE_DIR)
+
     def get_config_path(self, config_file_name: str) -> str:
         """Get the config file path.
 
@@ -142,58 +394,156 @@ class Config:
             config_funcs (list[Callable]): The config functions to run.
         """
         config_file_path = self.get_config_path(self.CONFIG)
-        parser = configparser.RawConfigParser()
         try:
             with open(config_file_path) as config_file:
-                parser.read_file(config_file)
+                self.parser.read_file(config_file)
         except IOError:
-            # There might not be a cache yet, just silently return.
+            # There might not be a config yet, it is written on the next save.
+            self.settings_changed = True
             return None
         for config_func in config_funcs:
-            config_func(parser)
+            config_func(self.parser)
 
-    def load_config_colors(self, parser: configparser.RawConfigParser):
+    def load_config_colors(self):
         """Load the color config from ~/.haxornewsconfig.
 
-        :type parser: :class:`ConfigParser.RawConfigParser`
-        :param parser: An instance of `ConfigParser.RawConfigParser`.
+        The colors are loaded on first access, as not every command prints.
         """
-        self.load_colors(parser)
+        self.load_colors(self.parser)
 
-    def load_config_hiring_and_freelance_ids(
-        self, parser: configparser.RawConfigParser
-    ):
-        """Load the hiring and freelance ids from ~/.haxornewsconfig.
+    def load_config_legacy_state(self, parser: configparser.RawConfigParser):
+        """Move the state older versions kept in ~/.haxornewsconfig to
+        `state_store`, it is dropped from the file on the next save.
 
-        :type parser: :class:`ConfigParser.RawConfigParser`
-        :param parser: An instance of `ConfigParser.RawConfigParser`.
+        Args:
+            parser (configparser.RawConfigParser): The config parser.
         """
-        self.hiring_id = parser.getint(self.CONFIG_SECTION, self.CONFIG_HIRING_ID)
-        self.freelance_id = parser.getint(self.CONFIG_SECTION, self.CONFIG_FREELANCE_ID)
+        if not any(
+            parser.has_option(self.CONFIG_SECTION, option)
+            for option in self.LEGACY_STATE
+        ):
+            return
+        self.settings_changed = True
+        if parser.has_option(self.CONFIG_SECTION, self.CONFIG_IDS):
+            self.item_ids = [
+                int(item_id)
+                for item_id in self.load_section_list(parser, self.CONFIG_IDS)
+                if item_id.strip().isdigit()
+            ]
+        if parser.has_option(self.CONFIG_SECTION, self.CONFIG_CACHE):
+            self.seen_ids.update(
+                int(item_id)
+                for item_id in self.load_section_list(parser, self.CONFIG_CACHE)
+                if item_id.strip().isdigit()
+            )
+        self.hiring_id = parser.getint(
+            self.CONFIG_SECTION, self.CONFIG_HIRING_ID, fallback=self.hiring_id
+        )
+        self.freelance_id = parser.getint(
+            self.CONFIG_SECTION, self.CONFIG_FREELANCE_ID, fallback=self.freelance_id
+        )
 
-    def load_config_item_cache(self, parser: configparser.RawConfigParser):
-        """Load the item cache from ~/.haxornewsconfig.
+    def load_config_show_tip(self, parser: configparser.RawConfigParser):
+        """Load the show tip config from ~/.haxornewsconfig.
 
         :type parser: :class:`ConfigParser.RawConfigParser`
         :param parser: An instance of `ConfigParser.RawConfigParser`.
         """
-        self.item_cache = self.load_section_list(parser, self.CONFIG_CACHE)
+        self.show_tip = parser.getboolean(self.CONFIG_SECTION, self.CONFIG_SHOW_TIP)
 
-    def load_config_item_ids(self, parser: configparser.RawConfigParser):
-        """Load the item ids from ~/.haxornewsconfig.
+    def load_config_max_workers(self, parser: configparser.RawConfigParser):
+        """Load the number of concurrent fetches from ~/.haxornewsconfig.
 
-        :type parser: :class:`ConfigParser.RawConfigParser`
-        :param parser: An instance of `ConfigParser.RawConfigParser`.
+        Args:
+            parser (configparser.RawConfigParser): The config parser.
         """
-        self.item_ids = self.load_section_list(parser, self.CONFIG_IDS)
+        self.max_workers = parser.getint(
+            self.CONFIG_SECTION, self.CONFIG_MAX_WORKERS, fallback=self.max_workers
+        )
 
-    def load_config_show_tip(self, parser: configparser.RawConfigParser):
-        """Load the show tip config from ~/.haxornewsconfig.
+    def load_config_stream_comments(self, parser: configparser.RawConfigParser):
+        """Load the streaming comments config from ~/.haxornewsconfig.
 
-        :type parser: :class:`ConfigParser.RawConfigParser`
-        :param parser: An instance of `ConfigParser.RawConfigParser`.
+        Args:
+            parser (configparser.RawConfigParser): The config parser.
         """
-        self.show_tip = parser.getboolean(self.CONFIG_SECTION, self.CONFIG_SHOW_TIP)
+        self.stream_comments = parser.getboolean(
+            self.CONFIG_SECTION,
+            self.CONFIG_STREAM_COMMENTS,
+            fallback=self.stream_comments,
+        )
+
+    def load_config_prefetch_comments(self, parser: configparser.RawConfigParser):
+        """Load the comment prefetch config from ~/.haxornewsconfig.
+
+        Args:
+            parser (configparser.RawConfigParser): The config parser.
+        """
+        self.prefetch_comments = parser.getint(
+            self.CONFIG_SECTION,
+            self.CONFIG_PREFETCH_COMMENTS,
+            fallback=self.prefetch_comments,
+        )
+
+    def load_config_api_base_url(self, parser: configparser.RawConfigParser):
+        """Load the API base url config from ~/.haxornewsconfig.
+
+        Args:
+            parser (configparser.RawConfigParser): The config parser.
+        """
+        self.api_base_url = parser.get(
+            self.CONFIG_SECTION,
+            self.CONFIG_API_BASE_URL,
+            fallback=self.api_base_url,
+        )
+
+    def load_config_sync_lookback(self, parser: configparser.RawConfigParser):
+        """Load the mirror window config from ~/.haxornewsconfig.
+
+        Args:
+            parser (configparser.RawConfigParser): The config parser.
+        """
+        self.sync_lookback = parser.getint(
+            self.CONFIG_SECTION,
+            self.CONFIG_SYNC_LOOKBACK,
+            fallback=self.sync_lookback,
+        )
+
+    def load_config_sync_updates(self, parser: configparser.RawConfigParser):
+        """Load the updates feed sync config from ~/.haxornewsconfig.
+
+        Args:
+            parser (configparser.RawConfigParser): The config parser.
+        """
+        self.sync_updates = parser.getboolean(
+            self.CONFIG_SECTION,
+            self.CONFIG_SYNC_UPDATES,
+            fallback=self.sync_updates,
+        )
+
+    def load_config_transport(self, parser: configparser.RawConfigParser):
+        """Load the network settings from ~/.haxornewsconfig.
+
+        Args:
+            parser (configparser.RawConfigParser): The config parser.
+        """
+        self.pool_size = parser.getint(
+            self.CONFIG_SECTION, self.CONFIG_POOL_SIZE, fallback=self.pool_size
+        )
+        self.timeout = parser.getfloat(
+            self.CONFIG_SECTION, self.CONFIG_TIMEOUT, fallback=self.timeout
+        )
+        self.keep_alive = parser.getboolean(
+            self.CONFIG_SECTION, self.CONFIG_KEEP_ALIVE, fallback=self.keep_alive
+        )
+        self.requests_per_second = parser.getfloat(
+            self.CONFIG_SECTION,
+            self.CONFIG_REQUESTS_PER_SECOND,
+            fallback=self.requests_per_second,
+        )
+        self.max_retries = parser.getint(
+            self.CONFIG_SECTION, self.CONFIG_MAX_RETRIES, fallback=self.max_retries
+        )
 
     def load_color(
         self, parser: configparser.RawConfigParser, color_config: str, default: str
@@ -211,113 +561,58 @@ class Config:
         """
         try:
             color = parser.get(self.CONFIG_SECTION, color_config)
-            if color == "none":
-                color = None
+            if color.lower() == "none":
+                # Saved as None when unset.
+                return None
             # Check if the user input a valid color.
-            # If invalid, this will throw a TypeError
+            # If invalid, this will throw a TypeError or a ValueError
             click.style("", fg=color)
-        except (TypeError, configparser.NoOptionError):
+        except (TypeError, ValueError, configparser.Error):
             return default
         return color
 
     def load_colors(self, parser: configparser.RawConfigParser):
         """Load all colors from ~/.haxornewsconfig.
 
+        Colors assigned before they are loaded are kept.
+
         :type parser: :class:`ConfigParser.RawConfigParser`
         :param parser: An instance of `ConfigParser.RawConfigParser`.
         """
-        self.clr_bold = self.load_color(
-            parser=parser, color_config=self.CONFIG_CLR_BOLD, default=self.clr_bold
-        )
-        self.clr_code = self.load_color(
-            parser=parser, color_config=self.CONFIG_CLR_CODE, default=self.clr_code
-        )
-        self.clr_general = self.load_color(
-            parser=parser,
-            color_config=self.CONFIG_CLR_GENERAL,
-            default=self.clr_general,
-        )
-        self.clr_header = self.load_color(
-            parser=parser, color_config=self.CONFIG_CLR_HEADER, default=self.clr_header
-        )
-        self.clr_link = self.load_color(
-            parser=parser, color_config=self.CONFIG_CLR_LINK, default=self.clr_link
-        )
-        self.clr_list = self.load_color(
-            parser=parser, color_config=self.CONFIG_CLR_LIST, default=self.clr_list
-        )
-        self.clr_num_comments = self.load_color(
-            parser=parser,
-            color_config=self.CONFIG_CLR_NUM_COMMENTS,
-            default=self.clr_num_comments,
-        )
-        self.clr_num_points = self.load_color(
-            parser=parser,
-            color_config=self.CONFIG_CLR_NUM_POINTS,
-            default=self.clr_num_points,
-        )
-        self.clr_tag = self.load_color(
-            parser=parser, color_config=self.CONFIG_CLR_TAG, default=self.clr_tag
-        )
-        self.clr_time = self.load_color(
-            parser=parser, color_config=self.CONFIG_CLR_TIME, default=self.clr_time
-        )
-        self.clr_title = self.load_color(
-            parser=parser, color_config=self.CONFIG_CLR_TITLE, default=self.clr_title
-        )
-        self.clr_tooltip = self.load_color(
-            parser=parser,
-            color_config=self.CONFIG_CLR_TOOLTIP,
-            default=self.clr_tooltip,
-        )
-        self.clr_user = self.load_color(
-            parser=parser, color_config=self.CONFIG_CLR_USER, default=self.clr_user
-        )
-        self.clr_view_link = self.load_color(
-            parser=parser,
-            color_config=self.CONFIG_CLR_VIEW_LINK,
-            default=self.clr_view_link,
-        )
-        self.clr_view_index = self.load_color(
-            parser=parser,
-            color_config=self.CONFIG_CLR_VIEW_INDEX,
-            default=self.clr_view_index,
-        )
+        for color_config, default in self.COLOR_DEFAULTS.items():
+            self.__dict__.setdefault(
+                color_config,
+                self.load_color(
+                    parser=parser, color_config=color_config, default=default
+                ),
+            )
+
+    def hiring_posts_expired(self, now: float | None = None) -> bool:
+        """Determine whether the hiring and freelance posts must be looked up.
 
-    def load_hiring_and_freelance_ids(self, url: str | None = None):
-        """Load the latest who's hiring and freelancer post ids.
+        The cached posts are kept for the month they were posted in.  Once
+        the month is over, they are looked up again at most once every
+        HIRING_RECHECK_INTERVAL until the new posts are out.
 
-        The latest ids are updated monthly on the repo and are then cached.
-        If fetching the latest ids from the repo fails, the cache is checked.
-        If fetching the cache fails, the default ids set during installation
-        are used.
+        Args:
+            now (float, optional): The current time. Defaults to time.time().
 
-        :type url: str
-        :param url: The url to load the latest post ids.
+        Returns:
+            bool: True if the posts must be looked up.
         """
-        try:
-            if not url:
-                url = "https://raw.githubusercontent.com/donnemartin/haxor-news/master/haxor_news/settings.py"  # NOQA
-            file_name = "downloaded_settings.py"
-            urlretrieve(url, file_name)
-            with open(file_name, "r") as f:
-                for line in f:
-                    if line.startswith("who_is_hiring_post_id"):
-                        self.hiring_id = line.split(" = ")[1].strip("\n")
-                    if line.startswith("freelancer_post_id"):
-                        self.freelance_id = line.split(" = ")[1].strip("\n")
-            if self.hiring_id == 0 or self.freelance_id == 0:
-                self.load_hiring_and_freelance_ids_from_cache_or_defaults()
-        except (URLError, IOError):
-            self.load_hiring_and_freelance_ids_from_cache_or_defaults()
+        if now is None:
+            now = time.time()
+        if self.hiring_month == datetime.fromtimestamp(now).strftime("%Y-%m"):
+            return False
+        return now - self.hiring_checked >= self.HIRING_RECHECK_INTERVAL
 
     def load_hiring_and_freelance_ids_from_cache_or_defaults(self):
         """Load the hiring and freelancer post ids from cache or defaults.
 
-        If fetching the cache fails, the default ids set during installation
-        are used.
+        If the posts were never looked up, the default ids set during
+        installation are used.
         """
-        self.load_config([self.load_config_hiring_and_freelance_ids])
+        # hiring_id and freelance_id are loaded from the state store.
         if self.hiring_id == 0 or self.freelance_id == 0:
             self.hiring_id = who_is_hiring_post_id
             self.freelance_id = freelancer_post_id
@@ -344,18 +639,62 @@ class Config:
         return items_ids.split(", ")
 
     def save_cache(self):
-        """Save the current set of item ids and cache to ~/.haxornewsconfig."""
-        if (
-            self.item_cache is not None
-            and len(self.item_cache) > self.MAX_ITEM_CACHE_SIZE
+        """Save the current set of item ids, the seen comment ids and the
+        hiring and freelance post ids to the state store.
+
+        Only the loaded or assigned state is saved, and only what changed is
+        written.  ~/.haxornewsconfig is only written if it is missing or
+        holds legacy state.
+        """
+        values = {}
+        if self.is_loaded(self.CONFIG_IDS):
+            values[self.CONFIG_IDS] = [int(item_id) for item_id in self.item_ids]
+        for name in (
+            self.CONFIG_HIRING_ID,
+            self.CONFIG_FREELANCE_ID,
+            self.CONFIG_HIRING_CHECKED,
         ):
-            self.item_cache = self.item_cache[-self.MAX_ITEM_CACHE_SIZE // 2 :]
+            if self.is_loaded(name):
+                values[name] = int(getattr(self, name))
+        if self.is_loaded(self.CONFIG_HIRING_MONTH):
+            values[self.CONFIG_HIRING_MONTH] = self.hiring_month
+        if values or self.is_loaded("seen_ids"):
+            saved = self.state_store.values
+            self.state_store.save(
+                {
+                    name: value
+                    for name, value in values.items()
+                    if name in saved or value != self.STATE_DEFAULTS[name]
+                }
+            )
+        if self.settings_changed:
+            self.save_settings()
+
+    def save_settings(self):
+        """Save the user settings to ~/.haxornewsconfig."""
         config_file_path = self.get_config_path(self.CONFIG)
         parser = configparser.RawConfigParser()
         parser.add_section(self.CONFIG_SECTION)
-        parser.set(self.CONFIG_SECTION, self.CONFIG_HIRING_ID, self.hiring_id)
-        parser.set(self.CONFIG_SECTION, self.CONFIG_FREELANCE_ID, self.freelance_id)
         parser.set(self.CONFIG_SECTION, self.CONFIG_SHOW_TIP, self.show_tip)
+        parser.set(self.CONFIG_SECTION, self.CONFIG_MAX_WORKERS, self.max_workers)
+        parser.set(
+            self.CONFIG_SECTION, self.CONFIG_STREAM_COMMENTS, self.stream_comments
+        )
+        parser.set(self.CONFIG_SECTION, self.CONFIG_POOL_SIZE, self.pool_size)
+        parser.set(self.CONFIG_SECTION, self.CONFIG_TIMEOUT, self.timeout)
+        parser.set(self.CONFIG_SECTION, self.CONFIG_KEEP_ALIVE, self.keep_alive)
+        parser.set(
+            self.CONFIG_SECTION,
+            self.CONFIG_REQUESTS_PER_SECOND,
+            self.requests_per_second,
+        )
+        parser.set(self.CONFIG_SECTION, self.CONFIG_MAX_RETRIES, self.max_retries)
+        parser.set(
+            self.CONFIG_SECTION, self.CONFIG_PREFETCH_COMMENTS, self.prefetch_comments
+        )
+        parser.set(self.CONFIG_SECTION, self.CONFIG_SYNC_UPDATES, self.sync_updates)
+        parser.set(self.CONFIG_SECTION, self.CONFIG_SYNC_LOOKBACK, self.sync_lookback)
+        parser.set(self.CONFIG_SECTION, self.CONFIG_API_BASE_URL, self.api_base_url)
         parser.set(self.CONFIG_SECTION, self.CONFIG_CLR_BOLD, self.clr_bold)
         parser.set(self.CONFIG_SECTION, self.CONFIG_CLR_CODE, self.clr_code)
         parser.set(self.CONFIG_SECTION, self.CONFIG_CLR_GENERAL, self.clr_general)
@@ -373,7 +712,7 @@ class Config:
         parser.set(self.CONFIG_SECTION, self.CONFIG_CLR_USER, self.clr_user)
         parser.set(self.CONFIG_SECTION, self.CONFIG_CLR_VIEW_LINK, self.clr_view_link)
         parser.set(self.CONFIG_SECTION, self.CONFIG_CLR_VIEW_INDEX, self.clr_view_index)
-        parser.set(self.CONFIG_SECTION, self.CONFIG_IDS, self.item_ids)
-        parser.set(self.CONFIG_SECTION, self.CONFIG_CACHE, self.item_cache)
-        with open(config_file_path, "w+") as config_file:
-            parser.write(config_file)
+        settings = io.StringIO()
+        parser.write(settings)
+        atomic_write(config_file_path, settings.getvalue().encode("utf-8"))
+        self.settings_changed = False
@@ -0,0 +1,36 @@
+import time
+
+
+class Deadline:
+    """Bound the time a command spends waiting on the network.
+
+    :type expires_at: float
+    :param expires_at: The `time.monotonic` value at which the deadline
+        expires, or None for no deadline.
+
+    :type seconds: float
+    :param seconds: The time budget in seconds, or None for no deadline.
+    """
+
+    def __init__(self, seconds: float | None = None):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds if seconds is not None else None
+
+    def remaining(self) -> float | None:
+        """Get the time left before the deadline expires.
+
+        Returns:
+            float | None: The time left in seconds, 0 once expired, or None
+                if there is no deadline.
+        """
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Determine whether the deadline has expired.
+
+        Returns:
+            bool: True if there is a deadline and it has passed.
+        """
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
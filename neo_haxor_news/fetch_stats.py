@@ -0,0 +1,59 @@
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+
+@dataclass
+class FetchStats:
+    """Collect counters and timings about the fetches of a single command.
+
+    :type started_at: float
+    :param started_at: The monotonic time the command started.
+
+    :type counters: :class:`collections.Counter`
+    :param counters: The named counters, such as the number of items fetched.
+
+    :type timings: dict
+    :param timings: The seconds elapsed from `started_at` until each named
+        event first happened.
+    """
+
+    TIME_TO_FIRST_COMMENT = "time to first comment"
+
+    started_at: float = field(default_factory=time.monotonic)
+    counters: Counter = field(default_factory=Counter)
+    timings: dict[str, float] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def increment(self, name: str, amount: int = 1):
+        """Increment the given counter.
+
+        Args:
+            name (str): The counter name.
+            amount (int, optional): The amount to add. Defaults to 1.
+        """
+        with self._lock:
+            self.counters[name] += amount
+
+    def mark(self, name: str):
+        """Record the time elapsed until the given event first happened.
+
+        Later calls for the same event are ignored.
+
+        Args:
+            name (str): The event name.
+        """
+        with self._lock:
+            self.timings.setdefault(name, time.monotonic() - self.started_at)
+
+    def report(self) -> str:
+        """Create a one line per stat summary.
+
+        Returns:
+            str: The formatted stats.
+        """
+        lines = [f"elapsed: {time.monotonic() - self.started_at:.3f}s"]
+        lines += [f"{name}: {seconds:.3f}s" for name, seconds in self.timings.items()]
+        lines += [f"{name}: {count}" for name, count in sorted(self.counters.items())]
+        return "\n".join(lines)
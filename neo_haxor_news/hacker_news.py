@@ -1,12 +1,17 @@
 import platform
 import re
+import subprocess
 import sys
+import threading
+import time
 import webbrowser
-from html import unescape
+from concurrent.futures import Future, wait
+from functools import cached_property
 from typing import Iterable
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 
 import click
+import requests
 from hackernews import (
     HackerNews as ImportHackerNews,
 )
@@ -15,10 +20,21 @@ from hackernews import (
     InvalidItemID,
     InvalidUserID,
     Item,
+    User,
 )
 
+from neo_haxor_news.comment_matcher import CommentMatcher
+from neo_haxor_news.comment_renderer import CommentRenderer
 from neo_haxor_news.config import Config
+from neo_haxor_news.deadline import Deadline
+from neo_haxor_news.fetch_stats import FetchStats
+from neo_haxor_news.item_fetcher import CommentStream, ItemFetcher
+from neo_haxor_news.item_store import ItemStore
+from neo_haxor_news.job_post import JobPost, JobPostFilter, parse_job_post
 from neo_haxor_news.pretty_date_time import pretty_date_time
+from neo_haxor_news.request_scheduler import RequestScheduler
+from neo_haxor_news.single_flight import SingleFlight
+from neo_haxor_news.transport import Transport
 from neo_haxor_news.web_viewer import WebViewer
 
 
@@ -32,9 +48,31 @@ class HackerNews:
     :param COMMENT_UNSEEN: The adornment for unseen
         comments.
 
+    :type comment_matchers: dict
+    :param comment_matchers: The compiled `comment_matcher.CommentMatcher`
+        by comment query.
+
     :type config: :class:`config.Config`
     :param config: An instance of `config.Config`.
 
+    :type deadline: :class:`deadline.Deadline`
+    :param deadline: Bounds the time the command waits on fetches.
+
+    :type FREELANCE_TITLE: str (const)
+    :param FREELANCE_TITLE: The lowercase start of the title of the monthly
+        freelancer post, after "Ask HN: ".
+
+    :type HIRING_POSTS_SCANNED: int (const)
+    :param HIRING_POSTS_SCANNED: The number of HIRING_USER's most recent
+        submissions scanned for the hiring and freelance posts.
+
+    :type HIRING_TITLE: str (const)
+    :param HIRING_TITLE: The lowercase start of the title of the monthly
+        who's hiring post, after "Ask HN: ".
+
+    :type HIRING_USER: str (const)
+    :param HIRING_USER: The user submitting the monthly hiring posts.
+
     :type html: :class:`HTMLParser`
     :param html: An instance of `HTMLParser`.
 
@@ -44,6 +82,18 @@ class HackerNews:
         MAX_LIST_INDEX will result in hn view treating that index as an
         actual post id.
 
+    :type MAX_PREFETCH_COMMENTS: int (const)
+    :param MAX_PREFETCH_COMMENTS: The maximum number of listed items whose
+        comments are prefetched after a listing.
+
+    :type MAX_SKIPPED_IDS: int (const)
+    :param MAX_SKIPPED_IDS: The maximum number of skipped comment ids listed
+        once the deadline expires.
+
+    :type MAX_SUBMISSIONS_SCANNED: int (const)
+    :param MAX_SUBMISSIONS_SCANNED: The maximum number of a user's most
+        recent submissions scanned for stories or comments.
+
     :type MAX_SNIPPET_LENGTH: int (const)
     :param MAX_SNIPPET_LENGTH: The max length of a comment snippet shown
         when filtering comments.
@@ -51,23 +101,125 @@ class HackerNews:
     :type hacker_news_api: :class:`haxor.HackerNewsApi`
     :param hacker_news_api: An instance of `haxor.HackerNewsApi`.
 
+    :type comment_renderer: :class:`comment_renderer.CommentRenderer`
+    :param comment_renderer: Styles and wraps the html of comments.
+
+    :type fetch_stats: :class:`fetch_stats.FetchStats`
+    :param fetch_stats: The fetch counters and timings of this command.
+
+    :type item_fetcher: :class:`item_fetcher.ItemFetcher`
+    :param item_fetcher: An instance of `item_fetcher.ItemFetcher`.
+
+    :type item_flights: :class:`single_flight.SingleFlight`
+    :param item_flights: Coalesces concurrent fetches of the same item.
+
+    :type item_store: :class:`item_store.ItemStore`
+    :param item_store: The on-disk cache in front of `hacker_news_api`.
+
+    :type offline: bool
+    :param offline: Determines whether to serve everything from the item
+        store without any network access.
+
+    :type request_scheduler: :class:`request_scheduler.RequestScheduler`
+    :param request_scheduler: Rate limits and retries every API call.
+
     :type QUERY_UNSEEN: str (const)
     :param foo: the query to show unseen comments.
 
+    :type REPLIES_ALL: str (const)
+    :param REPLIES_ALL: Fetch and match every reply in a hiring or
+        freelance thread.
+
+    :type REPLIES_MATCHING: str (const)
+    :param REPLIES_MATCHING: Fetch and match only the top-level posts of a
+        hiring or freelance thread, then show the replies to matching posts.
+
+    :type REPLIES_NONE: str (const)
+    :param REPLIES_NONE: Fetch and match only the top-level posts of a
+        hiring or freelance thread.
+
+    :type SYNC_CHECKPOINT: str (const)
+    :param SYNC_CHECKPOINT: The item store metadata key of the last item id
+        mirrored by hn sync.
+
+    :type UPDATES_INTERVAL: int (const)
+    :param UPDATES_INTERVAL: The minimum time in seconds between two syncs
+        of the updates feed.
+
+    :type transport: :class:`transport.Transport`
+    :param transport: The pooled HTTP session shared by `hacker_news_api`
+        and `web_viewer`.
+
     :type web_viewer: :class:`web_viewer.WebViewer`
     :param web_viewer: An instance of `web_viewer.WebViewer`.
     """
 
     COMMENT_INDENT = "  "
     COMMENT_UNSEEN = " [!]"
+    FREELANCE_TITLE = "freelancer?"
+    HIRING_POSTS_SCANNED = 10
+    HIRING_TITLE = "who is hiring?"
+    HIRING_USER = "whoishiring"
     MAX_LIST_INDEX = 1000
+    MAX_PREFETCH_COMMENTS = 10
+    MAX_SKIPPED_IDS = 10
     MAX_SNIPPET_LENGTH = 60
+    MAX_SUBMISSIONS_SCANNED = 1000
     QUERY_UNSEEN = "\[!\]"
-
-    def __init__(self):
-        self.hacker_news_api = ImportHackerNews()
+    REPLIES_ALL = "all"
+    REPLIES_MATCHING = "matching"
+    REPLIES_NONE = "none"
+    SYNC_CHECKPOINT = "sync_checkpoint"
+    UPDATES_INTERVAL = 60
+
+    def __init__(self, offline: bool = False, deadline: float | None = None):
+        self.offline = offline
+        self.deadline = Deadline(deadline)
         self.config = Config()
-        self.web_viewer = WebViewer()
+        # Requests still in flight at the deadline are abandoned, keep them
+        # from outliving it by much.
+        timeout = self.config.timeout
+        if deadline is not None:
+            timeout = min(timeout, max(deadline, 0.1))
+        self.transport = Transport(
+            pool_size=self.config.pool_size,
+            timeout=timeout,
+            keep_alive=self.config.keep_alive,
+        )
+        self.hacker_news_api = ImportHackerNews()
+        self.hacker_news_api.session = self.transport.session
+        self.set_api_base_url(self.config.api_base_url)
+        self.web_viewer = WebViewer(self.transport)
+        self.fetch_stats = FetchStats()
+        self.request_scheduler = RequestScheduler(
+            requests_per_second=self.config.requests_per_second,
+            max_concurrency=self.config.max_workers,
+            max_retries=self.config.max_retries,
+            fetch_stats=self.fetch_stats,
+            deadline=self.deadline,
+        )
+        self.item_store = ItemStore(self.config.get_cache_path(ItemStore.DATABASE))
+        self.item_flights = SingleFlight()
+        self.comment_matchers: dict[str, CommentMatcher] = {}
+        self._updates_lock = threading.Lock()
+        self._updates_checked = False
+        self.item_fetcher = ItemFetcher(
+            self.get_item,
+            max_workers=self.config.max_workers,
+            deadline=self.deadline,
+        )
+
+    @cached_property
+    def comment_renderer(self) -> CommentRenderer:
+        """Create the comment renderer on first use, so the colors are only
+        loaded by commands that show comments.
+
+        Returns:
+            CommentRenderer: The comment renderer.
+        """
+        return CommentRenderer(
+            link_color=self.config.clr_link, italic_color=self.config.clr_tag
+        )
 
     def ask(self, limit: int):
         """Display Ask HN posts.
@@ -76,9 +228,7 @@ class HackerNews:
             limit (int): the number of items to show, optional, defaults to 10.
         """
 
-        self.print_items(
-            item_ids=self.hacker_news_api.ask_stories(limit),
-        )
+        self.print_stories("askstories", limit)
 
     def best(self, limit: int):
         """Display best posts.
@@ -87,10 +237,252 @@ class HackerNews:
             limit (int): the number of items to show, optional, defaults to 10.
         """
 
-        self.print_items(
-            item_ids=self.hacker_news_api.top_stories(limit),
+        self.print_stories("beststories", limit)
+
+    def set_api_base_url(self, base_url: str):
+        """Point `hacker_news_api` at the given API, such as a local server.
+
+        Args:
+            base_url (str): The API base url, such as
+                https://hacker-news.firebaseio.com/v0/.
+        """
+        base_url = base_url.rstrip("/") + "/"
+        self.hacker_news_api.base_url = base_url
+        self.hacker_news_api.item_url = urljoin(base_url, "item/")
+        self.hacker_news_api.user_url = urljoin(base_url, "user/")
+
+    def get_item(self, item_id: int) -> Item:
+        """Get the given item from the item store or Hacker News.
+
+        Concurrent calls for the same uncached item share one request.
+
+        Args:
+            item_id (int): The item's id.
+
+        Returns:
+            Item: The item.
+
+        Raises:
+            InvalidItemID: If the item does not exist, or is not cached
+                when offline.
+        """
+        self.sync_updates()
+        item = self.item_store.get_item(item_id, ignore_ttl=self.offline)
+        if item is not None:
+            self.fetch_stats.increment("item cache hits")
+            return item
+        if self.offline:
+            raise InvalidItemID
+        item, shared = self.item_flights.do(int(item_id), self.fetch_item, item_id)
+        if shared:
+            self.fetch_stats.increment("requests coalesced")
+        return item
+
+    def fetch_item(self, item_id: int) -> Item:
+        """Fetch the given item from Hacker News into the item store.
+
+        Args:
+            item_id (int): The item's id.
+
+        Returns:
+            Item: The item.
+
+        Raises:
+            InvalidItemID: If the item does not exist.
+        """
+        item = self.request_scheduler.call(self.hacker_news_api.get_item, item_id)
+        self.fetch_stats.increment("items fetched")
+        self.item_store.put_item(item)
+        return item
+
+    def get_json(self, url: str):
+        """Fetch the given Hacker News API url.
+
+        Args:
+            url (str): The url to fetch.
+
+        Returns:
+            The decoded json response.
+
+        Raises:
+            HTTPError: If the response is not 200 OK.
+        """
+        response = self.transport.get(url)
+        if response.status_code != requests.codes.ok:
+            raise HTTPError
+        return response.json()
+
+    def get_story_ids(self, page: str, limit: int) -> list[int] | None:
+        """Get the item ids of the given listing.
+
+        The ids are cached in the item store so the listing can be shown
+        again when offline.
+
+        Args:
+            page (str): The listing name, such as topstories.
+            limit (int): The number of item ids to return.
+
+        Returns:
+            list[int] | None: The item ids in rank order, or None if offline
+                and the listing was never fetched.
+
+        Raises:
+            HTTPError: If fetching the listing failed.
+        """
+        if self.offline:
+            item_ids = self.item_store.get_listing(page)
+            return item_ids[:limit] if item_ids is not None else None
+        url = urljoin(self.hacker_news_api.base_url, f"{page}.json")
+        item_ids = self.request_scheduler.call(self.get_json, url)
+        self.item_store.put_listing(page, item_ids)
+        return item_ids[:limit]
+
+    def get_user(self, user_id: str) -> User:
+        """Get the given user from the item store or Hacker News.
+
+        Args:
+            user_id (str): The user's id.
+
+        Returns:
+            User: The user.
+
+        Raises:
+            InvalidUserID: If the user does not exist, or is not cached
+                when offline.
+        """
+        self.sync_updates()
+        user = self.item_store.get_user(user_id, ignore_ttl=self.offline)
+        if user is not None:
+            self.fetch_stats.increment("user cache hits")
+            return user
+        if self.offline:
+            raise InvalidUserID
+        user = self.request_scheduler.call(self.hacker_news_api.get_user, user_id)
+        self.fetch_stats.increment("users fetched")
+        self.item_store.put_user(user)
+        return user
+
+    def sync(self, lookback: int | None = None):
+        """Mirror the most recent items into the item store.
+
+        Fetches every item from the last checkpoint, or from `lookback`
+        items below maxitem on the first run, up to maxitem.  The checkpoint
+        only advances past items that were fetched, so an interrupted or
+        partly failed sync resumes where it stopped.  Items the mirror cached
+        below the window are dropped to keep it bounded, other cached items
+        are kept.  Only the items fetched from the network are reported as
+        synced.
+
+        Args:
+            lookback (int, optional): The number of most recent item ids to
+                mirror. Defaults to the sync_lookback config.
+        """
+        if self.offline:
+            click.secho("hn sync needs network access.", fg="red")
+            return
+        if lookback is None:
+            lookback = self.config.sync_lookback
+        url = urljoin(self.hacker_news_api.base_url, "maxitem.json")
+        max_item_id = self.request_scheduler.call(self.get_json, url)
+        min_item_id = max(1, max_item_id - lookback + 1)
+        checkpoint = self.item_store.get_meta(self.SYNC_CHECKPOINT)
+        start = min_item_id
+        if checkpoint is not None:
+            start = max(start, int(checkpoint) + 1)
+        pruned = self.item_store.prune_mirrored_items(min_item_id)
+        click.secho(
+            f"Syncing items {start} to {max_item_id}...", fg=self.config.clr_general
+        )
+        synced = 0
+        failed = 0
+        last_item_id = start - 1
+        started_at = time.monotonic()
+        item_fetcher = ItemFetcher(
+            self.mirror_item,
+            max_workers=self.config.max_workers,
+            deadline=self.deadline,
+        )
+        try:
+            for item_id, future in item_fetcher.fetch_items(
+                range(start, max_item_id + 1)
+            ):
+                try:
+                    synced += future.result()
+                except InvalidItemID:
+                    # Ids of deleted items never resolve, do not retry them.
+                    pass
+                except RequestScheduler.TRANSIENT_ERRORS:
+                    failed += 1
+                if not failed:
+                    last_item_id = item_id
+        finally:
+            self.item_store.set_meta(self.SYNC_CHECKPOINT, str(last_item_id))
+        elapsed = time.monotonic() - started_at
+        rate = synced / elapsed if elapsed > 0 else 0.0
+        click.secho(
+            f"Synced {synced} items in {elapsed:.1f}s ({rate:.1f} items/sec), "
+            f"{failed} failed, {pruned} pruned.",
+            fg=self.config.clr_general,
         )
 
+    def mirror_item(self, item_id: int) -> bool:
+        """Fetch the given item into the item store for hn sync.
+
+        Only items that weren't cached are marked as mirrored, a stale item
+        cached otherwise is refreshed but kept out of the mirror.
+
+        Args:
+            item_id (int): The item's id.
+
+        Returns:
+            bool: True if the item was fetched, False if it was cached.
+
+        Raises:
+            InvalidItemID: If the item does not exist.
+        """
+        self.sync_updates()
+        if self.item_store.get_item(item_id) is not None:
+            return False
+        cached = self.item_store.get_item(item_id, ignore_ttl=True) is not None
+        item = self.request_scheduler.call(self.hacker_news_api.get_item, item_id)
+        self.fetch_stats.increment("items fetched")
+        self.item_store.put_item(item, mirrored=None if cached else True)
+        return True
+
+    def sync_updates(self):
+        """Invalidate the cached items and users that changed on Hacker News.
+
+        Runs at most once per command, before the first cache lookup, and
+        only if the updates feed was not synced within UPDATES_INTERVAL.
+        Listed entries are refetched before their ttl expires, the ttls
+        still bound how long every other entry is served.  A failed sync is
+        ignored, and so is an API without an updates feed.
+        """
+        with self._updates_lock:
+            if self._updates_checked:
+                return
+            self._updates_checked = True
+            if self.offline or not self.config.sync_updates:
+                return
+            base_url = getattr(self.hacker_news_api, "base_url", None)
+            if base_url is None or self.item_store.is_empty():
+                return
+            synced_at = self.item_store.updates_synced_at
+            if (
+                synced_at is not None
+                and time.time() - synced_at < self.UPDATES_INTERVAL
+            ):
+                return
+            url = urljoin(base_url, "updates.json")
+            try:
+                updates = self.request_scheduler.call(self.get_json, url)
+            except RequestScheduler.TRANSIENT_ERRORS:
+                return
+            self.item_store.apply_updates(
+                updates.get("items", []), updates.get("profiles", [])
+            )
+            self.fetch_stats.increment("updates synced")
+
     def headlines_message(self, message: str) -> str:
         """Create the "Fetching [message] Headlines..." string.
 
@@ -103,27 +495,111 @@ class HackerNews:
 
         return f"Fetching {message} Headlines..."
 
-    def hiring_and_freelance(self, regex_query: str, post_id: int):
+    def load_hiring_and_freelance_ids(self):
+        """Load the ids of the latest who's hiring and freelancer posts.
+
+        The posts are looked up among the recent submissions of HIRING_USER
+        once a month, see `config.Config.hiring_posts_expired`, and cached
+        in the state store.  When offline, or if the lookup fails, the cached
+        ids are used, then the default ids set during installation.
+        """
+        config = self.config
+        if self.offline or not config.hiring_posts_expired():
+            config.load_hiring_and_freelance_ids_from_cache_or_defaults()
+            return
+        config.hiring_checked = int(time.time())
+        try:
+            posts = self.find_hiring_and_freelance_posts()
+        except (InvalidUserID,) + RequestScheduler.TRANSIENT_ERRORS:
+            posts = {}
+        hiring = posts.get(self.HIRING_TITLE)
+        freelance = posts.get(self.FREELANCE_TITLE)
+        if hiring is not None and freelance is not None:
+            config.hiring_id = hiring.item_id
+            config.freelance_id = freelance.item_id
+            config.hiring_month = hiring.submission_time.strftime("%Y-%m")
+        else:
+            config.load_hiring_and_freelance_ids_from_cache_or_defaults()
+        config.save_cache()
+
+    def find_hiring_and_freelance_posts(self) -> dict[str, Item]:
+        """Find the latest who's hiring and freelancer posts.
+
+        Returns:
+            dict[str, Item]: The latest post by title, HIRING_TITLE or
+                FREELANCE_TITLE, for those found.
+
+        Raises:
+            InvalidUserID: If HIRING_USER does not exist.
+        """
+        user = self.get_user(self.HIRING_USER)
+        submitted = (user.submitted or [])[: self.HIRING_POSTS_SCANNED]
+        posts: dict[str, Item] = {}
+        for _, future in self.item_fetcher.fetch_items(submitted):
+            try:
+                item = future.result()
+            except (InvalidItemID,) + RequestScheduler.TRANSIENT_ERRORS:
+                continue
+            title = (item.title or "").lower().removeprefix("ask hn: ")
+            for prefix in (self.HIRING_TITLE, self.FREELANCE_TITLE):
+                if title.startswith(prefix):
+                    # Submissions are newest first.
+                    posts.setdefault(prefix, item)
+        return posts
+
+    def hiring_and_freelance(
+        self,
+        regex_query: str,
+        post_id: int,
+        replies: str = REPLIES_NONE,
+        reprint: bool = False,
+        job_filter: JobPostFilter | None = None,
+    ):
         """Display comments matching the monthly who is hiring post.
 
         Searches the monthly Hacker News who is hiring post for comments
-        matching the given regex_query.  Defaults to searching the latest
-        post based on your installed version of haxor-news.
+        matching the given regex_query.
+
+        Only the top-level posts are fetched and matched by default, replies
+        to job posts are rarely what you are looking for and make up most of
+        the thread.  Rerunning a query only fetches and matches the posts
+        added since its last run.
 
         Args:
             regex_query (str): The regex query to match.
-            post_id (int): the who is hiring post id.
-                Optional, defaults to the latest post based on your installed
-                version of haxor-news.
+            post_id (int): the who is hiring post id, see
+                `load_hiring_and_freelance_ids` for the latest post.
+            replies (str, optional): Which replies to show: REPLIES_NONE for
+                top-level posts only, REPLIES_MATCHING to also show the
+                replies to matching posts, or REPLIES_ALL to fetch and match
+                the whole thread.  Defaults to REPLIES_NONE.
+            reprint (bool, optional): Determines whether to also show the
+                top-level posts matched by earlier runs of the same query,
+                which are otherwise skipped.  Defaults to False.
+            job_filter (JobPostFilter, optional): The structured filters.
+                If any is set, the posts are looked up in the job post index
+                instead, and replies and reprint are ignored.
         """
 
         try:
-            item = self.hacker_news_api.get_item(post_id)
-            self.print_comments(item, regex_query, comments_hide_non_matching=True)
+            item = self.get_item(post_id)
+            if job_filter is not None and job_filter.is_set():
+                self.print_job_posts(item, regex_query, job_filter)
+            elif replies == self.REPLIES_ALL:
+                self.print_comments(item, regex_query, comments_hide_non_matching=True)
+            else:
+                self.print_top_level_comments(
+                    item,
+                    regex_query,
+                    expand_matching=replies == self.REPLIES_MATCHING,
+                    reprint=reprint,
+                )
             self.config.save_cache()
         except InvalidItemID:
             self.print_item_not_found(post_id)
-        except IOError:
+        except RequestScheduler.TRANSIENT_ERRORS:
+            self.print_item_fetch_failed(post_id)
+        except BrokenPipeError:
             sys.stderr.close()
 
     def jobs(self, limit):
@@ -132,9 +608,7 @@ class HackerNews:
         :type limit: int
         :param limit: the number of items to show, optional, defaults to 10.
         """
-        self.print_items(
-            item_ids=self.hacker_news_api.job_stories(limit),
-        )
+        self.print_stories("jobstories", limit)
 
     def new(self, limit):
         """Display the latest posts.
@@ -142,9 +616,56 @@ class HackerNews:
         :type limit: int
         :param limit: the number of items to show, optional, defaults to 10.
         """
-        self.print_items(
-            item_ids=self.hacker_news_api.new_stories(limit),
-        )
+        self.print_stories("newstories", limit)
+
+    def prefetch_comments(self, item_ids: Iterable[int]):
+        """Warm the item store with the comment trees of the given items.
+
+        Args:
+            item_ids (Iterable[int]): The ids of the items to prefetch.
+        """
+        for item_id in item_ids:
+            try:
+                item = self.get_item(item_id)
+            except (InvalidItemID,) + RequestScheduler.TRANSIENT_ERRORS:
+                continue
+            self.item_fetcher.fetch_comment_tree(item)
+
+    def start_comments_prefetch(self, item_ids: list[int]):
+        """Prefetch the comments of the first listed items in the background.
+
+        Does nothing unless prefetch_comments is set in ~/.haxornewsconfig.
+        The prefetch runs in a detached, low priority process so the current
+        command exits right away.
+
+        Args:
+            item_ids (list[int]): The ids of the listed items, in rank order.
+        """
+        num_items = min(self.config.prefetch_comments, self.MAX_PREFETCH_COMMENTS)
+        if self.offline or num_items <= 0 or not item_ids:
+            return
+        args = [sys.executable, "-m", "neo_haxor_news.prefetch"]
+        args += [str(item_id) for item_id in item_ids[:num_items]]
+        kwargs = {}
+        if platform.system() == "Windows":
+            kwargs["creationflags"] = (
+                subprocess.BELOW_NORMAL_PRIORITY_CLASS
+                | subprocess.CREATE_NEW_PROCESS_GROUP
+                | subprocess.DETACHED_PROCESS
+            )
+        else:
+            kwargs["start_new_session"] = True
+        try:
+            subprocess.Popen(
+                args,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **kwargs,
+            )
+        except OSError:
+            # Prefetching is best effort.
+            pass
 
     def print_comment(
         self,
@@ -152,7 +673,7 @@ class HackerNews:
         regex_query: str = "",
         comments_hide_non_matching: bool = False,
         depth: int = 0,
-    ):
+    ) -> bool:
         """Print the comments for the given item.
 
         :type item: :class:`haxor.Item`
@@ -167,18 +688,17 @@ class HackerNews:
 
         :type depth: int
         :param depth: The current recursion depth, used to indent the comment.
+
+        :rtype: bool
+        :return: True if the comment matched and was printed in full.
         """
         if item.text is None:
-            return
+            return False
         header_color = "yellow"
         header_color_highlight = "magenta"
         header_adornment = ""
-        if (
-            self.config.item_cache is not None
-            and str(item.item_id) not in self.config.item_cache
-        ):
+        if self.config.seen_ids.add(item.item_id):
             header_adornment = self.COMMENT_UNSEEN
-            self.config.item_cache.append(item.item_id)
         show_comment = True
         if regex_query is not None:
             if self.match_comment_unseen(
@@ -201,6 +721,7 @@ class HackerNews:
             if num_chars > self.MAX_SNIPPET_LENGTH:
                 num_chars = self.MAX_SNIPPET_LENGTH
             click.echo(formatted_comment[0:num_chars] + " [...]", color=True)
+        return show_comment
 
     def print_comments(
         self,
@@ -211,6 +732,14 @@ class HackerNews:
     ):
         """Recursively print comments and subcomments for the given item.
 
+        By default each comment is printed as soon as it and everything
+        printed before it have arrived, while the rest of the tree keeps
+        loading in the background.  With stream_comments disabled in
+        ~/.haxornewsconfig, the whole tree is fetched level by level first,
+        then printed depth first.  Once the deadline expires, only the
+        comments already fetched are printed, followed by a summary of the
+        skipped subtrees.
+
         :type item: :class:`haxor.Item`
         :param item: An instance of `haxor.Item`.
 
@@ -224,24 +753,371 @@ class HackerNews:
         :type depth: int
         :param depth: The current recursion depth, used to indent the comment.
         """
+        skipped_ids: list[int] = []
+        if self.config.stream_comments:
+            with self.item_fetcher.stream_comment_tree(item) as comment_stream:
+                num_printed = self.print_comment_tree(
+                    item,
+                    comment_stream,
+                    regex_query,
+                    comments_hide_non_matching,
+                    depth,
+                    skipped_ids,
+                )
+        else:
+            comment_tree = self.item_fetcher.fetch_comment_tree(item)
+            num_printed = self.print_comment_tree(
+                item,
+                comment_tree,
+                regex_query,
+                comments_hide_non_matching,
+                depth,
+                skipped_ids,
+            )
+        if skipped_ids:
+            self.print_skipped_comments(item, num_printed, skipped_ids)
+
+    def print_comment_tree(
+        self,
+        item: Item,
+        comment_tree: dict[int, Future] | CommentStream,
+        regex_query: str = "",
+        comments_hide_non_matching: bool = False,
+        depth: int = 0,
+        skipped_ids: list[int] | None = None,
+    ) -> int:
+        """Recursively print the given item and its already fetched comments.
+
+        Args:
+            item (Item): The item to print.
+            comment_tree (dict[int, Future] | CommentStream): The comment
+                fetches, keyed by id.
+            regex_query (str): The regex query to match.
+            comments_hide_non_matching (bool): Determines whether to hide
+                comments that don't match (False) or truncate them (True).
+            depth (int): The current recursion depth, used to indent the
+                comment.
+            skipped_ids (list[int], optional): Collects the ids of the
+                comments not fetched before the deadline expired.
+
+        Returns:
+            int: The number of comments printed below the item.
+        """
         self.print_comment(item, regex_query, comments_hide_non_matching, depth)
+        return self.print_replies(
+            item,
+            comment_tree,
+            regex_query,
+            comments_hide_non_matching,
+            depth,
+            skipped_ids,
+        )
+
+    def print_replies(
+        self,
+        item: Item,
+        comment_tree: dict[int, Future] | CommentStream,
+        regex_query: str = "",
+        comments_hide_non_matching: bool = False,
+        depth: int = 0,
+        skipped_ids: list[int] | None = None,
+    ) -> int:
+        """Recursively print the already fetched comments below the given item.
+
+        Args:
+            item (Item): The item whose replies to print.
+            comment_tree (dict[int, Future] | CommentStream): The comment
+                fetches, keyed by id.
+            regex_query (str): The regex query to match.
+            comments_hide_non_matching (bool): Determines whether to hide
+                comments that don't match (False) or truncate them (True).
+            depth (int): The item's depth, its replies are indented one
+                level deeper.
+            skipped_ids (list[int], optional): Collects the ids of the
+                comments not fetched before the deadline expired.
+
+        Returns:
+            int: The number of comments printed below the item.
+        """
         comment_ids = item.kids
         if not comment_ids:
-            return
+            return 0
+        num_printed = 0
         for comment_id in comment_ids:
+            future = self.wait_for_comment(comment_tree, comment_id)
+            if future is None:
+                if skipped_ids is not None:
+                    skipped_ids.append(comment_id)
+                continue
             try:
-                comment = self.hacker_news_api.get_item(comment_id)
-                depth += 1
-                self.print_comments(
-                    comment,
-                    regex_query=regex_query,
-                    comments_hide_non_matching=comments_hide_non_matching,
-                    depth=depth,
+                comment = future.result()
+            except InvalidItemID:
+                click.echo("")
+                self.print_item_not_found(comment_id)
+                continue
+            except RequestScheduler.TRANSIENT_ERRORS:
+                click.echo("")
+                self.print_item_fetch_failed(comment_id)
+                continue
+            self.fetch_stats.mark(FetchStats.TIME_TO_FIRST_COMMENT)
+            num_printed += 1 + self.print_comment_tree(
+                comment,
+                comment_tree,
+                regex_query=regex_query,
+                comments_hide_non_matching=comments_hide_non_matching,
+                depth=depth + 1,
+                skipped_ids=skipped_ids,
+            )
+        return num_printed
+
+    def print_top_level_comments(
+        self,
+        item: Item,
+        regex_query: str = "",
+        expand_matching: bool = False,
+        reprint: bool = False,
+    ):
+        """Print the top-level comments of the given item, without replies.
+
+        The item's direct kids are fetched concurrently and matched against
+        regex_query as they arrive in order, so a large thread costs one
+        fetch per top-level comment instead of one per reply.  Comments that
+        don't match are hidden.  Once the deadline expires, the remaining
+        comments are skipped and summarized.
+
+        The comments scanned and their match results are kept in the item
+        store per item and query, so a later run only fetches and matches
+        the comments posted since.  Earlier matches are not shown again
+        unless reprint is set, in which case they are read back from the
+        item store first.
+
+        Args:
+            item (Item): The item whose comments to print.
+            regex_query (str): The regex query to match.
+            expand_matching (bool, optional): Determines whether to also
+                fetch and print every reply to the matching comments.
+                Defaults to False.
+            reprint (bool, optional): Determines whether to also print the
+                matches found by earlier runs.  Defaults to False.
+        """
+        self.print_comment(item, regex_query, comments_hide_non_matching=True)
+        comment_ids = item.kids or []
+        query = regex_query or ""
+        scanned = self.item_store.get_thread_scan(item.item_id, query)
+        earlier_ids = [
+            comment_id for comment_id in comment_ids if scanned.get(comment_id)
+        ]
+        new_ids = [
+            comment_id for comment_id in comment_ids if comment_id not in scanned
+        ]
+        skipped_ids: list[int] = []
+        if reprint:
+            for comment_id in earlier_ids:
+                comment = self.item_store.get_item(comment_id, ignore_ttl=True)
+                try:
+                    if comment is None:
+                        comment = self.get_item(comment_id)
+                except InvalidItemID:
+                    click.echo("")
+                    self.print_item_not_found(comment_id)
+                    continue
+                except RequestScheduler.TRANSIENT_ERRORS:
+                    click.echo("")
+                    self.print_item_fetch_failed(comment_id)
+                    continue
+                self.print_top_level_comment(
+                    comment, regex_query, expand_matching, skipped_ids
                 )
-                depth -= 1
-            except (InvalidItemID, HTTPError):
+        matches = {}
+        num_fetched = 0
+        for comment_id, future in self.item_fetcher.fetch_items(new_ids):
+            num_fetched += 1
+            try:
+                comment = future.result()
+            except InvalidItemID:
+                # Not recorded, it may be fetched on a later run.
                 click.echo("")
                 self.print_item_not_found(comment_id)
+                continue
+            except RequestScheduler.TRANSIENT_ERRORS:
+                click.echo("")
+                self.print_item_fetch_failed(comment_id)
+                continue
+            self.fetch_stats.mark(FetchStats.TIME_TO_FIRST_COMMENT)
+            matches[comment_id] = self.print_top_level_comment(
+                comment, regex_query, expand_matching, skipped_ids
+            )
+        self.item_store.put_thread_scan(item.item_id, query, matches)
+        skipped_ids.extend(new_ids[num_fetched:])
+        if skipped_ids:
+            self.print_skipped_comments(
+                item, num_fetched, skipped_ids, num_comments=len(new_ids)
+            )
+        if scanned:
+            message = f"\n{len(new_ids)} new comments since the last run"
+            if earlier_ids and not reprint:
+                message += (
+                    f", {len(earlier_ids)} earlier matches not shown,"
+                    " use -p/--reprint to show them"
+                )
+            click.secho(message + ".", fg=self.config.clr_general)
+
+    def index_job_posts(self, item: Item) -> int:
+        """Parse and index the top-level posts of a hiring or freelance thread.
+
+        Only the posts missing from the index are fetched, concurrently and
+        within the deadline.  Posts that failed to fetch are left out, to
+        be retried next time.
+
+        Args:
+            item (Item): The hiring or freelance thread.
+
+        Returns:
+            int: The number of posts left unindexed.
+        """
+        indexed_ids = self.item_store.get_job_post_ids(item.item_id)
+        new_ids = [
+            comment_id
+            for comment_id in item.kids or []
+            if comment_id not in indexed_ids
+        ]
+        job_posts = []
+        num_failed = 0
+        num_fetched = 0
+        for comment_id, future in self.item_fetcher.fetch_items(new_ids):
+            num_fetched += 1
+            try:
+                job_posts.append(parse_job_post(future.result()))
+            except InvalidItemID:
+                job_posts.append(JobPost(comment_id))
+            except RequestScheduler.TRANSIENT_ERRORS:
+                num_failed += 1
+        self.item_store.put_job_posts(item.item_id, job_posts)
+        return num_failed + len(new_ids) - num_fetched
+
+    def print_job_posts(self, item: Item, regex_query: str, job_filter: JobPostFilter):
+        """Print the top-level posts of a thread matching the given filters.
+
+        The thread's posts are parsed into the job post index the first time
+        they are seen, after which filtering is a local query.
+
+        Args:
+            item (Item): The hiring or freelance thread.
+            regex_query (str): The regex query to match, on top of the
+                filters.
+            job_filter (JobPostFilter): The structured filters.
+        """
+        self.print_comment(item, regex_query, comments_hide_non_matching=True)
+        num_unindexed = self.index_job_posts(item)
+        matching_ids = self.item_store.find_job_posts(item.item_id, job_filter)
+        comment_ids = item.kids or []
+        for comment_id in comment_ids:
+            if comment_id not in matching_ids:
+                continue
+            comment = self.item_store.get_item(comment_id, ignore_ttl=True)
+            try:
+                if comment is None:
+                    comment = self.get_item(comment_id)
+            except (InvalidItemID,) + RequestScheduler.TRANSIENT_ERRORS:
+                continue
+            self.print_comment(
+                comment, regex_query, comments_hide_non_matching=True, depth=1
+            )
+        click.secho(
+            f"\n{len(matching_ids)} of {len(comment_ids)} posts match the filters.",
+            fg=self.config.clr_general,
+        )
+        if num_unindexed:
+            click.secho(
+                f"{num_unindexed} posts could not be fetched and were left out.",
+                fg="red",
+            )
+
+    def print_top_level_comment(
+        self,
+        comment: Item,
+        regex_query: str,
+        expand_matching: bool,
+        skipped_ids: list[int],
+    ) -> bool:
+        """Print a top-level comment, and its replies if it matches.
+
+        Args:
+            comment (Item): The top-level comment.
+            regex_query (str): The regex query to match.
+            expand_matching (bool): Determines whether to also fetch and
+                print every reply if the comment matches.
+            skipped_ids (list[int]): Collects the ids of the replies not
+                fetched before the deadline expired.
+
+        Returns:
+            bool: True if the comment matched.
+        """
+        matched = self.print_comment(
+            comment, regex_query, comments_hide_non_matching=True, depth=1
+        )
+        if matched and expand_matching and comment.kids:
+            with self.item_fetcher.stream_comment_tree(comment) as comment_stream:
+                self.print_replies(
+                    comment,
+                    comment_stream,
+                    regex_query=None,
+                    depth=1,
+                    skipped_ids=skipped_ids,
+                )
+        return matched
+
+    def wait_for_comment(
+        self, comment_tree: dict[int, Future] | CommentStream, comment_id: int
+    ) -> Future | None:
+        """Wait for the given comment's fetch until the deadline.
+
+        Args:
+            comment_tree (dict[int, Future] | CommentStream): The comment
+                fetches, keyed by id.
+            comment_id (int): The comment's id.
+
+        Returns:
+            Future | None: The completed fetch, or None if the deadline
+                expired first.
+        """
+        if self.deadline.expired() and comment_id not in comment_tree:
+            return None
+        future = comment_tree[comment_id]
+        if not wait([future], timeout=self.deadline.remaining()).done:
+            return None
+        return future
+
+    def print_skipped_comments(
+        self,
+        item: Item,
+        num_printed: int,
+        skipped_ids: list[int],
+        num_comments: int | None = None,
+    ):
+        """Print a summary of the comments skipped at the deadline.
+
+        Args:
+            item (Item): The item whose comments were printed.
+            num_printed (int): The number of comments printed.
+            skipped_ids (list[int]): The ids of the skipped subtrees.
+            num_comments (int, optional): The number of comments num_printed
+                is out of.  Defaults to all of the item's descendants.
+        """
+        if num_comments is None:
+            num_comments = item.descendants
+        listed_ids = ", ".join(
+            str(skipped_id) for skipped_id in skipped_ids[: self.MAX_SKIPPED_IDS]
+        )
+        if len(skipped_ids) > self.MAX_SKIPPED_IDS:
+            listed_ids += f" and {len(skipped_ids) - self.MAX_SKIPPED_IDS} more"
+        click.secho(
+            f"\nDeadline of {self.deadline.seconds:g}s reached, skipped "
+            f"{len(skipped_ids)} comment subtrees: {listed_ids}.",
+            fg="red",
+        )
+        if num_comments:
+            click.secho(f"Showed {num_printed} of {num_comments} comments.", fg="red")
 
     def format_comment(
         self, item: Item, depth: int, header_color: str, header_adornment: str
@@ -269,22 +1145,7 @@ class HackerNews:
             f"\n{indent}{item.by} - {str(pretty_date_time(item.submission_time))}{header_adornment}",
             fg=header_color,
         )
-        unescaped_text = unescape(item.text)
-        regex_paragraph = re.compile(r"<p>")
-        unescaped_text = regex_paragraph.sub(
-            click.style("\n\n" + indent), unescaped_text
-        )
-        regex_url = re.compile(r'(<a href=(".*") .*</a>)')
-        unescaped_text = regex_url.sub(
-            click.style(r"\2", fg=self.config.clr_link), unescaped_text
-        )
-        regex_tag = re.compile(r"(<(.*)>.*?<\/\2>)")
-        unescaped_text = regex_tag.sub(
-            click.style(r"\1", fg=self.config.clr_tag), unescaped_text
-        )
-        formatted_comment = click.wrap_text(
-            text=unescaped_text, initial_indent=indent, subsequent_indent=indent
-        )
+        formatted_comment = self.comment_renderer.render(item.text, indent)
         return formatted_heading, formatted_comment
 
     def format_index_title(self, index: int, title: str) -> str:
@@ -341,26 +1202,68 @@ class HackerNews:
         )
         return formatted_item
 
+    def print_fetch_stats(self):
+        """Print the fetch counters and timings to stderr."""
+        self.fetch_stats.counters.update(self.transport.stats())
+        click.secho(self.fetch_stats.report(), fg=self.config.clr_general, err=True)
+
+    def print_item_fetch_failed(self, item_id: int):
+        """Print a message the given item id could not be fetched.
+
+        Args:
+            item_id (int): The item's id.
+        """
+        click.secho(
+            f"Item with id {item_id} could not be fetched, try again later.",
+            fg="red",
+        )
+
     def print_item_not_found(self, item_id: int):
         """Print a message the given item id was not found.
 
         :type item_id: int
         :param item_id: The item's id.
         """
-        click.secho(f"Item with id {item_id} not found.", fg="red")
+        if self.offline:
+            click.secho(f"Item with id {item_id} is not cached [offline].", fg="red")
+        else:
+            click.secho(f"Item with id {item_id} not found.", fg="red")
+
+    def print_stories(self, page: str, limit: int):
+        """Print the items of the given listing.
+
+        Args:
+            page (str): The listing name, such as topstories.
+            limit (int): The number of items to show.
+        """
+        item_ids = self.get_story_ids(page, limit)
+        if item_ids is None:
+            click.secho(
+                f"No cached {page} listing, run this command online first.",
+                fg="red",
+            )
+            return
+        self.print_items(item_ids=item_ids)
 
     def print_items(self, item_ids: Iterable[Item]):
         """Print the items.
 
+        Items are fetched concurrently and printed in rank order as soon as
+        every item before them has arrived.  Items not fetched before the
+        deadline expires are skipped.
+
         :type item_ids: iterable
         :param item_ids: A collection of items to print.
                 Can be a list or dictionary.
         """
+        item_ids = list(item_ids)
         self.config.item_ids = []
         index = 1
-        for item_id in item_ids:
+        num_fetched = 0
+        for item_id, future in self.item_fetcher.fetch_items(item_ids):
+            num_fetched += 1
             try:
-                item = self.hacker_news_api.get_item(item_id)
+                item = future.result()
                 if item.title:
                     formatted_item = self.format_item(item, index)
                     self.config.item_ids.append(item.item_id)
@@ -368,9 +1271,19 @@ class HackerNews:
                     index += 1
             except InvalidItemID:
                 self.print_item_not_found(item_id)
+            except RequestScheduler.TRANSIENT_ERRORS:
+                self.print_item_fetch_failed(item_id)
+        num_skipped = len(item_ids) - num_fetched
+        if num_skipped:
+            click.secho(
+                f"Deadline of {self.deadline.seconds:g}s reached, skipped "
+                f"{num_skipped} items.",
+                fg="red",
+            )
         self.config.save_cache()
         if self.config.show_tip:
             click.secho(self.tip_view(str(index - 1)))
+        self.start_comments_prefetch(self.config.item_ids)
 
     def tip_view(self, max_index: str) -> str:
         """Create the tip about the view command.
@@ -415,6 +1328,9 @@ class HackerNews:
     def match_regex(self, item: Item, regex_query: str) -> bool:
         """Determine if there is a match with the given regex_query.
 
+        The query is compiled into a `CommentMatcher` the first time it is
+        used, see `CommentMatcher` for the boolean query syntax.
+
         :type item: :class:`haxor.Item`
         :param item: An instance of `haxor.Item`.
 
@@ -424,13 +1340,44 @@ class HackerNews:
         :rtype: bool
         :return: Specifies if there is a match found.
         """
-        match_time = re.search(regex_query, str(pretty_date_time(item.submission_time)))
-        match_user = re.search(regex_query, item.by)
-        match_text = re.search(regex_query, item.text)
-        if not match_text and not match_user and not match_time:
-            return False
-        else:
-            return True
+        comment_matcher = self.comment_matchers.get(regex_query)
+        if comment_matcher is None:
+            comment_matcher = CommentMatcher(regex_query)
+            self.comment_matchers[regex_query] = comment_matcher
+        return comment_matcher.match(item)
+
+    def search(self, query: str, limit: int):
+        """Search the cached stories and comments.
+
+        Matches are ranked and listed like a listing, so a matching story or
+        comment can be opened with hn view [index].
+
+        Args:
+            query (str): The words to look for.
+            limit (int): The maximum number of matches to show.
+        """
+        if not self.item_store.full_text_search:
+            click.secho("Search needs SQLite with FTS5 support.", fg="red")
+            return
+        items = self.item_store.search(query, limit)
+        if not items:
+            click.secho(f"No cached item matches {query}.", fg="red")
+            return
+        self.config.item_ids = []
+        for index, item in enumerate(items, start=1):
+            self.config.item_ids.append(item.item_id)
+            if item.title:
+                click.echo(self.format_item(item, index))
+                continue
+            formatted_heading, formatted_comment = self.format_comment(
+                item, depth=1, header_color="yellow", header_adornment=""
+            )
+            click.echo(self.format_index_title(index, "Comment"), nl=False)
+            click.echo(formatted_heading, color=True)
+            click.echo(formatted_comment, color=True)
+        self.config.save_cache()
+        if self.config.show_tip:
+            click.secho(self.tip_view(str(len(items))))
 
     def show(self, limit: int):
         """Display Show HN posts.
@@ -438,9 +1385,7 @@ class HackerNews:
         :type limit: int
         :param limit: the number of items to show, optional, defaults to 10.
         """
-        self.print_items(
-            item_ids=self.hacker_news_api.show_stories(limit),
-        )
+        self.print_stories("showstories", limit)
 
     def top(self, limit):
         """Display the top posts.
@@ -448,11 +1393,9 @@ class HackerNews:
         :type limit: int
         :param limit: the number of items to show, optional, defaults to 10.
         """
-        self.print_items(
-            item_ids=self.hacker_news_api.top_stories(limit),
-        )
+        self.print_stories("topstories", limit)
 
-    def user(self, user_id, submission_limit):
+    def user(self, user_id, submission_limit, comments=False):
         """Display basic user info and submitted posts.
 
         :type user_id: str.
@@ -461,19 +1404,89 @@ class HackerNews:
         :type submission_limit: int
         :param submission_limit: the number of submissions to show.
                 Optional, defaults to 10.
+
+        :type comments: bool
+        :param comments: Determines whether to show the user's comments
+                instead of their stories.
         """
         try:
-            user = self.hacker_news_api.get_user(user_id)
+            user = self.get_user(user_id)
             click.secho("\nUser Id: ", nl=False, fg=self.config.clr_general)
             click.secho(user_id, fg=self.config.clr_user)
             click.secho("Created: ", nl=False, fg=self.config.clr_general)
             click.secho(str(user.created), fg=self.config.clr_user)
             click.secho("Karma: ", nl=False, fg=self.config.clr_general)
             click.secho(str(user.karma), fg=self.config.clr_user)
-            self.print_items(user.submitted[0:submission_limit])
+            submissions = self.find_submissions(
+                user.submitted or [], submission_limit, comments
+            )
+            if comments:
+                self.config.item_ids = []
+                for index, comment in enumerate(submissions, start=1):
+                    self.config.item_ids.append(comment.item_id)
+                    click.secho(
+                        f"\n  {index}.", nl=False, fg=self.config.clr_view_index
+                    )
+                    self.print_comment(comment, regex_query=None, depth=1)
+                self.config.save_cache()
+                if self.config.show_tip:
+                    click.secho(self.tip_view(str(len(submissions))))
+            else:
+                self.print_items([story.item_id for story in submissions])
         except InvalidUserID:
             self.print_item_not_found(user_id)
 
+    def find_submissions(
+        self, submitted: list[int], limit: int, comments: bool = False
+    ) -> list[Item]:
+        """Find a user's most recent stories, or comments.
+
+        A user's submissions mix stories and comments, so they are fetched
+        concurrently in batches, newest first, until enough of the wanted
+        kind are found.  Fetched items land in the item store, making the
+        next scan of the same user cheap.
+
+        Args:
+            submitted (list[int]): The user's submission ids, newest first.
+            limit (int): The number of stories or comments to find.
+            comments (bool, optional): Determines whether to find comments
+                instead of stories. Defaults to False.
+
+        Returns:
+            list[Item]: Up to `limit` stories or comments, newest first.
+        """
+        found: list[Item] = []
+        if limit <= 0:
+            return found
+        submitted = submitted[: self.MAX_SUBMISSIONS_SCANNED]
+        batch_size = max(limit, self.item_fetcher.max_workers)
+        for start in range(0, len(submitted), batch_size):
+            batch = submitted[start : start + batch_size]
+            for _, future in self.item_fetcher.fetch_items(batch):
+                try:
+                    item = future.result()
+                except (InvalidItemID,) + RequestScheduler.TRANSIENT_ERRORS:
+                    continue
+                if self.is_comment(item) if comments else item.title:
+                    found.append(item)
+                    if len(found) == limit:
+                        # Closing the batch cancels its pending fetches.
+                        return found
+            if self.deadline.expired():
+                break
+        return found
+
+    def is_comment(self, item: Item) -> bool:
+        """Determine whether the given item is a live comment.
+
+        Args:
+            item (Item): The item.
+
+        Returns:
+            bool: True if the item is a comment that was not deleted.
+        """
+        return item.item_type == "comment" and not (item.deleted or item.dead)
+
     def view(
         self, index, comments_query, comments, comments_hide_non_matching, browser
     ):
@@ -512,15 +1525,25 @@ class HackerNews:
                 self.print_item_not_found(item_id)
                 return
         try:
-            item = self.hacker_news_api.get_item(item_id)
+            item = self.get_item(item_id)
         except InvalidItemID:
             self.print_item_not_found(self.config.item_ids[index - 1])
             return
+        except RequestScheduler.TRANSIENT_ERRORS:
+            self.print_item_fetch_failed(item_id)
+            return
         if not comments and item.url is None:
             click.secho(
                 "\nNo url associated with post.", nl=False, fg=self.config.clr_general
             )
             comments = True
+        elif not comments and not browser and self.offline:
+            click.secho(
+                "\nPost contents are not available offline.",
+                nl=False,
+                fg=self.config.clr_general,
+            )
+            comments = True
         if comments:
             comments_url = "https://news.ycombinator.com/item?id=" + str(item.item_id)
             click.secho(
@@ -536,7 +1559,7 @@ class HackerNews:
                         comments_hide_non_matching=comments_hide_non_matching,
                     )
                     click.echo("")
-                except IOError:
+                except BrokenPipeError:
                     sys.stderr.close()
                 self.config.save_cache()
         else:
@@ -566,7 +1589,7 @@ class HackerNews:
                         # Windows
                         contents = re.sub(r"[^\x00-\x7F]+", "", contents)
                         click.echo(contents)
-                    except IOError:
+                    except BrokenPipeError:
                         sys.stderr.close()
                 else:
                     click.echo_via_pager(contents)
@@ -1,27 +1,92 @@
 import click
 
 from neo_haxor_news.hacker_news import HackerNews
+from neo_haxor_news.job_post import TECH_NAMES, JobPostFilter, parse_salary
 
 
 pass_hacker_news = click.make_pass_decorator(HackerNews)
 
 
+def validate_salary(ctx, param, value):
+    """Parse a --min-salary value such as 150k.
+
+    :raises: :class:`click.BadParameter` if the value isn't a salary.
+    """
+    if value is None:
+        return None
+    try:
+        return parse_salary(value)
+    except ValueError:
+        raise click.BadParameter("expected an amount such as 150k or 150000")
+
+
+def job_post_filter_options(command):
+    """Add the structured job post filters to the given command."""
+    for option in reversed(
+        [
+            click.option("--remote", is_flag=True, help="Only remote posts."),
+            click.option("--visa", is_flag=True, help="Only posts sponsoring visas."),
+            click.option(
+                "--tech",
+                multiple=True,
+                type=click.Choice(TECH_NAMES, case_sensitive=False),
+                metavar="TECH",
+                help="Only posts mentioning this tech, can be repeated.",
+            ),
+            click.option(
+                "--min-salary",
+                callback=validate_salary,
+                help="Only posts whose salary range reaches this, such as 150k.",
+            ),
+            click.option("--location", help="Only posts whose location contains this."),
+        ]
+    ):
+        command = option(command)
+    return command
+
+
 class HackerNewsCli:
     """Encapsulate the Hacker News Command Line Interface."""
 
     @click.group()
+    @click.option("--stats", is_flag=True, help="Print fetch stats to stderr.")
+    @click.option(
+        "--offline", is_flag=True, help="Serve everything from the local cache."
+    )
+    @click.option(
+        "--deadline",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Stop waiting for fetches after SECONDS and show what arrived.",
+    )
     @click.pass_context
-    def cli(ctx):
+    def cli(ctx, stats, offline, deadline):
         """Main entry point for HackerNewsCli.
 
         :type ctx: :class:`click.core.Context`
         :param ctx: An instance of click.core.Context that stores an instance
             of `hacker_news.HackerNews`.
+
+        :type stats: bool
+        :param stats: Determines whether to print fetch counters and timings,
+            such as the time to first comment, once the command is done.
+
+        :type offline: bool
+        :param offline: Determines whether to serve listings, items and users
+            strictly from the local cache, without any network access.
+
+        :type deadline: float
+        :param deadline: The time in seconds after which the command stops
+            waiting for fetches, prints what has arrived and summarizes what
+            was skipped.
         """
         # Create a HackerNews object and remember it as the context object.
         # From this point onwards other commands can refer to it by using the
         # @pass_hacker_news decorator.
-        ctx.obj = HackerNews()
+        ctx.obj = HackerNews(offline=offline, deadline=deadline)
+        if stats:
+            ctx.call_on_close(ctx.obj.print_fetch_stats)
 
     @cli.command()
     @click.argument("limit", required=False, default=10)
@@ -64,14 +129,50 @@ class HackerNewsCli:
     @cli.command()
     @click.argument("regex_query", required=False)
     @click.option("-i", "--id_post", required=False, default=0)
+    @click.option(
+        "-r",
+        "--replies",
+        type=click.Choice(
+            [
+                HackerNews.REPLIES_NONE,
+                HackerNews.REPLIES_MATCHING,
+                HackerNews.REPLIES_ALL,
+            ]
+        ),
+        default=HackerNews.REPLIES_NONE,
+    )
+    @click.option("-p", "--reprint", is_flag=True)
+    @job_post_filter_options
     @pass_hacker_news
-    def freelance(hacker_news, regex_query, id_post):
+    def freelance(
+        hacker_news,
+        regex_query,
+        id_post,
+        replies,
+        reprint,
+        remote,
+        visa,
+        tech,
+        min_salary,
+        location,
+    ):
         """Display comments from the seeking freelancer posts.
 
         Searches the monthly Hacker News seeking freelancer post for comments
         matching the given regex_query.  Defaults to searching the latest
         post.
 
+        Only the top-level posts are fetched and searched, use --replies
+        matching to also show the replies to matching posts, or --replies all
+        to search every reply too.
+
+        Rerunning the same query only fetches and shows the posts added
+        since the last run, use --reprint to also show the earlier matches.
+
+        The --remote, --visa, --tech, --min-salary and --location filters
+        look posts up in a local index of their company, location, salary
+        and tech instead, which is built the first time a post is seen.
+
         You can search any post by providing a freelancer_post_id:
             Example: https://news.ycombinator.com/item?id=10492087
             freelancer_post_id = 10492087
@@ -81,6 +182,10 @@ class HackerNewsCli:
             hn freelance "Python"
             hn freelance "(?i)Python|JavaScript"  # (?i) case insensitive
             hn freelance "(?i)Python" -i 8394339  # search post 8394339
+            hn freelance "(?i)Python" -r matching  # show replies to matches
+            hn freelance "(?i)Python" -p  # also show earlier matches
+            hn freelance --remote --tech rust --min-salary 150k
+            hn freelance "(?i)python NOT by:whoishiring age:<1w"
             hn freelance "(?i)(Python|JavaScript).*(rockstar)" > rockstars.txt
 
         :type hacker_news: :class:`hacker_news.HackerNews`
@@ -93,23 +198,86 @@ class HackerNewsCli:
         :param id_post: The who is hiring post id.
                 Optional, defaults to the latest post based on your installed
                 version of haxor-news.
+
+        :type replies: str
+        :param replies: Which replies to fetch and show: none for top-level
+                posts only, matching for the replies to matching posts, or
+                all to search the whole thread.  Defaults to none.
+
+        :type reprint: bool
+        :param reprint: Determines whether to also show the matches found by
+                earlier runs of the same query.
+
+        :type remote: bool
+        :param remote: Only show posts offering remote work.
+
+        :type visa: bool
+        :param visa: Only show posts offering visa sponsorship.
+
+        :type tech: tuple
+        :param tech: Only show posts mentioning all of these tech keywords.
+
+        :type min_salary: int
+        :param min_salary: Only show posts whose salary range reaches this.
+
+        :type location: str
+        :param location: Only show posts whose location contains this.
         """
         if id_post == 0:
-            hacker_news.config.load_hiring_and_freelance_ids()
+            hacker_news.load_hiring_and_freelance_ids()
             id_post = hacker_news.config.freelance_id
-        hacker_news.hiring_and_freelance(regex_query, id_post)
+        job_filter = JobPostFilter(remote, visa, list(tech), min_salary, location)
+        hacker_news.hiring_and_freelance(
+            regex_query, id_post, replies, reprint, job_filter
+        )
 
     @cli.command()
     @click.argument("regex_query", required=False)
     @click.option("-i", "--id_post", required=False, default=0)
+    @click.option(
+        "-r",
+        "--replies",
+        type=click.Choice(
+            [
+                HackerNews.REPLIES_NONE,
+                HackerNews.REPLIES_MATCHING,
+                HackerNews.REPLIES_ALL,
+            ]
+        ),
+        default=HackerNews.REPLIES_NONE,
+    )
+    @click.option("-p", "--reprint", is_flag=True)
+    @job_post_filter_options
     @pass_hacker_news
-    def hiring(hacker_news, regex_query, id_post):
+    def hiring(
+        hacker_news,
+        regex_query,
+        id_post,
+        replies,
+        reprint,
+        remote,
+        visa,
+        tech,
+        min_salary,
+        location,
+    ):
         """Display comments from the who is hiring posts.
 
         Searches the monthly Hacker News who is hiring post for comments
         matching the given regex_query.  Defaults to searching the latest
         post.
 
+        Only the top-level posts are fetched and searched, use --replies
+        matching to also show the replies to matching posts, or --replies all
+        to search every reply too.
+
+        Rerunning the same query only fetches and shows the posts added
+        since the last run, use --reprint to also show the earlier matches.
+
+        The --remote, --visa, --tech, --min-salary and --location filters
+        look posts up in a local index of their company, location, salary
+        and tech instead, which is built the first time a post is seen.
+
         You can search any post by providing a who_is_hiring_post_id:
             Example: https://news.ycombinator.com/item?id=10492086
             who_is_hiring_post_id = 10492086
@@ -119,6 +287,10 @@ class HackerNewsCli:
             hn hiring "Python"
             hn hiring "(?i)Python|JavaScript"  # (?i) case insensitive
             hn hiring "(?i)Python|JavaScript" -i 8394339  # search post 8394339
+            hn hiring "(?i)Python" -r matching  # show replies to matches
+            hn hiring "(?i)Python" -p  # also show earlier matches
+            hn hiring --remote --tech rust --min-salary 150k
+            hn hiring "(?i)remote AND ((?i)python OR (?i)rust) NOT (?i)senior"
             hn hiring "(?i)(Python|JavaScript).*(rockstar)" > rockstars.txt
 
         :type hacker_news: :class:`hacker_news.HackerNews`
@@ -131,11 +303,38 @@ class HackerNewsCli:
         :param id_post: The who is hiring post id.
                 Optional, defaults to the latest post based on your installed
                 version of haxor-news.
+
+        :type replies: str
+        :param replies: Which replies to fetch and show: none for top-level
+                posts only, matching for the replies to matching posts, or
+                all to search the whole thread.  Defaults to none.
+
+        :type reprint: bool
+        :param reprint: Determines whether to also show the matches found by
+                earlier runs of the same query.
+
+        :type remote: bool
+        :param remote: Only show posts offering remote work.
+
+        :type visa: bool
+        :param visa: Only show posts offering visa sponsorship.
+
+        :type tech: tuple
+        :param tech: Only show posts mentioning all of these tech keywords.
+
+        :type min_salary: int
+        :param min_salary: Only show posts whose salary range reaches this.
+
+        :type location: str
+        :param location: Only show posts whose location contains this.
         """
         if id_post == 0:
-            hacker_news.config.load_hiring_and_freelance_ids()
+            hacker_news.load_hiring_and_freelance_ids()
             id_post = hacker_news.config.hiring_id
-        hacker_news.hiring_and_freelance(regex_query, id_post)
+        job_filter = JobPostFilter(remote, visa, list(tech), min_salary, location)
+        hacker_news.hiring_and_freelance(
+            regex_query, id_post, replies, reprint, job_filter
+        )
 
     @cli.command()
     @click.argument("limit", required=False, default=10)
@@ -175,6 +374,32 @@ class HackerNewsCli:
         """
         hacker_news.new(limit)
 
+    @cli.command()
+    @click.argument("query")
+    @click.option("-l", "--limit", required=False, default=10)
+    @pass_hacker_news
+    def search(hacker_news, query, limit):
+        """Search the titles, texts and comments of cached items.
+
+        Only items fetched before, for example by viewing them or with
+        hn sync, can be found.
+
+        Example(s):
+            hn search "rust compiler"
+            hn search postgres -l 20
+
+        :type hacker_news: :class:`hacker_news.HackerNews`
+        :param hacker_news: An instance of `hacker_news.HackerNews`.
+
+        :type query: str
+        :param query: the words to look for, every word must match.
+
+        :type limit: int
+        :param limit: specifies the number of matches to show.
+            Optional, defaults to 10.
+        """
+        hacker_news.search(query, limit)
+
     @cli.command()
     @click.argument("limit", required=False, default=10)
     @pass_hacker_news
@@ -213,16 +438,40 @@ class HackerNewsCli:
         """
         hacker_news.top(limit)
 
+    @cli.command()
+    @click.option("-l", "--lookback", required=False, default=None, type=int)
+    @pass_hacker_news
+    def sync(hacker_news, lookback):
+        """Mirror the most recent items into the local cache.
+
+        Resumes from the last synced item, so running it regularly keeps
+        the mirror current and makes later commands instant.
+
+        Example(s):
+            hn sync
+            hn sync -l 50000
+
+        :type hacker_news: :class:`hacker_news.HackerNews`
+        :param hacker_news: An instance of `hacker_news.HackerNews`.
+
+        :type lookback: int
+        :param lookback: specifies the number of most recent items to mirror.
+            Optional, defaults to the sync_lookback config.
+        """
+        hacker_news.sync(lookback)
+
     @cli.command()
     @click.argument("user_id")
     @click.option("-l", "--limit", required=False, default=10)
+    @click.option("-c", "--comments", is_flag=True)
     @pass_hacker_news
-    def user(hacker_news, user_id, limit):
+    def user(hacker_news, user_id, limit, comments):
         """Display basic user info and submitted posts.
 
         Example(s):
             hn user tptacek
             hn user patio11
+            hn user patio11 -c
 
         :type hacker_news: :class:`hacker_news.HackerNews`
         :param hacker_news: An instance of `hacker_news.HackerNews`.
@@ -233,8 +482,12 @@ class HackerNewsCli:
         :type limit: int
         :param limit: specifies the number of items to show.
             Optional, defaults to 10.
+
+        :type comments: bool
+        :param comments: Determines whether to show the user's latest
+            comments instead of their stories.
         """
-        hacker_news.user(user_id, limit)
+        hacker_news.user(user_id, limit, comments)
 
     @cli.command()
     @click.argument("index")
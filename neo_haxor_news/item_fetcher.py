@@ -0,0 +1,204 @@
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+from hackernews import Item
+
+from neo_haxor_news.deadline import Deadline
+
+
+class CommentStream:
+    """Fetch a comment tree in the background while it is being rendered.
+
+    Looking up a comment id returns its future, submitting the fetch first
+    if needed.  As soon as a comment arrives, fetches for its kids are
+    submitted too, so the rest of the tree keeps loading while earlier
+    comments are printed.
+
+    :type executor: :class:`concurrent.futures.ThreadPoolExecutor`
+    :param executor: The pool running the fetches.
+
+    :type fetch: callable
+    :param fetch: Fetches a single item given its id.
+    """
+
+    def __init__(self, fetch: Callable[[int], Item], executor: ThreadPoolExecutor):
+        self.fetch = fetch
+        self.executor = executor
+        self._closed = False
+        self._futures: dict[int, Future] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, comment_id: int) -> Future:
+        with self._lock:
+            future = self._futures.get(comment_id)
+            submitted = future is None
+            if submitted:
+                future = self.executor.submit(self.fetch, comment_id)
+                self._futures[comment_id] = future
+        if submitted:
+            # Registered outside the lock: the callback runs right away if
+            # the fetch is already done and looks up the kids in turn.
+            future.add_done_callback(self._prefetch_kids)
+        return future
+
+    def __contains__(self, comment_id: int) -> bool:
+        return comment_id in self._futures
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def close(self):
+        """Stop submitting fetches for newly arrived comments."""
+        self._closed = True
+
+    def _prefetch_kids(self, future: Future):
+        """Submit the fetches for the kids of a completed comment.
+
+        Args:
+            future (Future): The completed fetch.
+        """
+        if self._closed or future.cancelled() or future.exception() is not None:
+            return
+        for comment_id in future.result().kids or []:
+            try:
+                self[comment_id]
+            except RuntimeError:
+                # The executor was shut down while the stream was closing.
+                return
+
+
+class ItemFetcher:
+    """Fetch Hacker News items concurrently with a bounded thread pool.
+
+    :type DEFAULT_MAX_WORKERS: int (const)
+    :param DEFAULT_MAX_WORKERS: The default number of concurrent fetches.
+
+    :type deadline: :class:`deadline.Deadline`
+    :param deadline: Stops waiting for fetches once expired.  Fetches still
+        in flight are abandoned instead of waited for.
+
+    :type fetch: callable
+    :param fetch: Fetches a single item given its id.
+
+    :type max_workers: int
+    :param max_workers: The maximum number of concurrent fetches.
+    """
+
+    DEFAULT_MAX_WORKERS = 8
+
+    def __init__(
+        self,
+        fetch: Callable[[int], Item],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        deadline: Deadline | None = None,
+    ):
+        self.fetch = fetch
+        self.max_workers = max(1, max_workers)
+        self.deadline = deadline if deadline is not None else Deadline()
+
+    def fetch_items(self, item_ids: Iterable[int]) -> Iterator[tuple[int, Future]]:
+        """Fetch the given items concurrently, yielding them in order.
+
+        All fetches are submitted up front.  Each (item_id, future) pair is
+        yielded as soon as it and every item before it are done, so callers
+        can print the listing in rank order while later items are still
+        in flight.  Nothing more is yielded once the deadline expires.
+
+        Args:
+            item_ids (Iterable[int]): The ids of the items to fetch.
+
+        Yields:
+            tuple[int, Future]: The item id and its completed future.  Calling
+                `result()` returns the item or raises the fetch error.
+        """
+        item_ids = list(item_ids)
+        if not item_ids:
+            return
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(item_ids)))
+        try:
+            futures = [executor.submit(self.fetch, item_id) for item_id in item_ids]
+            for item_id, future in zip(item_ids, futures):
+                if not wait([future], timeout=self.deadline.remaining()).done:
+                    return
+                yield item_id, future
+        finally:
+            # Drop fetches nobody will read if the caller stopped early.
+            self._shutdown(executor)
+
+    def fetch_comment_tree(self, item: Item) -> dict[int, Future]:
+        """Fetch every comment below the given item, one level at a time.
+
+        All kids of a level are fetched concurrently before moving on to the
+        kids of the next level, so a thread costs one round trip per level
+        instead of one per comment.
+
+        Args:
+            item (Item): The item whose comments to fetch.
+
+        Returns:
+            dict[int, Future]: The completed future for each comment id.
+                Comments below a failed fetch, or not fetched before the
+                deadline expired, are not included.
+        """
+        comment_tree: dict[int, Future] = {}
+        level = list(item.kids or [])
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while level:
+                futures = {
+                    comment_id: executor.submit(self.fetch, comment_id)
+                    for comment_id in level
+                    if comment_id not in comment_tree
+                }
+                done, not_done = wait(
+                    futures.values(), timeout=self.deadline.remaining()
+                )
+                comment_tree.update(
+                    (comment_id, future)
+                    for comment_id, future in futures.items()
+                    if future in done
+                )
+                if not_done:
+                    break
+                level = []
+                for future in futures.values():
+                    if future.exception() is None:
+                        level.extend(future.result().kids or [])
+        finally:
+            self._shutdown(executor)
+        return comment_tree
+
+    @contextmanager
+    def stream_comment_tree(self, item: Item) -> Iterator[CommentStream]:
+        """Fetch the comments below the given item in the background.
+
+        Unlike `fetch_comment_tree`, this returns right away.  Rendering can
+        start with the first comment while the rest of the tree is fetched.
+        Pending fetches are cancelled when the context exits, and fetches in
+        flight are abandoned if the deadline expired.
+
+        Args:
+            item (Item): The item whose comments to fetch.
+
+        Yields:
+            CommentStream: The comment futures, keyed by comment id.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        comment_stream = CommentStream(self.fetch, executor)
+        try:
+            for comment_id in item.kids or []:
+                comment_stream[comment_id]
+            yield comment_stream
+        finally:
+            comment_stream.close()
+            self._shutdown(executor)
+
+    def _shutdown(self, executor: ThreadPoolExecutor):
+        """Cancel pending fetches, waiting for those in flight unless late.
+
+        Args:
+            executor (ThreadPoolExecutor): The pool to shut down.
+        """
+        executor.shutdown(wait=not self.deadline.expired(), cancel_futures=True)
@@ -0,0 +1,608 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from html import unescape
+from typing import TYPE_CHECKING
+
+from hackernews import Item, User
+
+if TYPE_CHECKING:
+    from neo_haxor_news.job_post import JobPost, JobPostFilter
+
+HTML_TAG = re.compile(r"<[^>]+>")
+
+
+def plain_text(html: str | None) -> str:
+    """Strip the markup from the given item text for indexing.
+
+    Args:
+        html (str | None): The item text, as html.
+
+    Returns:
+        str: The plain text.
+    """
+    if not html:
+        return ""
+    return unescape(HTML_TAG.sub(" ", html))
+
+
+def escape_like(text: str) -> str:
+    """Escape the wildcards of a LIKE pattern, to be used with ESCAPE '\\'.
+
+    Args:
+        text (str): The text to match literally.
+
+    Returns:
+        str: The text with backslashes, % and _ escaped.
+    """
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class ItemStore:
+    """Persist fetched items and users in a SQLite database.
+
+    Items are cached for a time that depends on their age: a fresh story
+    still gains comments and points every minute, while an item older than
+    a few days almost never changes.  Story titles and texts and comment
+    bodies are kept in a full-text index as items enter the cache.  Which
+    top-level comments of a thread matched a query is kept per thread and
+    query, so rescanning a thread only matches the comments posted since,
+    and hiring and freelance posts are indexed by their structured fields.
+    Items cached by hn sync are marked as mirrored, only those are pruned
+    once they fall out of the mirror's window.
+
+    :type DATABASE: str (const)
+    :param DATABASE: The database file name.
+
+    :type ITEM_TTLS: tuple (const)
+    :param ITEM_TTLS: (max item age, ttl) pairs in seconds, youngest first.
+
+    :type OLD_ITEM_TTL: int (const)
+    :param OLD_ITEM_TTL: The ttl in seconds for items older than the last
+        ITEM_TTLS age.
+
+    :type USER_TTL: int (const)
+    :param USER_TTL: The ttl in seconds for users.
+
+    :type updates_synced_at: float
+    :param updates_synced_at: The time the updates feed was last synced,
+        or None.
+
+    :type database_path: str
+    :param database_path: The path of the SQLite database.
+
+    :type full_text_search: bool
+    :param full_text_search: Determines whether the SQLite build supports
+        the FTS5 full-text index used by `search`.
+    """
+
+    DATABASE = "items.sqlite3"
+    ITEM_TTLS = (
+        (60 * 60, 2 * 60),
+        (24 * 60 * 60, 10 * 60),
+        (3 * 24 * 60 * 60, 60 * 60),
+    )
+    OLD_ITEM_TTL = 30 * 24 * 60 * 60
+    USER_TTL = 10 * 60
+
+    def __init__(self, database_path: str):
+        self.database_path = database_path
+        os.makedirs(os.path.dirname(database_path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            database_path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS items (
+                item_id INTEGER PRIMARY KEY,
+                data TEXT NOT NULL,
+                item_time REAL NOT NULL,
+                fetched_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS users (
+                user_id TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS listings (
+                page TEXT PRIMARY KEY,
+                item_ids TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS thread_scans (
+                thread_id INTEGER NOT NULL,
+                query TEXT NOT NULL,
+                comment_id INTEGER NOT NULL,
+                matched INTEGER NOT NULL,
+                PRIMARY KEY (thread_id, query, comment_id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS job_posts (
+                thread_id INTEGER NOT NULL,
+                comment_id INTEGER NOT NULL,
+                company TEXT,
+                location TEXT,
+                remote INTEGER NOT NULL,
+                onsite INTEGER NOT NULL,
+                visa INTEGER,
+                salary_min INTEGER,
+                salary_max INTEGER,
+                currency TEXT,
+                tech TEXT NOT NULL,
+                PRIMARY KEY (thread_id, comment_id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS mirrored_items (
+                item_id INTEGER PRIMARY KEY
+            );
+            """
+        )
+        self.full_text_search = self._create_search_index()
+        self.updates_synced_at = self._get_meta_float("updates_synced_at")
+
+    def _create_search_index(self) -> bool:
+        """Create the full-text index, indexing the items already cached.
+
+        Returns:
+            bool: False if the SQLite build lacks FTS5.
+        """
+        if self._has_search_index():
+            return True
+        try:
+            self._connection.execute(
+                "CREATE VIRTUAL TABLE items_fts USING fts5("
+                "title, text, tokenize = 'unicode61 remove_diacritics 2')"
+            )
+        except sqlite3.OperationalError:
+            # Either FTS5 is missing or another process just created it.
+            return self._has_search_index()
+        with self._transaction() as connection:
+            rows = connection.execute("SELECT item_id, data FROM items").fetchall()
+            connection.executemany(
+                "INSERT INTO items_fts (rowid, title, text) VALUES (?, ?, ?)",
+                (
+                    (item_id, data.get("title") or "", plain_text(data.get("text")))
+                    for item_id, data in (
+                        (item_id, json.loads(raw)) for item_id, raw in rows
+                    )
+                ),
+            )
+        return True
+
+    @contextmanager
+    def _transaction(self):
+        """Run the statements within the context in a single transaction."""
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def _has_search_index(self) -> bool:
+        """Determine whether the full-text index exists.
+
+        Returns:
+            bool: True if the index exists.
+        """
+        return (
+            self._connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'items_fts'"
+            ).fetchone()
+            is not None
+        )
+
+    def _get_meta_float(self, key: str) -> float | None:
+        """Get the given numeric metadata value.
+
+        Args:
+            key (str): The metadata key.
+
+        Returns:
+            float | None: The value, or None if unset.
+        """
+        value = self.get_meta(key)
+        return float(value) if value is not None else None
+
+    def get_meta(self, key: str) -> str | None:
+        """Get the given metadata value, such as a sync checkpoint.
+
+        Args:
+            key (str): The metadata key.
+
+        Returns:
+            str | None: The value, or None if unset.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def set_meta(self, key: str, value: str):
+        """Set the given metadata value.
+
+        Args:
+            key (str): The metadata key.
+            value (str): The value.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value)
+            )
+
+    def is_empty(self) -> bool:
+        """Determine whether no item or user is cached.
+
+        Returns:
+            bool: True if nothing is cached.
+        """
+        with self._lock:
+            return (
+                self._connection.execute("SELECT 1 FROM items LIMIT 1").fetchone()
+                is None
+                and self._connection.execute("SELECT 1 FROM users LIMIT 1").fetchone()
+                is None
+            )
+
+    def apply_updates(self, item_ids: list[int], user_ids: list[str]):
+        """Invalidate the given changed items and users, and record the sync.
+
+        Invalidated entries are kept for offline use but are refetched
+        when online.  The updates feed only lists a sample of the recent
+        changes, so it never extends the ttls.
+
+        Args:
+            item_ids (list[int]): The ids of the changed items.
+            user_ids (list[str]): The ids of the changed users.
+        """
+        self.updates_synced_at = time.time()
+        with self._transaction() as connection:
+            connection.executemany(
+                "UPDATE items SET fetched_at = 0 WHERE item_id = ?",
+                [(int(item_id),) for item_id in item_ids],
+            )
+            connection.executemany(
+                "UPDATE users SET fetched_at = 0 WHERE user_id = ?",
+                [(user_id,) for user_id in user_ids],
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                ("updates_synced_at", repr(self.updates_synced_at)),
+            )
+
+    def item_ttl(self, item_time: float, now: float) -> float:
+        """Get how long an item of the given age stays fresh.
+
+        Args:
+            item_time (float): The item's submission timestamp.
+            now (float): The current timestamp.
+
+        Returns:
+            float: The ttl in seconds.
+        """
+        age = now - item_time
+        for max_age, ttl in self.ITEM_TTLS:
+            if age < max_age:
+                return ttl
+        return self.OLD_ITEM_TTL
+
+    def get_item(self, item_id: int, ignore_ttl: bool = False) -> Item | None:
+        """Get the given item if it is cached and still fresh.
+
+        Args:
+            item_id (int): The item's id.
+            ignore_ttl (bool, optional): Determines whether to return the
+                item even if it is stale. Defaults to False.
+
+        Returns:
+            Item | None: The cached item, or None on a cache miss.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data, item_time, fetched_at FROM items WHERE item_id = ?",
+                (int(item_id),),
+            ).fetchone()
+        if row is None:
+            return None
+        data, item_time, fetched_at = row
+        now = time.time()
+        if not ignore_ttl and now - fetched_at > self.item_ttl(item_time, now):
+            return None
+        return Item(json.loads(data))
+
+    def put_item(self, item: Item, mirrored: bool | None = False):
+        """Cache the given item.
+
+        Items without their raw json, such as test doubles, are skipped.
+
+        Args:
+            item (Item): The item to cache.
+            mirrored (bool | None, optional): Determines whether the item is
+                cached by hn sync, and can be pruned with the mirror.  An item
+                cached otherwise is kept, even if it was mirrored before.  None
+                keeps the item's current mark, for refreshing it.  Defaults to
+                False.
+        """
+        raw = getattr(item, "raw", None)
+        if not isinstance(raw, str):
+            return
+        data = json.loads(raw)
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?)",
+                (item.item_id, raw, data.get("time", 0), time.time()),
+            )
+            if mirrored is not None:
+                connection.execute(
+                    "INSERT OR IGNORE INTO mirrored_items VALUES (?)"
+                    if mirrored
+                    else "DELETE FROM mirrored_items WHERE item_id = ?",
+                    (item.item_id,),
+                )
+            if self.full_text_search:
+                connection.execute(
+                    "DELETE FROM items_fts WHERE rowid = ?", (item.item_id,)
+                )
+                connection.execute(
+                    "INSERT INTO items_fts (rowid, title, text) VALUES (?, ?, ?)",
+                    (
+                        item.item_id,
+                        data.get("title") or "",
+                        plain_text(data.get("text")),
+                    ),
+                )
+
+    def search(self, query: str, limit: int = 10) -> list[Item]:
+        """Find the cached items matching every word of the given query.
+
+        Args:
+            query (str): The words to look for in titles, texts and comments.
+            limit (int, optional): The maximum number of items to return.
+                Defaults to 10.
+
+        Returns:
+            list[Item]: The matching items, best match first, ranked by bm25
+                with title matches weighing more.
+        """
+        terms = query.split()
+        if not terms or not self.full_text_search:
+            return []
+        # Quote each word so punctuation such as "c++" is not parsed as
+        # FTS5 query syntax.
+        match = " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+        with self._lock:
+            rows = self._connection.execute(
+                """
+                SELECT items.data FROM items_fts
+                JOIN items ON items.item_id = items_fts.rowid
+                WHERE items_fts MATCH ?
+                ORDER BY bm25(items_fts, 4.0, 1.0), items.item_id DESC
+                LIMIT ?
+                """,
+                (match, limit),
+            ).fetchall()
+        return [Item(json.loads(data)) for (data,) in rows]
+
+    def prune_mirrored_items(self, min_item_id: int) -> int:
+        """Drop the items cached by hn sync older than the given id.
+
+        Items cached otherwise, such as viewed threads, are kept.
+
+        Args:
+            min_item_id (int): The id of the oldest mirrored item to keep.
+
+        Returns:
+            int: The number of items dropped.
+        """
+        with self._transaction() as connection:
+            item_ids = [
+                (item_id,)
+                for (item_id,) in connection.execute(
+                    "SELECT item_id FROM mirrored_items WHERE item_id < ?",
+                    (int(min_item_id),),
+                )
+            ]
+            connection.executemany("DELETE FROM items WHERE item_id = ?", item_ids)
+            if self.full_text_search:
+                connection.executemany(
+                    "DELETE FROM items_fts WHERE rowid = ?", item_ids
+                )
+            connection.execute(
+                "DELETE FROM mirrored_items WHERE item_id < ?", (int(min_item_id),)
+            )
+        return len(item_ids)
+
+    def get_user(self, user_id: str, ignore_ttl: bool = False) -> User | None:
+        """Get the given user if it is cached and still fresh.
+
+        Args:
+            user_id (str): The user's id.
+            ignore_ttl (bool, optional): Determines whether to return the
+                user even if it is stale. Defaults to False.
+
+        Returns:
+            User | None: The cached user, or None on a cache miss.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data, fetched_at FROM users WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        data, fetched_at = row
+        now = time.time()
+        if not ignore_ttl and now - fetched_at > self.USER_TTL:
+            return None
+        return User(json.loads(data))
+
+    def put_user(self, user: User):
+        """Cache the given user.
+
+        Args:
+            user (User): The user to cache.
+        """
+        raw = getattr(user, "raw", None)
+        if not isinstance(raw, str):
+            return
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO users VALUES (?, ?, ?)",
+                (user.user_id, raw, time.time()),
+            )
+
+    def get_thread_scan(self, thread_id: int, query: str) -> dict[int, bool]:
+        """Get the top-level comments of a thread already matched to a query.
+
+        Args:
+            thread_id (int): The thread's item id.
+            query (str): The comment query.
+
+        Returns:
+            dict[int, bool]: Whether each scanned comment matched, by id.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT comment_id, matched FROM thread_scans "
+                "WHERE thread_id = ? AND query = ?",
+                (int(thread_id), query),
+            ).fetchall()
+        return {comment_id: bool(matched) for comment_id, matched in rows}
+
+    def put_thread_scan(self, thread_id: int, query: str, matches: dict[int, bool]):
+        """Record the top-level comments of a thread matched to a query.
+
+        Args:
+            thread_id (int): The thread's item id.
+            query (str): The comment query.
+            matches (dict[int, bool]): Whether each newly scanned comment
+                matched, by id.
+        """
+        with self._transaction() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO thread_scans VALUES (?, ?, ?, ?)",
+                [
+                    (int(thread_id), query, int(comment_id), int(matched))
+                    for comment_id, matched in matches.items()
+                ],
+            )
+
+    def get_job_post_ids(self, thread_id: int) -> set[int]:
+        """Get the ids of the indexed top-level posts of a thread.
+
+        Args:
+            thread_id (int): The hiring or freelance thread's item id.
+
+        Returns:
+            set[int]: The indexed post ids.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT comment_id FROM job_posts WHERE thread_id = ?",
+                (int(thread_id),),
+            ).fetchall()
+        return {comment_id for (comment_id,) in rows}
+
+    def put_job_posts(self, thread_id: int, job_posts: list["JobPost"]):
+        """Index the given top-level posts of a thread.
+
+        Args:
+            thread_id (int): The hiring or freelance thread's item id.
+            job_posts (list[JobPost]): The parsed posts.
+        """
+        with self._transaction() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO job_posts "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        int(thread_id),
+                        job_post.comment_id,
+                        job_post.company,
+                        job_post.location,
+                        int(job_post.remote),
+                        int(job_post.onsite),
+                        None if job_post.visa is None else int(job_post.visa),
+                        job_post.salary_min,
+                        job_post.salary_max,
+                        job_post.currency,
+                        # Padded so a keyword matches LIKE '% rust %' exactly.
+                        f" {' '.join(job_post.tech)} ",
+                    )
+                    for job_post in job_posts
+                ],
+            )
+
+    def find_job_posts(self, thread_id: int, job_filter: "JobPostFilter") -> set[int]:
+        """Find the indexed top-level posts of a thread matching the filter.
+
+        Args:
+            thread_id (int): The hiring or freelance thread's item id.
+            job_filter (JobPostFilter): The filters, all of which must match.
+
+        Returns:
+            set[int]: The matching post ids.
+        """
+        conditions = ["thread_id = ?"]
+        params: list = [int(thread_id)]
+        if job_filter.remote:
+            conditions.append("remote = 1")
+        if job_filter.visa:
+            conditions.append("visa = 1")
+        for tech in job_filter.tech:
+            conditions.append("tech LIKE ? ESCAPE '\\'")
+            params.append(f"% {escape_like(tech.lower())} %")
+        if job_filter.min_salary is not None:
+            conditions.append("salary_max >= ?")
+            params.append(job_filter.min_salary)
+        if job_filter.location:
+            conditions.append("location LIKE ? ESCAPE '\\'")
+            params.append(f"%{escape_like(job_filter.location)}%")
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT comment_id FROM job_posts WHERE " + " AND ".join(conditions),
+                params,
+            ).fetchall()
+        return {comment_id for (comment_id,) in rows}
+
+    def get_listing(self, page: str) -> list[int] | None:
+        """Get the item ids last fetched for the given listing.
+
+        Listings change constantly, so they are only read back when offline.
+
+        Args:
+            page (str): The listing name, such as topstories.
+
+        Returns:
+            list[int] | None: The item ids in rank order, or None if the
+                listing was never fetched.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT item_ids FROM listings WHERE page = ?", (page,)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def put_listing(self, page: str, item_ids: list[int]):
+        """Cache the item ids of the given listing.
+
+        Args:
+            page (str): The listing name, such as topstories.
+            item_ids (list[int]): The item ids in rank order.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO listings VALUES (?, ?, ?)",
+                (page, json.dumps(item_ids), time.time()),
+            )
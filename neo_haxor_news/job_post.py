@@ -0,0 +1,272 @@
+import re
+from dataclasses import dataclass, field
+
+from hackernews import Item
+
+from neo_haxor_news.item_store import plain_text
+
+FIRST_PARAGRAPH = re.compile(r"<p>", re.IGNORECASE)
+REMOTE = re.compile(r"\bremote\b", re.IGNORECASE)
+NOT_REMOTE = re.compile(r"\bno(?:t)?\s+remote\b", re.IGNORECASE)
+ONSITE = re.compile(r"\b(?:on-?site|in[- ]office|hybrid)\b", re.IGNORECASE)
+VISA = re.compile(r"\bvisas?\b", re.IGNORECASE)
+NO_VISA = re.compile(
+    r"\b(?:no\s+visas?|(?:can ?not|can't|unable to|won't|will not|do not|don't)"
+    r"\s+sponsor)\b",
+    re.IGNORECASE,
+)
+SALARY = re.compile(
+    r"(?P<currency>[$€£])\s?(?P<low>\d{1,3}(?:[,.]\d{3})*)\s?(?P<low_k>[kK])?"
+    r"(?:\s*(?:-|–|to)\s*[$€£]?\s?"
+    r"(?P<high>\d{1,3}(?:[,.]\d{3})*)\s?(?P<high_k>[kK])?)?"
+)
+HOURLY = re.compile(
+    r"\s*(?:/\s*h(?:ou)?r|per hour|an hour|/\s*day|per day)", re.IGNORECASE
+)
+SALARY_FILTER = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kK])?\s*$")
+LOCATION_HINT = re.compile(
+    r",|\b(?:USA?|UK|EU|Europe|NYC|SF|Bay Area|London|Berlin|Paris|Amsterdam"
+    r"|Toronto|Boston|Seattle|Austin|Chicago|Denver|Remote\s*\()",
+)
+NOT_LOCATION = re.compile(
+    r"https?://|@|\$|€|£|\b(?:full[- ]?time|part[- ]?time|contract|intern|visa)\b",
+    re.IGNORECASE,
+)
+TECH_KEYWORDS = {
+    "android": r"android",
+    "angular": r"angular(?:js)?",
+    "aws": r"aws",
+    "c#": r"c#",
+    "c++": r"c\+\+",
+    "clojure": r"clojure",
+    "django": r"django",
+    "elixir": r"elixir",
+    "erlang": r"erlang",
+    "gcp": r"gcp",
+    # "Go" is also a common word, only count it next to a list separator.
+    "go": r"golang|(?-i:Go)(?=\s*[,/|;)])|(?<=[,/|(;] )(?-i:Go)|(?<=[,/|(;])(?-i:Go)",
+    "graphql": r"graphql",
+    "haskell": r"haskell",
+    "ios": r"(?-i:iOS)",
+    "java": r"java(?!script)",
+    "javascript": r"javascript|js",
+    "kotlin": r"kotlin",
+    "kubernetes": r"kubernetes|k8s",
+    "llm": r"llms?",
+    "ml": r"(?-i:ML)|machine learning",
+    "node": r"node(?:\.?js)?",
+    "ocaml": r"ocaml",
+    "php": r"php",
+    "postgres": r"postgres(?:ql)?",
+    "python": r"python",
+    "rails": r"rails",
+    "react": r"(?-i:React)(?: native)?",
+    "ruby": r"ruby",
+    "rust": r"rust",
+    "scala": r"scala",
+    "swift": r"(?-i:Swift)",
+    "terraform": r"terraform",
+    "typescript": r"typescript|(?-i:TS)",
+    "vue": r"vue(?:\.?js)?",
+}
+TECH = re.compile(
+    "|".join(
+        rf"(?<![\w+#])(?P<t{index}>{pattern})(?![\w+#])"
+        for index, pattern in enumerate(TECH_KEYWORDS.values())
+    ),
+    re.IGNORECASE,
+)
+TECH_NAMES = list(TECH_KEYWORDS)
+
+
+@dataclass
+class JobPost:
+    """The structured fields of a top-level hiring or freelance post.
+
+    Posts conventionally start with a header line such as
+    "Company | Location | REMOTE | Full-time | $150k-$200k", which most
+    fields are parsed from.  Fields that can't be told apart are left
+    unset rather than guessed.
+
+    :type comment_id: int
+    :param comment_id: The post's item id.
+
+    :type company: str
+    :param company: The first field of the header, or None.
+
+    :type location: str
+    :param location: The first header field that looks like a place, or
+        None.
+
+    :type remote: bool
+    :param remote: Determines whether the header offers remote work.
+
+    :type onsite: bool
+    :param onsite: Determines whether the header mentions onsite, in-office
+        or hybrid work.
+
+    :type visa: bool
+    :param visa: True if the post offers visa sponsorship, False if it
+        rules it out, or None if it doesn't say.
+
+    :type salary_min: int
+    :param salary_min: The low end of the first salary range, or None.
+
+    :type salary_max: int
+    :param salary_max: The high end of the first salary range, or
+        `salary_min` for a single amount, or None.
+
+    :type currency: str
+    :param currency: The salary's currency symbol, or None.
+
+    :type tech: list
+    :param tech: The known tech keywords mentioned, see TECH_KEYWORDS.
+    """
+
+    comment_id: int
+    company: str | None = None
+    location: str | None = None
+    remote: bool = False
+    onsite: bool = False
+    visa: bool | None = None
+    salary_min: int | None = None
+    salary_max: int | None = None
+    currency: str | None = None
+    tech: list[str] = field(default_factory=list)
+
+
+@dataclass
+class JobPostFilter:
+    """The structured filters of hn hiring and hn freelance.
+
+    :type remote: bool
+    :param remote: Keep only posts offering remote work.
+
+    :type visa: bool
+    :param visa: Keep only posts offering visa sponsorship.
+
+    :type tech: list
+    :param tech: Keep only posts mentioning every one of these tech
+        keywords.
+
+    :type min_salary: int
+    :param min_salary: Keep only posts whose salary range reaches this
+        amount, in any currency.
+
+    :type location: str
+    :param location: Keep only posts whose location contains this text.
+    """
+
+    remote: bool = False
+    visa: bool = False
+    tech: list[str] = field(default_factory=list)
+    min_salary: int | None = None
+    location: str | None = None
+
+    def is_set(self) -> bool:
+        """Determine whether any filter is set.
+
+        Returns:
+            bool: True if at least one filter is set.
+        """
+        return bool(
+            self.remote
+            or self.visa
+            or self.tech
+            or self.min_salary is not None
+            or self.location
+        )
+
+
+def parse_salary(value: str) -> int:
+    """Parse a salary such as 150k or 150000.
+
+    Args:
+        value (str): The salary.
+
+    Returns:
+        int: The salary as a whole number.
+
+    Raises:
+        ValueError: If the value isn't a salary.
+    """
+    match = SALARY_FILTER.match(value)
+    if match is None:
+        raise ValueError(f"Invalid salary {value!r}")
+    number, thousands = match.groups()
+    return int(float(number) * (1000 if thousands else 1))
+
+
+def salary_amount(digits: str, thousands: str | None) -> int:
+    """Convert a salary amount from a post to a whole number.
+
+    Args:
+        digits (str): The digits, possibly with thousands separators.
+        thousands (str | None): The k suffix, if any.
+
+    Returns:
+        int: The amount, where small amounts such as 150 in "150-200k" are
+            read as thousands.
+    """
+    amount = int(re.sub(r"[,.]", "", digits))
+    if thousands or amount < 1000:
+        amount *= 1000
+    return amount
+
+
+def find_salary(text: str) -> re.Match | None:
+    """Find the first yearly salary in the given text.
+
+    Hourly and daily rates are skipped, they can't be compared to yearly
+    salaries.
+
+    Args:
+        text (str): The post's plain text.
+
+    Returns:
+        re.Match | None: The SALARY match, or None.
+    """
+    for match in SALARY.finditer(text):
+        if not HOURLY.match(text, match.end()):
+            return match
+    return None
+
+
+def parse_job_post(item: Item) -> JobPost:
+    """Parse the structured fields of a hiring or freelance post.
+
+    Args:
+        item (Item): The top-level post.
+
+    Returns:
+        JobPost: The parsed fields.
+    """
+    post = JobPost(comment_id=item.item_id)
+    if not item.text:
+        return post
+    header = plain_text(FIRST_PARAGRAPH.split(item.text, 1)[0]).strip()
+    text = plain_text(item.text)
+    fields = [value.strip() for value in header.split("|") if value.strip()]
+    if len(fields) > 1:
+        post.company = fields[0]
+        for value in fields[1:]:
+            if LOCATION_HINT.search(value) and not NOT_LOCATION.search(value):
+                post.location = value
+                break
+    post.remote = bool(REMOTE.search(header)) and not NOT_REMOTE.search(header)
+    post.onsite = bool(ONSITE.search(header))
+    if NO_VISA.search(text):
+        post.visa = False
+    elif VISA.search(text):
+        post.visa = True
+    match = find_salary(header) or find_salary(text)
+    if match is not None:
+        post.currency = match.group("currency")
+        post.salary_min = salary_amount(match.group("low"), match.group("low_k"))
+        post.salary_max = post.salary_min
+        if match.group("high"):
+            post.salary_max = salary_amount(match.group("high"), match.group("high_k"))
+    post.tech = sorted(
+        {TECH_NAMES[int(match.lastgroup[1:])] for match in TECH.finditer(text)}
+    )
+    return post
@@ -0,0 +1,29 @@
+import os
+import sys
+
+from neo_haxor_news.hacker_news import HackerNews
+
+
+def main(argv: list[str] | None = None):
+    """Prefetch the comment trees of the given item ids into the item store.
+
+    Started in the background by `HackerNews.start_comments_prefetch`.
+
+    Args:
+        argv (list[str] | None, optional): The item ids. Defaults to the
+            command line arguments.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if hasattr(os, "nice"):
+        os.nice(19)
+    hacker_news = HackerNews()
+    max_workers = max(1, hacker_news.config.max_workers // 2)
+    hacker_news.item_fetcher.max_workers = max_workers
+    hacker_news.request_scheduler.max_concurrency = max_workers
+    hacker_news.request_scheduler.concurrency_limit = float(max_workers)
+    hacker_news.prefetch_comments(int(item_id) for item_id in argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import random
+import threading
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from typing import TypeVar
+
+import requests
+from hackernews import HTTPError
+
+from neo_haxor_news.deadline import Deadline
+from neo_haxor_news.fetch_stats import FetchStats
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Limit the average rate of requests while allowing short bursts.
+
+    :type capacity: float
+    :param capacity: The maximum number of tokens, i.e. the burst size.
+
+    :type rate: float
+    :param rate: The number of tokens added per second.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, waiting until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class RequestScheduler:
+    """Rate limit, retry and adaptively bound concurrent API calls.
+
+    Every call takes a concurrency slot, and a token from a token bucket if
+    the request rate is capped.
+    Transient failures are retried with jittered exponential backoff.  The
+    number of slots follows AIMD: it grows by about one per round of
+    successful calls and halves on every failure, so the scheduler backs
+    off when error rates rise and recovers once they drop.
+
+    :type TRANSIENT_ERRORS: tuple (const)
+    :param TRANSIENT_ERRORS: The errors worth retrying.
+
+    :type backoff_base: float
+    :param backoff_base: The backoff ceiling in seconds for the first retry.
+
+    :type backoff_max: float
+    :param backoff_max: The maximum backoff in seconds.
+
+    :type concurrency_limit: float
+    :param concurrency_limit: The current number of concurrent calls allowed.
+
+    :type deadline: :class:`deadline.Deadline`
+    :param deadline: No retry is attempted that would end past it.
+
+    :type fetch_stats: :class:`fetch_stats.FetchStats`
+    :param fetch_stats: Counts retries and failures.
+
+    :type max_concurrency: int
+    :param max_concurrency: The upper bound of `concurrency_limit`.
+
+    :type max_retries: int
+    :param max_retries: The number of retries before giving up.
+
+    :type token_bucket: :class:`TokenBucket` or None
+    :param token_bucket: Limits the request rate, or None if it isn't capped.
+    """
+
+    TRANSIENT_ERRORS = (
+        HTTPError,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+    )
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        max_concurrency: int,
+        max_retries: int = 4,
+        backoff_base: float = 0.25,
+        backoff_max: float = 8.0,
+        fetch_stats: FetchStats | None = None,
+        deadline: Deadline | None = None,
+    ):
+        self.token_bucket = None
+        if requests_per_second > 0:
+            self.token_bucket = TokenBucket(
+                rate=requests_per_second, capacity=max(1.0, requests_per_second)
+            )
+        self.max_concurrency = max(1, max_concurrency)
+        self.concurrency_limit = float(self.max_concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.fetch_stats = fetch_stats if fetch_stats is not None else FetchStats()
+        self.deadline = deadline if deadline is not None else Deadline()
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def backoff(self, attempt: int) -> float:
+        """Get the time to wait before the given retry, with full jitter.
+
+        Args:
+            attempt (int): The 0-based retry number.
+
+        Returns:
+            float: The time to wait in seconds.
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Call the given function under the rate and concurrency limits.
+
+        Args:
+            func (Callable): The API call.
+            *args: Passed through to `func`.
+            **kwargs: Passed through to `func`.
+
+        Returns:
+            The result of `func`.
+
+        Raises:
+            The last transient error once retries are exhausted or the
+            deadline is too close, or any other error right away.
+        """
+        attempt = 0
+        while True:
+            if self.token_bucket is not None:
+                self.token_bucket.acquire()
+            try:
+                with self._slot():
+                    result = func(*args, **kwargs)
+            except self.TRANSIENT_ERRORS:
+                self._decrease()
+                backoff = self.backoff(attempt)
+                remaining = self.deadline.remaining()
+                if attempt >= self.max_retries or (
+                    remaining is not None and backoff >= remaining
+                ):
+                    self.fetch_stats.increment("requests failed")
+                    raise
+                self.fetch_stats.increment("requests retried")
+                time.sleep(backoff)
+                attempt += 1
+                continue
+            self._increase()
+            return result
+
+    @contextmanager
+    def _slot(self):
+        """Hold one of the concurrency slots while the call runs."""
+        with self._condition:
+            while self._in_flight >= int(self.concurrency_limit):
+                self._condition.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def _decrease(self):
+        """Halve the concurrency limit after a failure."""
+        with self._condition:
+            self.concurrency_limit = max(1.0, self.concurrency_limit / 2)
+
+    def _increase(self):
+        """Grow the concurrency limit by about one per round of successes."""
+        with self._condition:
+            self.concurrency_limit = min(
+                float(self.max_concurrency),
+                self.concurrency_limit + 1 / self.concurrency_limit,
+            )
+            self._condition.notify_all()
@@ -0,0 +1,259 @@
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+
+from neo_haxor_news.atomic_files import atomic_write
+
+Chunk = array | bytearray
+
+
+class SeenIds:
+    """A compact set of the ids of the comments the user has seen.
+
+    Ids are grouped into chunks of 65536 consecutive ids, like a roaring
+    bitmap: a chunk keeps the low 16 bits of its ids in a sorted array while
+    it holds at most ARRAY_MAX ids, then switches to a bitmap of 65536 bits.
+    A lookup is a dict lookup plus a bit test, or a bisect over at most
+    ARRAY_MAX entries, whatever the number of ids.  The comments of a thread
+    are close in id, so millions of seen ids take a few MiB in memory and
+    on disk, and nothing needs to be evicted.
+
+    :type ARRAY_MAX: int (const)
+    :param ARRAY_MAX: The maximum number of ids of an array chunk.
+
+    :type BITMAP_BYTES: int (const)
+    :param BITMAP_BYTES: The size of a bitmap chunk.
+
+    :type CHUNK_HEADER: :class:`struct.Struct` (const)
+    :param CHUNK_HEADER: The key, kind and number of ids of a saved chunk,
+        where the key is the chunk's ids shifted right by 16 bits.
+
+    :type KIND_ARRAY: int (const)
+    :param KIND_ARRAY: The kind of a saved array chunk.
+
+    :type KIND_BITMAP: int (const)
+    :param KIND_BITMAP: The kind of a saved bitmap chunk.
+
+    :type MAGIC: bytes (const)
+    :param MAGIC: The header of the saved set, which versions the format.
+
+    :type added: list
+    :param added: The ids added since the set was loaded or saved, in the
+        order they were added.
+
+    :type cleared: bool
+    :param cleared: Determines whether the set was cleared since it was
+        loaded or saved, before `added` were added.
+    """
+
+    ARRAY_MAX = 4096
+    BITMAP_BYTES = 8192
+    MAGIC = b"HNSEEN1\n"
+    CHUNK_HEADER = struct.Struct("<IBI")
+    KIND_ARRAY = 0
+    KIND_BITMAP = 1
+
+    def __init__(self, item_ids: Iterable[int] = ()):
+        self._chunks: dict[int, Chunk] = {}
+        self._length = 0
+        self.added: list[int] = []
+        self.cleared = False
+        self.update(item_ids)
+
+    def __contains__(self, item_id: object) -> bool:
+        try:
+            item_id = int(item_id)
+        except (TypeError, ValueError):
+            return False
+        chunk = self._chunks.get(item_id >> 16)
+        if chunk is None:
+            return False
+        low = item_id & 0xFFFF
+        if isinstance(chunk, bytearray):
+            return bool(chunk[low >> 3] & (1 << (low & 7)))
+        index = bisect_left(chunk, low)
+        return index < len(chunk) and chunk[index] == low
+
+    def __iter__(self) -> Iterator[int]:
+        for key in sorted(self._chunks):
+            chunk = self._chunks[key]
+            high = key << 16
+            if isinstance(chunk, bytearray):
+                for byte_index, byte in enumerate(chunk):
+                    if byte:
+                        for bit in range(8):
+                            if byte & (1 << bit):
+                                yield high | (byte_index << 3) | bit
+            else:
+                for low in chunk:
+                    yield high | low
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def dirty(self) -> bool:
+        """Determine whether the set changed since it was loaded or saved.
+
+        Returns:
+            bool: True if ids were added or removed.
+        """
+        return bool(self.added or self.cleared)
+
+    def add(self, item_id: int) -> bool:
+        """Add an id to the set.
+
+        Args:
+            item_id (int): The item id, as an int or a numeric str.
+
+        Returns:
+            bool: True if the id was not seen before.
+        """
+        item_id = int(item_id)
+        if item_id < 0:
+            raise ValueError(f"Invalid item id {item_id}")
+        key = item_id >> 16
+        low = item_id & 0xFFFF
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            self._chunks[key] = array("H", [low])
+        elif isinstance(chunk, bytearray):
+            bit = 1 << (low & 7)
+            if chunk[low >> 3] & bit:
+                return False
+            chunk[low >> 3] |= bit
+        else:
+            index = bisect_left(chunk, low)
+            if index < len(chunk) and chunk[index] == low:
+                return False
+            chunk.insert(index, low)
+            if len(chunk) > self.ARRAY_MAX:
+                self._chunks[key] = self._to_bitmap(chunk)
+        self._length += 1
+        self.added.append(item_id)
+        return True
+
+    def update(self, item_ids: Iterable[int]):
+        """Add ids to the set.
+
+        Args:
+            item_ids (Iterable[int]): The item ids.
+        """
+        for item_id in item_ids:
+            self.add(item_id)
+
+    def clear(self):
+        """Remove all ids from the set."""
+        if self._chunks:
+            self.cleared = True
+        self._chunks = {}
+        self._length = 0
+        self.added = []
+
+    def mark_saved(self):
+        """Forget the changes made since the set was loaded or saved."""
+        self.added = []
+        self.cleared = False
+
+    def _to_bitmap(self, chunk: array) -> bytearray:
+        """Convert an array chunk to a bitmap chunk.
+
+        Args:
+            chunk (array): The sorted low 16 bits of the chunk's ids.
+
+        Returns:
+            bytearray: The bitmap.
+        """
+        bitmap = bytearray(self.BITMAP_BYTES)
+        for low in chunk:
+            bitmap[low >> 3] |= 1 << (low & 7)
+        return bitmap
+
+    def to_bytes(self) -> bytes:
+        """Serialize the set.
+
+        Returns:
+            bytes: The MAGIC header, then for each chunk its CHUNK_HEADER
+                followed by its little-endian array or its bitmap.
+        """
+        parts = [self.MAGIC]
+        for key in sorted(self._chunks):
+            chunk = self._chunks[key]
+            if isinstance(chunk, bytearray):
+                count = sum(byte.bit_count() for byte in chunk)
+                parts.append(self.CHUNK_HEADER.pack(key, self.KIND_BITMAP, count))
+                parts.append(bytes(chunk))
+                continue
+            parts.append(self.CHUNK_HEADER.pack(key, self.KIND_ARRAY, len(chunk)))
+            if sys.byteorder == "big":
+                chunk = array("H", chunk)
+                chunk.byteswap()
+            parts.append(chunk.tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SeenIds":
+        """Deserialize a set serialized by `to_bytes`.
+
+        Args:
+            data (bytes): The serialized set.
+
+        Returns:
+            SeenIds: The set.
+
+        Raises:
+            ValueError: If the data is not a serialized set.
+        """
+        if not data.startswith(cls.MAGIC):
+            raise ValueError("Not a seen ids file")
+        seen_ids = cls()
+        offset = len(cls.MAGIC)
+        while offset < len(data):
+            try:
+                key, kind, count = cls.CHUNK_HEADER.unpack_from(data, offset)
+            except struct.error as error:
+                raise ValueError("Truncated seen ids file") from error
+            offset += cls.CHUNK_HEADER.size
+            size = cls.BITMAP_BYTES if kind == cls.KIND_BITMAP else 2 * count
+            payload = data[offset : offset + size]
+            if len(payload) != size or kind not in (cls.KIND_ARRAY, cls.KIND_BITMAP):
+                raise ValueError("Truncated seen ids file")
+            offset += size
+            if kind == cls.KIND_BITMAP:
+                seen_ids._chunks[key] = bytearray(payload)
+            else:
+                chunk = array("H")
+                chunk.frombytes(payload)
+                if sys.byteorder == "big":
+                    chunk.byteswap()
+                seen_ids._chunks[key] = chunk
+            seen_ids._length += count
+        return seen_ids
+
+    @classmethod
+    def load(cls, path: str) -> "SeenIds":
+        """Load the set saved at the given path.
+
+        Args:
+            path (str): The file path.
+
+        Returns:
+            SeenIds: The saved set, or an empty set if there is none or it
+                can't be read.
+        """
+        try:
+            with open(path, "rb") as seen_ids_file:
+                return cls.from_bytes(seen_ids_file.read())
+        except (OSError, ValueError):
+            return cls()
+
+    def save(self, path: str):
+        """Save the set to the given path.
+
+        Args:
+            path (str): The file path.
+        """
+        atomic_write(path, self.to_bytes())
+        self.mark_saved()
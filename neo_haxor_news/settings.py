@@ -1,3 +1,4 @@
-# Updated monthly, see HackerNewsCli.hiring docstring.
+# Used until the latest posts are looked up, see
+# HackerNews.load_hiring_and_freelance_ids.
 who_is_hiring_post_id: int = 42297424
 freelancer_post_id: int = 26661442
@@ -0,0 +1,57 @@
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Share one call between concurrent callers asking for the same key.
+
+    The first caller for a key runs the call; callers arriving while it is
+    in flight wait for and share its result or error.  Nothing is cached
+    once the call completes.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(
+        self, key: Hashable, func: Callable[..., T], *args, **kwargs
+    ) -> tuple[T, bool]:
+        """Run the given call, unless one for the same key is in flight.
+
+        Args:
+            key (Hashable): Identifies the call, such as an item id.
+            func (Callable): The call to run.
+            *args: Passed through to `func`.
+            **kwargs: Passed through to `func`.
+
+        Returns:
+            tuple[T, bool]: The result, and whether it was shared with an
+                in-flight call.
+
+        Raises:
+            The error raised by the call, for every caller sharing it.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            shared = future is not None
+            if not shared:
+                future = Future()
+                self._calls[key] = future
+        if shared:
+            return future.result(), True
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
@@ -0,0 +1,179 @@
+import json
+import os
+from functools import cached_property
+from typing import Any
+
+from neo_haxor_news.atomic_files import atomic_write, file_lock
+from neo_haxor_news.seen_ids import SeenIds
+
+
+def encode_record(record: dict[str, Any]) -> bytes:
+    """Encode a journal record as a line.
+
+    Args:
+        record (dict[str, Any]): The record.
+
+    Returns:
+        bytes: The compact JSON of the record, ending with a newline.
+    """
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def replay_journal(
+    lines: list[bytes], seen_ids: SeenIds | None, values: dict[str, Any]
+):
+    """Apply journal lines to the given seen ids and values.
+
+    Each line is a record with the optional keys clear_seen_ids, seen_ids
+    and set, applied in this order.  A line cut short by a crash, or that
+    can't be applied, is skipped.
+
+    Args:
+        lines (list[bytes]): The journal lines.
+        seen_ids (SeenIds | None): The seen ids, updated in place, or None to
+            only replay the values.
+        values (dict[str, Any]): The values by name, updated in place.
+    """
+    for line in lines:
+        try:
+            record = json.loads(line)
+            if seen_ids is not None:
+                if record.get("clear_seen_ids"):
+                    seen_ids.clear()
+                seen_ids.update(record.get("seen_ids", ()))
+            values.update(record.get("set", {}))
+        except (TypeError, ValueError, AttributeError):
+            continue
+    if seen_ids is not None:
+        seen_ids.mark_saved()
+
+
+class StateStore:
+    """Persist the state hn keeps between commands, apart from the settings.
+
+    Values such as the last listed item ids are kept in a JSON-lines
+    journal: each save appends a single line with only what changed since
+    the last save, and loading replays the lines in order.  Seen comment ids
+    are appended to the journal as they are seen, on top of a binary
+    `SeenIds` snapshot.  Once the journal grows past MAX_JOURNAL_BYTES it is
+    compacted: the seen ids are written to the snapshot, then the journal is
+    rewritten as one line holding the current values.  The values are
+    loaded up front, the seen ids only on first access.
+
+    Several hn processes can share the store.  Saves and compactions hold
+    an advisory lock on LOCK, and a compaction rebuilds the state from the
+    files rather than from memory, so the seen ids of every process are
+    merged and a value is only overwritten by a later change to it.  Both
+    files are replaced with atomic renames, snapshot first.  Loading takes
+    no lock: it reads the journal before the snapshot, and replaying a
+    journal over a newer snapshot gives the same state.
+
+    :type JOURNAL: str (const)
+    :param JOURNAL: The journal file name.
+
+    :type LOCK: str (const)
+    :param LOCK: The lock file name.
+
+    :type MAX_JOURNAL_BYTES: int (const)
+    :param MAX_JOURNAL_BYTES: The journal size that triggers a compaction.
+
+    :type SEEN_IDS: str (const)
+    :param SEEN_IDS: The seen ids snapshot file name.
+
+    :type seen_ids: :class:`seen_ids.SeenIds`
+    :param seen_ids: The ids of the comments the user has seen.
+
+    :type state_dir: str
+    :param state_dir: The directory of the journal and the snapshot.
+
+    :type values: dict
+    :param values: The saved values by name, as JSON types.
+    """
+
+    JOURNAL = "state.jsonl"
+    LOCK = "state.lock"
+    MAX_JOURNAL_BYTES = 256 * 1024
+    SEEN_IDS = "seen_ids"
+
+    def __init__(self, state_dir: str):
+        self.state_dir = state_dir
+        self.journal_path = os.path.join(state_dir, self.JOURNAL)
+        self.lock_path = os.path.join(state_dir, self.LOCK)
+        self.seen_ids_path = os.path.join(state_dir, self.SEEN_IDS)
+        self.values: dict[str, Any] = {}
+        replay_journal(self.read_journal(), None, self.values)
+
+    @cached_property
+    def seen_ids(self) -> SeenIds:
+        """Load the seen ids snapshot and replay the journal over it.
+
+        Returns:
+            SeenIds: The seen ids.
+        """
+        lines = self.read_journal()
+        seen_ids = SeenIds.load(self.seen_ids_path)
+        replay_journal(lines, seen_ids, {})
+        return seen_ids
+
+    def read_journal(self) -> list[bytes]:
+        """Read the journal lines.
+
+        Returns:
+            list[bytes]: The lines, or an empty list if there is no journal.
+        """
+        try:
+            with open(self.journal_path, "rb") as journal:
+                return journal.readlines()
+        except OSError:
+            return []
+
+    def save(self, values: dict[str, Any]):
+        """Save the given values and the changes to the seen ids.
+
+        Args:
+            values (dict[str, Any]): The values by name, as JSON types.
+        """
+        changed = {
+            name: value
+            for name, value in values.items()
+            if name not in self.values or self.values[name] != value
+        }
+        # Only save the seen ids if they were loaded.
+        seen_ids = self.__dict__.get("seen_ids", SeenIds())
+        record: dict[str, Any] = {}
+        if seen_ids.cleared:
+            record["clear_seen_ids"] = True
+        if seen_ids.added:
+            record["seen_ids"] = seen_ids.added
+        if changed:
+            record["set"] = changed
+        if not record:
+            return
+        line = encode_record(record)
+        with file_lock(self.lock_path):
+            with open(self.journal_path, "a+b") as journal:
+                size = journal.seek(0, os.SEEK_END)
+                if size:
+                    journal.seek(size - 1)
+                    if journal.read(1) != b"\n":
+                        # Don't extend a line cut short by a crash.
+                        line = b"\n" + line
+                journal.write(line)
+            if size + len(line) > self.MAX_JOURNAL_BYTES:
+                self._compact()
+        self.values.update(changed)
+        seen_ids.mark_saved()
+
+    def compact(self):
+        """Merge the journal into the seen ids snapshot and a single line
+        holding the current values."""
+        with file_lock(self.lock_path):
+            self._compact()
+
+    def _compact(self):
+        """Compact the files from their contents, holding the lock."""
+        seen_ids = SeenIds.load(self.seen_ids_path)
+        values: dict[str, Any] = {}
+        replay_journal(self.read_journal(), seen_ids, values)
+        atomic_write(self.seen_ids_path, seen_ids.to_bytes())
+        atomic_write(self.journal_path, encode_record({"set": values}))
@@ -0,0 +1,138 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """An `HTTPAdapter` that counts requests sent and connections opened.
+
+    :type connections_opened: int
+    :param connections_opened: The number of sockets connected, including
+        reconnects of pooled connections the server had closed.
+
+    :type requests_sent: int
+    :param requests_sent: The number of requests sent.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.connections_opened = 0
+        self.requests_sent = 0
+        self._lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: self._counting_pool_class(pool_class)
+            for scheme, pool_class in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+    def send(self, *args, **kwargs) -> requests.Response:
+        with self._lock:
+            self.requests_sent += 1
+        return super().send(*args, **kwargs)
+
+    def _count_connection(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    def _counting_pool_class(self, pool_class: type) -> type:
+        """Create a pool class whose connections report each connect.
+
+        Args:
+            pool_class (type): The urllib3 connection pool class to extend.
+
+        Returns:
+            type: The counting pool class.
+        """
+        count_connection = self._count_connection
+
+        class CountingConnection(pool_class.ConnectionCls):
+            def connect(self):
+                count_connection()
+                super().connect()
+
+        return type(
+            pool_class.__name__, (pool_class,), {"ConnectionCls": CountingConnection}
+        )
+
+
+class TimeoutSession(requests.Session):
+    """A `requests.Session` that applies a default timeout to every request.
+
+    The haxor client calls `session.get(url)` without a timeout, so the
+    default has to live on the session itself.
+
+    :type timeout: float
+    :param timeout: The connect and read timeout in seconds.
+    """
+
+    def __init__(self, timeout: float):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, *args, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(*args, **kwargs)
+
+
+class Transport:
+    """Share one pooled keep-alive HTTP session across all network I/O.
+
+    :type DEFAULT_POOL_SIZE: int (const)
+    :param DEFAULT_POOL_SIZE: The default number of connections kept per host.
+
+    :type DEFAULT_TIMEOUT: float (const)
+    :param DEFAULT_TIMEOUT: The default timeout in seconds.
+
+    :type adapter: :class:`CountingHTTPAdapter`
+    :param adapter: The adapter holding the connection pools.
+
+    :type session: :class:`TimeoutSession`
+    :param session: The session used for every request.
+    """
+
+    DEFAULT_POOL_SIZE = 10
+    DEFAULT_TIMEOUT = 10.0
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        keep_alive: bool = True,
+    ):
+        self.session = TimeoutSession(timeout)
+        self.adapter = CountingHTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request through the shared session.
+
+        Args:
+            url (str): The url to fetch.
+            **kwargs: Passed through to `requests.Session.get`.
+
+        Returns:
+            requests.Response: The response.
+        """
+        return self.session.get(url, **kwargs)
+
+    def stats(self) -> dict[str, int]:
+        """Count the requests sent and connections opened so far.
+
+        Returns:
+            dict[str, int]: The request, connection and reuse counts.
+        """
+        requests_sent = self.adapter.requests_sent
+        connections_opened = self.adapter.connections_opened
+        return {
+            "http requests": requests_sent,
+            "connections opened": connections_opened,
+            "connections reused": max(0, requests_sent - connections_opened),
+        }
@@ -7,9 +7,18 @@ import click
 from markdownify import markdownify as md
 import requests
 
+from neo_haxor_news.transport import Transport
+
 
 class WebViewer:
-    """Handle viewing of web content within the terminal."""
+    """Handle viewing of web content within the terminal.
+
+    :type transport: :class:`transport.Transport`
+    :param transport: The pooled HTTP session used to fetch pages.
+    """
+
+    def __init__(self, transport: Transport | None = None):
+        self.transport = transport if transport is not None else Transport()
 
     def format_markdown(self, text: str) -> str:
         """Add color to the input markdown using click.style.
@@ -61,8 +70,12 @@ class WebViewer:
             headers = {
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_10_1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/39.0.2171.95 Safari/537.36"
             }
-            raw_response = requests.get(url, headers=headers)
-        except (requests.exceptions.SSLError, requests.exceptions.ConnectionError) as e:
+            raw_response = self.transport.get(url, headers=headers)
+        except (
+            requests.exceptions.SSLError,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ) as e:
             contents = "Error: " + str(e) + "\n"
             contents += "Try running hn view # with the --browser/-b flag\n"
             return contents
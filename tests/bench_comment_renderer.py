@@ -0,0 +1,122 @@
+"""Compare the comment renderer with the regex based formatter it replaced.
+
+Renders a 2,000 comment synthetic thread, with paragraphs, links, emphasis,
+entities and code blocks, with both implementations:
+
+    $ python -m tests.bench_comment_renderer --comments 2000 --repeat 5
+"""
+
+import argparse
+import random
+import re
+import timeit
+from html import unescape
+
+import click
+
+from neo_haxor_news.comment_renderer import CommentRenderer
+from tests.hn_api_server import synthetic_thread
+
+WORDS = (
+    "the a we it is not that this with for on rust python thread model "
+    "latency cache server really think people work data code problem "
+    "because would could should users memory benchmark design"
+).split()
+
+
+def legacy_format_comment(
+    text: str, indent: str, link_color: str, tag_color: str
+) -> str:
+    """Format a comment the way `HackerNews.format_comment` used to."""
+    unescaped_text = unescape(text)
+    regex_paragraph = re.compile(r"<p>")
+    unescaped_text = regex_paragraph.sub(click.style("\n\n" + indent), unescaped_text)
+    regex_url = re.compile(r'(<a href=(".*") .*</a>)')
+    unescaped_text = regex_url.sub(click.style(r"\2", fg=link_color), unescaped_text)
+    regex_tag = re.compile(r"(<(.*)>.*?<\/\2>)")
+    unescaped_text = regex_tag.sub(click.style(r"\1", fg=tag_color), unescaped_text)
+    return click.wrap_text(
+        text=unescaped_text, initial_indent=indent, subsequent_indent=indent
+    )
+
+
+def comment_html(rng: random.Random) -> str:
+    """Generate the html of a comment shaped like the ones on the site.
+
+    Args:
+        rng (random.Random): The random generator.
+
+    Returns:
+        str: The comment's html.
+    """
+    paragraphs = []
+    for _ in range(rng.randint(1, 4)):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(10, 60))]
+        if rng.random() < 0.4:
+            words[rng.randrange(len(words))] = f"<i>{rng.choice(WORDS)}</i>"
+        if rng.random() < 0.3:
+            url = f"https:&#x2F;&#x2F;example.com&#x2F;{rng.choice(WORDS)}"
+            words.insert(
+                rng.randrange(len(words)),
+                f'<a href="{url}" rel="nofollow">{url}</a>',
+            )
+        if rng.random() < 0.2:
+            words.append("don&#x27;t &quot;quote&quot; &gt; me")
+        paragraphs.append(" ".join(words) + ".")
+    if rng.random() < 0.05:
+        paragraphs.append(
+            "<pre><code>  for item in items:\n      print(item &amp; 1)\n</code></pre>"
+        )
+    return "<p>".join(paragraphs)
+
+
+def fixture(comments: int, seed: int = 0) -> list[tuple[str, str]]:
+    """Generate the comments of a synthetic thread.
+
+    Args:
+        comments (int): The number of comments.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        list[tuple[str, str]]: The html and indent of each comment.
+    """
+    rng = random.Random(seed)
+    items, _ = synthetic_thread(comments=comments)
+    depths = {}
+    texts = []
+    for item in items.values():
+        depths[item["id"]] = depths.get(item.get("parent"), -1) + 1
+        if item["type"] == "comment":
+            texts.append((comment_html(rng), "  " * (depths[item["id"]] - 1)))
+    return texts
+
+
+def main(argv: list[str] | None = None):
+    """Time both implementations and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--comments", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    comments = fixture(args.comments)
+    renderer = CommentRenderer(link_color="blue", italic_color="cyan")
+
+    def render_legacy():
+        for text, indent in comments:
+            legacy_format_comment(text, indent, "blue", "cyan")
+
+    def render():
+        for text, indent in comments:
+            renderer.render(text, indent)
+
+    timings = {}
+    for name, function in (("legacy", render_legacy), ("renderer", render)):
+        timings[name] = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(
+            f"{name:>8}: {timings[name] * 1000:8.1f}ms for {len(comments)} comments, "
+            f"{timings[name] / len(comments) * 1e6:6.1f}us per comment"
+        )
+    print(f" speedup: {timings['legacy'] / timings['renderer']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Compare the eager config loading hn started with to the lazy one.
+
+Writes a ~/.haxornewsconfig with every setting and a state directory with
+a full cache of 20,000 seen comment ids, then times creating `HackerNews`,
+which creates its `Config`, and reading what a few commands need.  The
+baseline is a copy of the loader `Config` replaced, which parsed the same
+20,000 ids from an item_cache list in the settings file on every start:
+
+    $ python -m tests.bench_config_startup --seen 20000 --repeat 20
+"""
+
+import argparse
+import configparser
+import os
+import random
+import shutil
+import tempfile
+import timeit
+from collections.abc import Callable
+
+import click
+import mock
+from hackernews import HackerNews as ImportHackerNews
+
+from neo_haxor_news.config import Config
+from neo_haxor_news.hacker_news import HackerNews
+from neo_haxor_news.state_store import StateStore
+
+LEGACY_CONFIG = "legacy.haxornewsconfig"
+
+
+def write_fixture(home: str, seen: int, journal_ids: int = 500, seed: int = 0):
+    """Write the settings file and the state of a long time user, and the
+    same state in the settings file format of the baseline.
+
+    Args:
+        home (str): The home directory, which also holds the state.
+        seen (int): The number of seen comment ids.
+        journal_ids (int, optional): The number of seen comment ids appended
+            to the journal since it was last compacted. Defaults to 500.
+        seed (int, optional): The random seed. Defaults to 0.
+    """
+    rng = random.Random(seed)
+    config = Config()
+    config.save_settings()
+    state_store = StateStore(config.get_state_dir())
+    item_id = 40000000
+    item_cache = []
+    for _ in range(seen - journal_ids):
+        item_id += rng.randint(1, 30)
+        state_store.seen_ids.add(item_id)
+        item_cache.append(str(item_id))
+    item_ids = list(range(item_id, item_id + 30))
+    state_store.save({Config.CONFIG_IDS: item_ids})
+    state_store.compact()
+    for _ in range(journal_ids // 10):
+        for _ in range(10):
+            item_id += rng.randint(1, 30)
+            state_store.seen_ids.add(item_id)
+            item_cache.append(str(item_id))
+        state_store.save({})
+    parser = configparser.RawConfigParser()
+    parser.add_section(Config.CONFIG_SECTION)
+    for name, value in (
+        (Config.CONFIG_HIRING_ID, 0),
+        (Config.CONFIG_FREELANCE_ID, 0),
+        (Config.CONFIG_SHOW_TIP, True),
+        # The baseline failed to reload colors saved as None.
+        *((name, color or "none") for name, color in Config.COLOR_DEFAULTS.items()),
+        (Config.CONFIG_IDS, [str(item_id) for item_id in item_ids]),
+        ("item_cache", item_cache),
+    ):
+        parser.set(Config.CONFIG_SECTION, name, value)
+    with open(os.path.join(home, LEGACY_CONFIG), "w") as config_file:
+        parser.write(config_file)
+
+
+def legacy_load_config(path: str) -> dict:
+    """Load the settings file the way `Config` used to on every start.
+
+    Args:
+        path (str): The settings file path.
+
+    Returns:
+        dict: The settings by label.
+    """
+
+    def load_section_list(section: str) -> list[str]:
+        items_ids = parser.get(Config.CONFIG_SECTION, section).strip()
+        for exclude in ("[", "]", "'"):
+            items_ids = items_ids.replace(exclude, "")
+        return items_ids.split(", ")
+
+    parser = configparser.RawConfigParser()
+    with open(path) as config_file:
+        parser.read_file(config_file)
+    settings = {
+        Config.CONFIG_IDS: load_section_list(Config.CONFIG_IDS),
+        "item_cache": load_section_list("item_cache"),
+    }
+    for name, default in Config.COLOR_DEFAULTS.items():
+        try:
+            color = parser.get(Config.CONFIG_SECTION, name)
+            if color == "none":
+                color = None
+            click.style("", fg=color)
+        except (TypeError, configparser.NoOptionError):
+            color = default
+        settings[name] = color
+    settings[Config.CONFIG_SHOW_TIP] = parser.getboolean(
+        Config.CONFIG_SECTION, Config.CONFIG_SHOW_TIP
+    )
+    return settings
+
+
+def legacy_start(path: str):
+    """Start up the way `HackerNews` used to, loading every setting.
+
+    Args:
+        path (str): The settings file path.
+    """
+    ImportHackerNews()
+    legacy_load_config(path)
+
+
+def touch(names: tuple[str, ...]):
+    """Create `HackerNews` and read the given config attributes, loading
+    their sections.
+
+    Args:
+        names (tuple[str, ...]): The attribute names.
+    """
+    config = HackerNews().config
+    for name in names:
+        getattr(config, name)
+
+
+def main(argv: list[str] | None = None):
+    """Time each scenario and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seen", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+    home = tempfile.mkdtemp()
+    environ = {
+        "HOME": home,
+        "XDG_CACHE_HOME": os.path.join(home, "cache"),
+        "XDG_STATE_HOME": os.path.join(home, "state"),
+    }
+    colors = tuple(Config.COLOR_DEFAULTS)
+    legacy_path = os.path.join(home, LEGACY_CONFIG)
+    scenarios: dict[str, Callable[[], None]] = {
+        "baseline": lambda: legacy_start(legacy_path),
+        "all sections": lambda: touch(("seen_ids",) + Config.LAZY_STATE + colors),
+        "hn view": lambda: touch((Config.CONFIG_IDS,)),
+        "hn top": lambda: touch(colors),
+        "hn hiring": lambda: touch((Config.CONFIG_HIRING_ID,) + colors),
+        "hn view -c": lambda: touch(("seen_ids", Config.CONFIG_IDS) + colors),
+    }
+    try:
+        with mock.patch.dict(os.environ, environ):
+            write_fixture(home, args.seen)
+            timings = {}
+            for name, scenario in scenarios.items():
+                timings[name] = min(
+                    timeit.repeat(scenario, number=1, repeat=args.repeat)
+                )
+                print(
+                    f"{name:>12}: {timings[name] * 1000:6.2f}ms, "
+                    f"{timings['baseline'] / timings[name]:5.1f}x faster than "
+                    "the baseline"
+                )
+    finally:
+        shutil.rmtree(home)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,4 +18,4 @@ raw_comment = """I downvoted you, but I thought I&#x27;d explain why - I don&#x2
 
 formatted_heading = "\x1b[33m\n      foo - just now\x1b[0m"
 
-formatted_comment = """      I downvoted you, but I thought I\'d explain why - I don\'t think it\'s\n      reasonable to characterise this as childish.  Government surveillance is\n      something which our industry is the best positioned to speak out\n      against.  This type of thing seems to be clearly political speech, and\n      not a prank.\n\n    You may enjoy The Master Algorithm: <a\n      href="http://www.amazon.com/Master-\n    Algorithm-Ultimate-Learning-\n      Machine/dp/0465065708"\n    rel="nofollow">http://www.amazon.com/Master-\n      Algorithm-Ultimate-Learning-\n    Mac...</a>\n\n    There was a great\n      article called \x1b[36m<i>The Space Doctor\'s Big Idea</i>\x1b[0m There was a\n      great article called \x1b[36m<i>The Space Doctor\'s Big Idea</i>\x1b[0m.\n      What would a satisfactory "why" even look like exactly? As\n    in, what\n      form might it take compared to some other scientific discipline\n      where we \x1b[36m<i>do</i>\x1b[0m know what\'s going on?\n\n      \x1b[0mPersonally,\n      I think the whole\n    thing is a red herring -- people in the field have\n      \x1b[36m<i>some idea</i>\x1b[0m of how\n    neural nets work, and there are\n      many disciplines considered by many to be\n    mature sciences that are\n      far from settled on a grand theoretical\n    scale.\n\n      \x1b[0mThat\n      said..."""  # NOQA
+formatted_comment = """      I downvoted you, but I thought I'd explain why - I don't think it's\n      reasonable to characterise this as childish. Government surveillance is\n      something which our industry is the best positioned to speak out\n      against. This type of thing seems to be clearly political speech, and\n      not a prank. You may enjoy The Master Algorithm:\n      \x1b[32mhttp://www.amazon.com/Master-Algorithm-Ultimate-Learning-Machine/dp/0465065708\x1b[0m\n      There was a great article called \x1b[36mThe Space Doctor's Big Idea\x1b[0m There was a\n      great article called \x1b[36mThe Space Doctor's Big Idea\x1b[0m. What would a\n      satisfactory \"why\" even look like exactly? As in, what form might it\n      take compared to some other scientific discipline where we \x1b[36mdo\x1b[0m know\n      what's going on?\n\n      Personally, I think the whole thing is a red herring -- people in the\n      field have \x1b[36msome idea\x1b[0m of how neural nets work, and there are many\n      disciplines considered by many to be mature sciences that are far from\n      settled on a grand theoretical scale.\n\n      That said..."""  # NOQA
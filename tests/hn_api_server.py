@@ -0,0 +1,360 @@
+"""A local Hacker News API server with injectable latency and errors.
+
+Serves the Firebase JSON layout of the official API from fixtures or from
+generated synthetic threads, so fetch loops can be tested and benchmarked
+against real sockets without touching the network.
+
+Point hn at it with the api_base_url setting in ~/.haxornewsconfig:
+
+    $ python -m tests.hn_api_server --port 8000 --latency 0.05 --comments 2000
+    api_base_url = http://127.0.0.1:8000/v0/
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ITEM_PATH = re.compile(r"^/v0/item/(\d+)\.json$")
+USER_PATH = re.compile(r"^/v0/user/([^/]+)\.json$")
+ROOT_PATH = re.compile(r"^/v0/(\w+)\.json$")
+
+
+def synthetic_thread(
+    story_id: int = 1, comments: int = 200, fanout: int = 5, users: int = 20
+) -> tuple[dict[int, dict], dict[str, dict]]:
+    """Generate a story with a tree of comments, filled breadth first.
+
+    Args:
+        story_id (int, optional): The story's id, comments use the ids after
+            it. Defaults to 1.
+        comments (int, optional): The number of comments. Defaults to 200.
+        fanout (int, optional): The number of replies per comment.
+            Defaults to 5.
+        users (int, optional): The number of distinct authors. Defaults to 20.
+
+    Returns:
+        tuple[dict[int, dict], dict[str, dict]]: The items and users by id.
+    """
+    now = int(time.time())
+    items = {
+        story_id: {
+            "id": story_id,
+            "type": "story",
+            "by": "user0",
+            "time": now - 60 * 60,
+            "title": f"Synthetic story {story_id}",
+            "url": "https://example.com/",
+            "score": 100,
+            "descendants": comments,
+            "kids": [],
+        }
+    }
+    parents = [story_id]
+    for item_id in range(story_id + 1, story_id + comments + 1):
+        while len(items[parents[0]]["kids"]) >= fanout:
+            parents.pop(0)
+        parent_id = parents[0]
+        items[parent_id]["kids"].append(item_id)
+        items[item_id] = {
+            "id": item_id,
+            "type": "comment",
+            "by": f"user{item_id % users}",
+            "time": now - (story_id + comments - item_id),
+            "parent": parent_id,
+            "text": f"<p>Comment {item_id} replying to <i>{parent_id}</i>.",
+            "kids": [],
+        }
+        parents.append(item_id)
+    users_by_id = {
+        f"user{index}": {
+            "id": f"user{index}",
+            "created": now - 365 * 24 * 60 * 60,
+            "karma": index * 10,
+            "submitted": sorted(
+                (
+                    item_id
+                    for item_id, item in items.items()
+                    if item["by"] == f"user{index}"
+                ),
+                reverse=True,
+            ),
+        }
+        for index in range(users)
+    }
+    return items, users_by_id
+
+
+def load_fixture(path: str) -> tuple[dict[int, dict], dict[str, dict], dict]:
+    """Load items, users and listings from a json fixture.
+
+    The fixture holds {"items": [...], "users": [...], "listings": {...}},
+    with items and users in the API's json format.
+
+    Args:
+        path (str): The fixture path.
+
+    Returns:
+        tuple[dict[int, dict], dict[str, dict], dict]: The items and users
+            by id, and the listings by name.
+    """
+    with open(path) as fixture_file:
+        fixture = json.load(fixture_file)
+    items = {item["id"]: item for item in fixture.get("items", [])}
+    users = {user["id"]: user for user in fixture.get("users", [])}
+    return items, users, fixture.get("listings", {})
+
+
+class HackerNewsApiHandler(BaseHTTPRequestHandler):
+    """Serve one connection of `HackerNewsApiServer`, keeping it alive."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, keep Nagle's algorithm from
+    # adding a delayed ack round trip to every keep-alive response.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        with self.server.connection_slot():
+            delay = self.server.delay()
+            if delay:
+                time.sleep(delay)
+            if self.server.should_fail():
+                self.send_json(503, {"error": "injected failure"})
+                return
+            found, payload = self.server.resolve(self.path.split("?", 1)[0])
+            self.send_json(200 if found else 404, payload)
+
+    def send_json(self, status: int, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class HackerNewsApiServer(ThreadingHTTPServer):
+    """Serve the Hacker News API from memory, slowed down like the real one.
+
+    Missing items and users are served as null, like the Firebase API does.
+
+    :type errors_injected: int
+    :param errors_injected: The number of requests answered with a 503.
+
+    :type error_rate: float
+    :param error_rate: The probability of answering a request with a 503.
+
+    :type items: dict
+    :param items: The item json by id.
+
+    :type jitter: float
+    :param jitter: The maximum random deviation in seconds from `latency`.
+
+    :type latency: float
+    :param latency: The delay in seconds before answering each request.
+
+    :type listings: dict
+    :param listings: The story ids by listing name, such as topstories.
+
+    :type max_connections: int
+    :param max_connections: The number of connections served at once, or
+        None for no limit.  Further requests wait for a free slot.  An idle
+        keep-alive connection does not hold a slot, so pooled clients
+        cannot starve each other.
+
+    :type max_in_flight: int
+    :param max_in_flight: The highest number of requests served at once.
+
+    :type requests_served: int
+    :param requests_served: The number of requests received.
+
+    :type users: dict
+    :param users: The user json by id.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        items: dict[int, dict] | None = None,
+        users: dict[str, dict] | None = None,
+        listings: dict[str, list[int]] | None = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        max_connections: int | None = None,
+        port: int = 0,
+        seed: int | None = None,
+    ):
+        super().__init__(("127.0.0.1", port), HackerNewsApiHandler)
+        self.items = items or {}
+        self.users = users or {}
+        self.listings = listings or {}
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.max_connections = max_connections
+        self.requests_served = 0
+        self.errors_injected = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._connection_slots = (
+            threading.Semaphore(max_connections) if max_connections else None
+        )
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/v0/"
+
+    def delay(self) -> float:
+        """Count a request and draw the delay of its response.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        with self._lock:
+            self.requests_served += 1
+            if not self.jitter:
+                return self.latency
+            return max(0.0, self.latency + self._random.uniform(-1, 1) * self.jitter)
+
+    def should_fail(self) -> bool:
+        """Determine whether to inject a failure into the next response.
+
+        Returns:
+            bool: True to answer with a 503.
+        """
+        with self._lock:
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.errors_injected += 1
+                return True
+            return False
+
+    def resolve(self, path: str) -> tuple[bool, object]:
+        """Look up the json served at the given path.
+
+        Args:
+            path (str): The request path, such as /v0/item/1.json.
+
+        Returns:
+            tuple[bool, object]: Whether the path exists, and its json.
+        """
+        match = ITEM_PATH.match(path)
+        if match:
+            return True, self.items.get(int(match.group(1)))
+        match = USER_PATH.match(path)
+        if match:
+            return True, self.users.get(match.group(1))
+        match = ROOT_PATH.match(path)
+        if match is None:
+            return False, None
+        name = match.group(1)
+        if name == "maxitem":
+            return True, max(self.items, default=0)
+        if name == "updates":
+            return True, {"items": [], "profiles": []}
+        if name in self.listings:
+            return True, self.listings[name]
+        if name.endswith("stories"):
+            return True, sorted(
+                (
+                    item_id
+                    for item_id, item in self.items.items()
+                    if item.get("type") == "story"
+                ),
+                reverse=True,
+            )
+        return False, None
+
+    @contextmanager
+    def connection_slot(self):
+        """Hold one of the `max_connections` slots while serving a request."""
+        if self._connection_slots is not None:
+            self._connection_slots.acquire()
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            if self._connection_slots is not None:
+                self._connection_slots.release()
+
+    def start(self) -> "HackerNewsApiServer":
+        """Serve requests in a background thread.
+
+        Returns:
+            HackerNewsApiServer: The server itself.
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the listening socket."""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "HackerNewsApiServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv: list[str] | None = None):
+    """Run the server in the foreground until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--fixture", help="json fixture to serve")
+    parser.add_argument(
+        "--comments", type=int, default=200, help="comments in the synthetic thread"
+    )
+    parser.add_argument("--fanout", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-connections", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    listings = {}
+    if args.fixture:
+        items, users, listings = load_fixture(args.fixture)
+    else:
+        items, users = synthetic_thread(comments=args.comments, fanout=args.fanout)
+    server = HackerNewsApiServer(
+        items,
+        users,
+        listings,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        max_connections=args.max_connections,
+        port=args.port,
+        seed=args.seed,
+    )
+    print(f"Serving {len(items)} items at {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+
+class IsolatedHomeTestCase(unittest.TestCase):
+    """Run each test against a temporary home directory.
+
+    HOME, XDG_CACHE_HOME and XDG_STATE_HOME point into a fresh directory
+    before the test's own setUp goes on, so the `Config` and `HackerNews`
+    it creates never read or write the user's settings, item store or
+    state.  Subclasses call super().setUp() first.
+
+    :type temp_dir: str
+    :param temp_dir: The temporary home directory, removed after the test.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        environ = mock.patch.dict(
+            os.environ,
+            {
+                "HOME": self.temp_dir,
+                "XDG_CACHE_HOME": os.path.join(self.temp_dir, "cache"),
+                "XDG_STATE_HOME": os.path.join(self.temp_dir, "state"),
+            },
+        )
+        environ.start()
+        self.addCleanup(environ.stop)
@@ -4,6 +4,9 @@ from hackernews import InvalidItemID, InvalidUserID
 class MockItem:
     def __init__(self):
         self.item_id = None
+        self.item_type = None
+        self.deleted = None
+        self.dead = None
         self.by = None
         self.submission_time = None
         self.text = None
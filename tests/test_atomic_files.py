@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from neo_haxor_news.atomic_files import atomic_write, file_lock
+
+
+class AtomicFilesTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "state", "foo")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_atomic_write(self):
+        atomic_write(self.path, b"foo")
+        atomic_write(self.path, b"bar")
+        with open(self.path, "rb") as written:
+            assert written.read() == b"bar"
+        assert os.listdir(os.path.dirname(self.path)) == ["foo"]
+
+    @mock.patch("neo_haxor_news.atomic_files.os.replace")
+    def test_atomic_write_failure_keeps_file(self, mock_replace):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as original:
+            original.write(b"foo")
+        mock_replace.side_effect = OSError
+        with self.assertRaises(OSError):
+            atomic_write(self.path, b"bar")
+        with open(self.path, "rb") as original:
+            assert original.read() == b"foo"
+        assert os.listdir(os.path.dirname(self.path)) == ["foo"]
+
+    def test_file_lock_excludes_other_processes(self):
+        lock_path = self.path + ".lock"
+        counter_path = self.path + ".count"
+        atomic_write(counter_path, b"0")
+        pids = []
+        for _ in range(4):
+            pid = os.fork()
+            if pid == 0:
+                status = 1
+                try:
+                    for _ in range(50):
+                        with file_lock(lock_path):
+                            with open(counter_path, "rb") as counter:
+                                count = int(counter.read())
+                            atomic_write(counter_path, str(count + 1).encode())
+                    status = 0
+                finally:
+                    os._exit(status)
+            pids.append(pid)
+        for pid in pids:
+            assert os.waitpid(pid, 0)[1] == 0
+        with open(counter_path, "rb") as counter:
+            assert int(counter.read()) == 200
@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+
+import mock
+
+from neo_haxor_news.comment_matcher import CommentMatcher
+from neo_haxor_news.hacker_news import HackerNews
+from tests.isolated_home import IsolatedHomeTestCase
+from tests.mock_hacker_news_api import MockItem
+
+
+class CommentMatcherTest(IsolatedHomeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.now = datetime(2024, 1, 1, 12)
+
+    def comment(self, text, by="foo", age=timedelta(minutes=5)):
+        item = MockItem()
+        item.by = by
+        item.text = text
+        item.submission_time = self.now - age
+        return item
+
+    def match(self, query, item):
+        return CommentMatcher(query, now=self.now).match(item)
+
+    def test_single_regex(self):
+        item = self.comment("<p>Python developer, REMOTE ok")
+        assert self.match("(?i)(python|javascript).*(remote)", item)
+        assert not self.match("(?i)rockstar", item)
+        assert self.match("", item)
+        assert not CommentMatcher("(?i)(Node|JavaScript).*(remote)").is_boolean
+
+    def test_single_regex_matches_author_and_time(self):
+        item = self.comment("text", by="pg", age=timedelta(hours=3))
+        assert self.match("^pg$", item)
+        with mock.patch(
+            "neo_haxor_news.comment_matcher.pretty_date_time",
+            return_value="3 hours ago",
+        ) as mock_pretty_date_time:
+            assert self.match("hours ago", item)
+            assert mock_pretty_date_time.call_count == 1
+            assert self.match("text", item)
+            assert mock_pretty_date_time.call_count == 1
+
+    def test_spaces_in_plain_regex(self):
+        item = self.comment("Senior Engineer wanted")
+        assert self.match("Senior Engineer", item)
+        assert not self.match("Engineer Senior", item)
+
+    def test_boolean_operators(self):
+        query = "(?i)remote AND ((?i)python OR (?i)rust) NOT (?i)senior"
+        assert CommentMatcher(query).is_boolean
+        assert self.match(query, self.comment("Remote, Python"))
+        assert self.match(query, self.comment("REMOTE | Rust"))
+        assert not self.match(query, self.comment("Remote | Go"))
+        assert not self.match(query, self.comment("Remote | Rust | Senior"))
+        assert not self.match(query, self.comment("Onsite | Rust"))
+
+    def test_implicit_and_and_precedence(self):
+        assert self.match("remote python OR rust", self.comment("rust"))
+        assert self.match("remote python OR rust", self.comment("remote python"))
+        assert not self.match("remote python OR rust", self.comment("remote go"))
+        assert not self.match("NOT remote OR NOT python", self.comment("remote python"))
+
+    def test_field_scopes(self):
+        item = self.comment("hiring at example", by="whoishiring")
+        assert self.match("by:^whoishiring$", item)
+        assert not self.match("text:whoishiring", item)
+        assert self.match("text:example NOT by:pg", item)
+
+    def test_age(self):
+        item = self.comment("text", age=timedelta(minutes=30))
+        assert self.match("age:<1h", item)
+        assert self.match("age:1h", item)
+        assert not self.match("age:>1h", item)
+        assert self.match("age:>=30m", item)
+        assert not self.match("age:<2d", self.comment("text", age=timedelta(weeks=1)))
+        item.submission_time = None
+        assert not self.match("age:<1h", item)
+
+    def test_quotes(self):
+        item = self.comment("Senior Engineer (remote)")
+        assert self.match('"Senior Engineer" AND "(remote)"', item)
+        assert not self.match('text:"Engineer Senior" OR by:bar', item)
+
+    def test_invalid_boolean_query_falls_back_to_regex(self):
+        item = self.comment("foo AND (bar")
+        matcher = CommentMatcher("foo AND \\(bar")
+        assert matcher.is_boolean
+        assert matcher.match(item)
+        matcher = CommentMatcher("foo AND")
+        assert not matcher.is_boolean
+        assert matcher.match(self.comment("foo AND"))
+        assert not matcher.match(self.comment("foo"))
+        assert not CommentMatcher("age:<soon").is_boolean
+
+    def test_hacker_news_compiles_once(self):
+        hn = HackerNews()
+        item = self.comment("python")
+        with mock.patch(
+            "neo_haxor_news.hacker_news.CommentMatcher", wraps=CommentMatcher
+        ) as mock_comment_matcher:
+            assert hn.match_regex(item, "python OR rust")
+            assert not hn.match_regex(self.comment("go"), "python OR rust")
+        mock_comment_matcher.assert_called_once_with("python OR rust")
@@ -0,0 +1,76 @@
+import unittest
+
+import click
+
+from neo_haxor_news.comment_renderer import CommentRenderer
+
+
+class CommentRendererTest(unittest.TestCase):
+    def setUp(self):
+        self.renderer = CommentRenderer(link_color="blue", italic_color="cyan")
+
+    def test_paragraphs_and_entities(self):
+        assert (
+            self.renderer.render(
+                "I don&#x27;t  think   so.<p>&quot;a &lt; b&quot; &amp; c", indent="  "
+            )
+            == '  I don\'t think so.\n\n  "a < b" & c'
+        )
+
+    def test_wraps_at_width(self):
+        renderer = CommentRenderer(width=20)
+        assert renderer.render(" ".join(["word"] * 8), indent="    ") == (
+            "    word word word\n    word word word\n    word word"
+        )
+
+    def test_multiple_links(self):
+        assert self.renderer.render(
+            'See <a href="https:&#x2F;&#x2F;a.com&#x2F;x" rel="nofollow">'
+            "https:&#x2F;&#x2F;a.com&#x2F;...</a> and "
+            '<a href="https://b.com">b</a>, or <a href=https://c.com>c</a>.'
+        ) == (
+            "See "
+            + click.style("https://a.com/x", fg="blue")
+            + " and "
+            + click.style("https://b.com", fg="blue")
+            + ", or "
+            + click.style("https://c.com", fg="blue")
+            + "."
+        )
+
+    def test_long_link_not_broken(self):
+        url = "https://example.com/" + "a" * 80
+        renderer = CommentRenderer(width=40)
+        assert renderer.render(f'x <a href="{url}">{url}</a> y') == (
+            "x\n" + url + "\ny"
+        )
+
+    def test_italics(self):
+        assert self.renderer.render("we <i>do</i>n't <i>really know</i>") == (
+            "we "
+            + click.style("do", fg="cyan")
+            + "n't "
+            + click.style("really know", fg="cyan")
+        )
+
+    def test_italic_word_wrapped_whole(self):
+        renderer = CommentRenderer(italic_color="cyan", width=8)
+        assert renderer.render("abcd <i>ef</i>gh") == (
+            "abcd\n" + click.style("ef", fg="cyan") + "gh"
+        )
+
+    def test_preformatted(self):
+        assert (
+            self.renderer.render(
+                "Try:<pre><code>  if a &lt; b:\n      return\n</code></pre>Done",
+                indent="  ",
+            )
+            == "  Try:\n\n    if a < b:\n        return\n\n  Done"
+        )
+
+    def test_unknown_tags_and_stray_brackets(self):
+        assert self.renderer.render("<b>bold</b> 1 < 2") == "bold 1 < 2"
+
+    def test_empty(self):
+        assert self.renderer.render(None) == ""
+        assert self.renderer.render("<p>") == ""
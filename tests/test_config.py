@@ -1,13 +1,14 @@
 import mock
 import os
-import unittest
 
 from neo_haxor_news.hacker_news import HackerNews
+from tests.isolated_home import IsolatedHomeTestCase
 from tests.mock_hacker_news_api import MockHackerNewsApi
 
 
-class ConfigTest(unittest.TestCase):
+class ConfigTest(IsolatedHomeTestCase):
     def setUp(self):
+        super().setUp()
         self.hn = HackerNews()
         self.hn.hacker_news_api = MockHackerNewsApi()
         self.limit = len(self.hn.hacker_news_api.items)
@@ -26,17 +27,16 @@ class ConfigTest(unittest.TestCase):
         item_ids = self.hn.config.item_ids
         self.hn.config.clear_item_cache()
         assert self.hn.config.item_ids == item_ids
-        assert self.hn.config.item_cache == []
+        assert len(self.hn.config.seen_ids) == 0
         mock_save_cache.assert_called_with()
 
     def test_save_and_load_item_ids(self):
         self.hn.config.item_ids = [0, 1, 2]
-        self.hn.config.item_cache = [3, 4, 5]
+        self.hn.config.seen_ids.update([3, 4, 5])
         self.hn.config.save_cache()
         item_ids = self.hn.config.item_ids
         assert item_ids == [0, 1, 2]
-        item_cache = self.hn.config.item_cache
-        assert item_cache == [3, 4, 5]
+        assert list(self.hn.config.seen_ids) == [3, 4, 5]
 
     @mock.patch("haxor_news.hacker_news.HackerNews.view")
     @mock.patch("haxor_news.config.Config.clear_item_cache")
@@ -1,27 +1,106 @@
 import os
-import unittest
+import time
+from datetime import datetime
+
+import mock
+from hackernews import InvalidUserID, Item, User
 
 from neo_haxor_news.hacker_news import HackerNews
 from neo_haxor_news.settings import freelancer_post_id, who_is_hiring_post_id
+from tests.isolated_home import IsolatedHomeTestCase
 from tests.mock_hacker_news_api import MockHackerNewsApi
 
 
-class ConfigTestIntegration(unittest.TestCase):
+class ConfigTestIntegration(IsolatedHomeTestCase):
     def setUp(self):
-        self.hn = HackerNews()
-        self.hn.hacker_news_api = MockHackerNewsApi()
+        super().setUp()
+        self.now = time.time()
+        self.hn = self.hacker_news()
         self.limit = len(self.hn.hacker_news_api.items)
 
+    def hacker_news(self):
+        hn = HackerNews()
+        hn.config.sync_updates = False
+        hn.hacker_news_api = MockHackerNewsApi()
+        hn.hacker_news_api.get_user = mock.Mock(
+            return_value=User(
+                {"id": "whoishiring", "created": 0, "submitted": [5, 4, 3, 2, 1]}
+            )
+        )
+        hn.hacker_news_api.get_item = mock.Mock(side_effect=self.get_item)
+        return hn
+
+    def get_item(self, item_id):
+        titles = {
+            5: "Ask HN: Who wants to be hired? (March 2024)",
+            4: "Ask HN: Freelancer? Seeking Freelancer? (March 2024)",
+            3: "Ask HN: Who is hiring? (March 2024)",
+            2: "Ask HN: Freelancer? Seeking Freelancer? (February 2024)",
+            1: "Ask HN: Who is hiring? (February 2024)",
+        }
+        return Item(
+            {
+                "id": item_id,
+                "type": "story",
+                "by": "whoishiring",
+                "title": titles[item_id],
+                "time": int(self.now),
+            }
+        )
+
     def test_load_hiring_and_freelance_ids(self):
-        self.hn.config.load_hiring_and_freelance_ids()
-        assert self.hn.config.hiring_id != who_is_hiring_post_id
-        assert self.hn.config.freelance_id != freelancer_post_id
+        self.hn.load_hiring_and_freelance_ids()
+        assert self.hn.config.hiring_id == 3
+        assert self.hn.config.freelance_id == 4
+        assert not os.path.exists("downloaded_settings.py")
+        hn = self.hacker_news()
+        assert not hn.config.hiring_posts_expired()
+        hn.load_hiring_and_freelance_ids()
+        assert (hn.config.hiring_id, hn.config.freelance_id) == (3, 4)
+        hn.hacker_news_api.get_user.assert_not_called()
 
-    def test_load_hiring_and_freelance_ids_invalid_url(self):
-        self.hn.config.load_hiring_and_freelance_ids(url="https://example.com")
+    def test_load_hiring_and_freelance_ids_replaces_earlier_month(self):
+        config = self.hn.config
+        config.hiring_id, config.freelance_id = 111, 222
+        config.hiring_month = "2000-01"
+        config.save_cache()
+        hn = self.hacker_news()
+        assert hn.config.hiring_posts_expired()
+        hn.load_hiring_and_freelance_ids()
+        assert (hn.config.hiring_id, hn.config.freelance_id) == (3, 4)
+        hn = self.hacker_news()
+        assert (hn.config.hiring_id, hn.config.freelance_id) == (3, 4)
+        assert not hn.config.hiring_posts_expired()
+
+    def test_load_hiring_and_freelance_ids_lookup_failed_keeps_cache(self):
+        config = self.hn.config
+        config.hiring_id, config.freelance_id = 111, 222
+        config.hiring_month = "2000-01"
+        config.save_cache()
+        hn = self.hacker_news()
+        hn.hacker_news_api.get_user.side_effect = InvalidUserID
+        hn.load_hiring_and_freelance_ids()
+        assert (hn.config.hiring_id, hn.config.freelance_id) == (111, 222)
+
+    def test_load_hiring_and_freelance_ids_lookup_failed(self):
+        self.hn.hacker_news_api.get_user.side_effect = InvalidUserID
+        self.hn.load_hiring_and_freelance_ids()
         assert self.hn.config.hiring_id == who_is_hiring_post_id
         assert self.hn.config.freelance_id == freelancer_post_id
-        os.remove("./downloaded_settings.py")
+        hn = self.hacker_news()
+        assert not hn.config.hiring_posts_expired()
+        hn.load_hiring_and_freelance_ids()
+        hn.hacker_news_api.get_user.assert_not_called()
+
+    def test_hiring_posts_expired(self):
+        config = self.hn.config
+        assert config.hiring_posts_expired(self.now)
+        config.hiring_month = datetime.fromtimestamp(self.now).strftime("%Y-%m")
+        assert not config.hiring_posts_expired(self.now)
+        config.hiring_month = "2000-01"
+        config.hiring_checked = int(self.now)
+        assert not config.hiring_posts_expired(self.now)
+        assert config.hiring_posts_expired(self.now + config.HIRING_RECHECK_INTERVAL)
 
     def test_load_hiring_and_freelance_ids_from_cache_or_defaults(self):
         self.hn.config.load_hiring_and_freelance_ids_from_cache_or_defaults()
@@ -0,0 +1,23 @@
+import unittest
+
+import mock
+
+from neo_haxor_news.deadline import Deadline
+
+
+class DeadlineTest(unittest.TestCase):
+    def test_no_deadline(self):
+        deadline = Deadline()
+        assert deadline.remaining() is None
+        assert not deadline.expired()
+
+    @mock.patch("neo_haxor_news.deadline.time.monotonic")
+    def test_deadline(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        deadline = Deadline(2.5)
+        mock_monotonic.return_value = 101.0
+        assert deadline.remaining() == 1.5
+        assert not deadline.expired()
+        mock_monotonic.return_value = 103.0
+        assert deadline.remaining() == 0.0
+        assert deadline.expired()
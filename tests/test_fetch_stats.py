@@ -0,0 +1,28 @@
+import unittest
+
+import mock
+
+from neo_haxor_news.fetch_stats import FetchStats
+
+
+class FetchStatsTest(unittest.TestCase):
+    def setUp(self):
+        self.fetch_stats = FetchStats(started_at=100.0)
+
+    @mock.patch("neo_haxor_news.fetch_stats.time.monotonic")
+    def test_mark_keeps_first_time(self, mock_monotonic):
+        mock_monotonic.return_value = 100.5
+        self.fetch_stats.mark(FetchStats.TIME_TO_FIRST_COMMENT)
+        mock_monotonic.return_value = 102.0
+        self.fetch_stats.mark(FetchStats.TIME_TO_FIRST_COMMENT)
+        assert self.fetch_stats.timings == {FetchStats.TIME_TO_FIRST_COMMENT: 0.5}
+
+    @mock.patch("neo_haxor_news.fetch_stats.time.monotonic")
+    def test_report(self, mock_monotonic):
+        mock_monotonic.return_value = 100.25
+        self.fetch_stats.mark(FetchStats.TIME_TO_FIRST_COMMENT)
+        self.fetch_stats.increment("items fetched", 3)
+        mock_monotonic.return_value = 101.0
+        assert self.fetch_stats.report() == (
+            "elapsed: 1.000s\ntime to first comment: 0.250s\nitems fetched: 3"
+        )
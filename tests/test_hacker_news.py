@@ -1,6 +1,6 @@
 import mock
-import unittest
 
+from neo_haxor_news.fetch_stats import FetchStats
 from neo_haxor_news.hacker_news import HackerNews
 from tests.data.comment import formatted_comment, formatted_heading, raw_comment
 from tests.data.item import formatted_items
@@ -8,12 +8,15 @@ from tests.data.markdown import formatted_markdown, raw_markdown
 from tests.data.regex import raw_text_for_regex
 from tests.data.tip import formatted_tip
 from tests.data.title import formatted_title, raw_title
+from tests.isolated_home import IsolatedHomeTestCase
 from tests.mock_hacker_news_api import MockHackerNewsApi
 
 
-class HackerNewsTest(unittest.TestCase):
+class HackerNewsTest(IsolatedHomeTestCase):
     def setUp(self):
+        super().setUp()
         self.hn = HackerNews()
+        self.hn.config.sync_updates = False
         self.hn.hacker_news_api = MockHackerNewsApi()
         self.limit = len(self.hn.hacker_news_api.items)
         self.valid_id = 0
@@ -51,11 +54,36 @@ class HackerNewsTest(unittest.TestCase):
         headlines_message = self.hn.headlines_message(message)
         assert message in headlines_message
 
-    @mock.patch("haxor_news.hacker_news.HackerNews.print_comments")
-    @mock.patch("haxor_news.hacker_news.HackerNews.print_item_not_found")
-    def test_hiring_and_freelance(self, mock_print_item_not_found, mock_print_comments):
+    @mock.patch("neo_haxor_news.hacker_news.HackerNews.print_top_level_comments")
+    @mock.patch("neo_haxor_news.hacker_news.HackerNews.print_comments")
+    @mock.patch("neo_haxor_news.hacker_news.HackerNews.print_item_not_found")
+    @mock.patch("neo_haxor_news.config.Config.save_cache")
+    def test_hiring_and_freelance(
+        self,
+        mock_save_cache,
+        mock_print_item_not_found,
+        mock_print_comments,
+        mock_print_top_level_comments,
+    ):
+        self.hn.get_item = self.hn.hacker_news_api.get_item
         self.hn.hiring_and_freelance(self.query, post_id=self.valid_id)
-        item = self.hn.hacker_news_api.get_item(self.valid_id)
+        item = self.hn.hacker_news_api.items[self.valid_id]
+        mock_print_top_level_comments.assert_called_with(
+            item, self.query, expand_matching=False, reprint=False
+        )
+        self.hn.hiring_and_freelance(
+            self.query,
+            post_id=self.valid_id,
+            replies=HackerNews.REPLIES_MATCHING,
+            reprint=True,
+        )
+        mock_print_top_level_comments.assert_called_with(
+            item, self.query, expand_matching=True, reprint=True
+        )
+        assert not mock_print_comments.mock_calls
+        self.hn.hiring_and_freelance(
+            self.query, post_id=self.valid_id, replies=HackerNews.REPLIES_ALL
+        )
         mock_print_comments.assert_called_with(
             item, self.query, comments_hide_non_matching=True
         )
@@ -94,16 +122,14 @@ class HackerNewsTest(unittest.TestCase):
             item_ids=self.hn.hacker_news_api.top_stories(self.limit),
         )
 
-    @mock.patch("haxor_news.hacker_news.HackerNews.print_items")
-    @mock.patch("haxor_news.hacker_news.click")
-    @mock.patch("haxor_news.hacker_news.HackerNews.print_item_not_found")
+    @mock.patch("neo_haxor_news.hacker_news.HackerNews.print_items")
+    @mock.patch("neo_haxor_news.hacker_news.click")
+    @mock.patch("neo_haxor_news.hacker_news.HackerNews.print_item_not_found")
     def test_user(self, mock_print_item_not_found, mock_click, mock_print_items):
         user_id = "foo"
         self.hn.user(user_id, self.limit)
         user = self.hn.hacker_news_api.get_user(user_id)
-        mock_print_items.assert_called_with(
-            "User submissions:", user.submitted[0 : self.limit]
-        )
+        mock_print_items.assert_called_with(user.submitted[0 : self.limit])
         assert mock_click.mock_calls
         self.hn.user(self.invalid_id, self.limit)
         mock_print_item_not_found.assert_called_with(self.invalid_id)
@@ -206,7 +232,7 @@ class HackerNewsTest(unittest.TestCase):
         self, mock_click_secho, mock_click_echo
     ):
         items = self.hn.hacker_news_api.items
-        self.hn.config.item_cache.extend(["0", "1", "2"])
+        self.hn.config.seen_ids.update([0, 1, 2])
         self.hn.print_comments(
             items[0], regex_query=self.hn.QUERY_UNSEEN, comments_hide_non_matching=True
         )
@@ -247,11 +273,41 @@ class HackerNewsTest(unittest.TestCase):
         items = self.hn.hacker_news_api.items
         item = items[2]
         regex_query = "foo"
-        self.hn.config.item_cache.append(str(item.item_id))
+        self.hn.config.seen_ids.add(item.item_id)
         self.hn.print_comments(item, regex_query)
         mock_click_echo.assert_any_call("\x1b[33m\nbaz - just now\x1b[0m", color=True)
         mock_click_echo.assert_any_call("text baz [...]", color=True)
 
+    @mock.patch("neo_haxor_news.hacker_news.click.echo")
+    @mock.patch("neo_haxor_news.hacker_news.click.secho")
+    def test_print_comments_depth_first(self, mock_click_secho, mock_click_echo):
+        items = self.hn.hacker_news_api.items
+        items[0].kids = [1, self.invalid_id, 2]
+        items[1].kids = [2]
+        self.hn.print_comments(items[0], regex_query=None)
+        headings = [
+            call.args[0]
+            for call in mock_click_echo.mock_calls
+            if call.args and " - just now" in call.args[0]
+        ]
+        assert [heading.split(" - ")[0].split("\n")[1] for heading in headings] == [
+            "foo",
+            "  bar",
+            "    baz",
+            "  baz",
+        ]
+        mock_click_secho.assert_any_call(
+            f"Item with id {self.invalid_id} not found.", fg="red"
+        )
+
+    @mock.patch("neo_haxor_news.hacker_news.click.echo")
+    def test_print_comments_not_streamed(self, mock_click_echo):
+        self.hn.config.stream_comments = False
+        items = self.hn.hacker_news_api.items
+        self.hn.print_comments(items[0], regex_query=None)
+        mock_click_echo.assert_any_call("    text baz", color=True)
+        assert FetchStats.TIME_TO_FIRST_COMMENT in self.hn.fetch_stats.timings
+
     @mock.patch("haxor_news.hacker_news.click")
     def test_print_item_not_found(self, mock_click):
         self.hn.print_item_not_found(self.invalid_id)
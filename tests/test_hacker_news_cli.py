@@ -1,13 +1,15 @@
 import mock
-import unittest
 
 from click.testing import CliRunner
 
 from neo_haxor_news.hacker_news_cli import HackerNewsCli
+from neo_haxor_news.job_post import JobPostFilter
+from tests.isolated_home import IsolatedHomeTestCase
 
 
-class HackerNewsCliTest(unittest.TestCase):
+class HackerNewsCliTest(IsolatedHomeTestCase):
     def setUp(self):
+        super().setUp()
         self.runner = CliRunner()
         self.hacker_news_cli = HackerNewsCli()
         self.limit = 10
@@ -18,6 +20,44 @@ class HackerNewsCliTest(unittest.TestCase):
         result = self.runner.invoke(self.hacker_news_cli.cli)
         assert result.exit_code == 0
 
+    @mock.patch("neo_haxor_news.hacker_news_cli.HackerNews.print_fetch_stats")
+    @mock.patch("neo_haxor_news.hacker_news_cli.HackerNews.top")
+    def test_stats(self, mock_hn_call, mock_print_fetch_stats):
+        result = self.runner.invoke(self.hacker_news_cli.cli, ["--stats", "top"])
+        mock_hn_call.assert_called_with(self.limit)
+        mock_print_fetch_stats.assert_called_with()
+        assert result.exit_code == 0
+
+    @mock.patch("neo_haxor_news.hacker_news_cli.HackerNews.top")
+    def test_offline(self, mock_hn_call):
+        result = self.runner.invoke(self.hacker_news_cli.cli, ["--offline", "top"])
+        mock_hn_call.assert_called_with(self.limit)
+        assert result.exit_code == 0
+
+    @mock.patch("neo_haxor_news.hacker_news_cli.HackerNews.top", autospec=True)
+    def test_deadline(self, mock_hn_call):
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli, ["--deadline", "2.5", "top"]
+        )
+        hacker_news = mock_hn_call.call_args.args[0]
+        assert hacker_news.deadline.seconds == 2.5
+        assert hacker_news.transport.session.timeout == 2.5
+        assert result.exit_code == 0
+
+    @mock.patch("neo_haxor_news.hacker_news_cli.HackerNews.search")
+    def test_search(self, mock_hn_call):
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli, ["search", "rust compiler", "-l", "5"]
+        )
+        mock_hn_call.assert_called_with("rust compiler", 5)
+        assert result.exit_code == 0
+
+    @mock.patch("neo_haxor_news.hacker_news_cli.HackerNews.sync")
+    def test_sync(self, mock_hn_call):
+        result = self.runner.invoke(self.hacker_news_cli.cli, ["sync", "-l", "500"])
+        mock_hn_call.assert_called_with(500)
+        assert result.exit_code == 0
+
     @mock.patch("haxor_news.hacker_news_cli.HackerNews.ask")
     def test_ask(self, mock_hn_call):
         result = self.runner.invoke(self.hacker_news_cli.cli, ["ask"])
@@ -30,20 +70,66 @@ class HackerNewsCliTest(unittest.TestCase):
         mock_hn_call.assert_called_with(self.limit)
         assert result.exit_code == 0
 
-    @mock.patch("haxor_news.hacker_news_cli.HackerNews.hiring_and_freelance")
+    @mock.patch("neo_haxor_news.hacker_news_cli.HackerNews.hiring_and_freelance")
     def test_hiring(self, mock_hn_call):
         result = self.runner.invoke(
             self.hacker_news_cli.cli, ["hiring", self.dummy, "-i", 1]
         )
-        mock_hn_call.assert_called_with(self.dummy, 1)
+        mock_hn_call.assert_called_with(self.dummy, 1, "none", False, JobPostFilter())
+        assert result.exit_code == 0
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli,
+            ["hiring", self.dummy, "-i", 1, "-r", "matching", "-p"],
+        )
+        mock_hn_call.assert_called_with(
+            self.dummy, 1, "matching", True, JobPostFilter()
+        )
         assert result.exit_code == 0
 
-    @mock.patch("haxor_news.hacker_news_cli.HackerNews.hiring_and_freelance")
+    @mock.patch("neo_haxor_news.hacker_news_cli.HackerNews.hiring_and_freelance")
+    def test_hiring_job_post_filters(self, mock_hn_call):
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli,
+            [
+                "hiring",
+                "-i",
+                1,
+                "--remote",
+                "--tech",
+                "Rust",
+                "--tech",
+                "python",
+                "--min-salary",
+                "150k",
+            ],
+        )
+        assert result.exit_code == 0
+        mock_hn_call.assert_called_with(
+            None,
+            1,
+            "none",
+            False,
+            JobPostFilter(remote=True, tech=["rust", "python"], min_salary=150000),
+        )
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli, ["hiring", "-i", 1, "--min-salary", "lots"]
+        )
+        assert result.exit_code == 2
+
+    @mock.patch("neo_haxor_news.hacker_news_cli.HackerNews.hiring_and_freelance")
     def test_freelance(self, mock_hn_call):
         result = self.runner.invoke(
             self.hacker_news_cli.cli, ["freelance", self.dummy, "-i", 1]
         )
-        mock_hn_call.assert_called_with(self.dummy, 1)
+        mock_hn_call.assert_called_with(self.dummy, 1, "none", False, JobPostFilter())
+        assert result.exit_code == 0
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli,
+            ["freelance", self.dummy, "-i", 1, "-r", "matching", "-p"],
+        )
+        mock_hn_call.assert_called_with(
+            self.dummy, 1, "matching", True, JobPostFilter()
+        )
         assert result.exit_code == 0
 
     @mock.patch("haxor_news.hacker_news_cli.HackerNews.jobs")
@@ -70,10 +156,15 @@ class HackerNewsCliTest(unittest.TestCase):
         mock_hn_call.assert_called_with(self.limit)
         assert result.exit_code == 0
 
-    @mock.patch("haxor_news.hacker_news_cli.HackerNews.user")
+    @mock.patch("neo_haxor_news.hacker_news_cli.HackerNews.user")
     def test_user(self, mock_hn_call):
         result = self.runner.invoke(self.hacker_news_cli.cli, ["user", self.user])
-        mock_hn_call.assert_called_with(self.user, self.limit)
+        mock_hn_call.assert_called_with(self.user, self.limit, False)
+        assert result.exit_code == 0
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli, ["user", self.user, "-l", "3", "--comments"]
+        )
+        mock_hn_call.assert_called_with(self.user, 3, True)
         assert result.exit_code == 0
 
     @mock.patch("haxor_news.hacker_news_cli.HackerNews.view")
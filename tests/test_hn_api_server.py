@@ -0,0 +1,282 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import mock
+import requests
+
+from neo_haxor_news.hacker_news import HackerNews
+from neo_haxor_news.item_store import ItemStore
+from neo_haxor_news.job_post import JobPostFilter
+from tests.hn_api_server import HackerNewsApiServer, load_fixture, synthetic_thread
+from tests.isolated_home import IsolatedHomeTestCase
+
+
+class HackerNewsApiServerTest(unittest.TestCase):
+    def setUp(self):
+        self.items, self.users = synthetic_thread(comments=50, fanout=3)
+        self.server = HackerNewsApiServer(self.items, self.users, seed=0).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_synthetic_thread(self):
+        assert len(self.items) == 51
+        assert self.items[1]["kids"] == [2, 3, 4]
+        assert self.items[2]["kids"] == [5, 6, 7]
+        assert self.items[5]["parent"] == 2
+        assert sum(len(user["submitted"]) for user in self.users.values()) == 51
+
+    def test_api_layout(self):
+        base_url = self.server.base_url
+        assert requests.get(base_url + "item/2.json").json()["parent"] == 1
+        assert requests.get(base_url + "item/999.json").json() is None
+        assert requests.get(base_url + "user/user1.json").json()["karma"] == 10
+        assert requests.get(base_url + "topstories.json").json() == [1]
+        assert requests.get(base_url + "maxitem.json").json() == 51
+        assert requests.get(base_url + "foo/bar").status_code == 404
+
+    def test_latency_and_jitter(self):
+        self.server.latency = 0.05
+        self.server.jitter = 0.02
+        delays = [self.server.delay() for _ in range(100)]
+        assert all(0.03 <= delay <= 0.07 for delay in delays)
+        assert len(set(delays)) > 1
+        started_at = time.monotonic()
+        requests.get(self.server.base_url + "item/1.json")
+        assert time.monotonic() - started_at >= 0.03
+
+    def test_error_rate(self):
+        self.server.error_rate = 0.5
+        statuses = [
+            requests.get(self.server.base_url + "item/1.json").status_code
+            for _ in range(40)
+        ]
+        assert statuses.count(503) == self.server.errors_injected
+        assert 0 < self.server.errors_injected < 40
+
+    def test_load_fixture(self):
+        fixture_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(fixture_dir, "fixture.json")
+            with open(path, "w") as fixture_file:
+                json.dump(
+                    {
+                        "items": list(self.items.values()),
+                        "users": list(self.users.values()),
+                        "listings": {"beststories": [1]},
+                    },
+                    fixture_file,
+                )
+            items, users, listings = load_fixture(path)
+        finally:
+            shutil.rmtree(fixture_dir)
+        assert items == self.items
+        assert users == self.users
+        assert listings == {"beststories": [1]}
+
+
+class HackerNewsAgainstServerTest(IsolatedHomeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.items, self.users = synthetic_thread(comments=200)
+        self.server = HackerNewsApiServer(self.items, self.users, seed=0)
+        self.server.start()
+        self.hn = HackerNews()
+        self.hn.set_api_base_url(self.server.base_url)
+        self.hn.request_scheduler.backoff_base = 0.001
+
+    def tearDown(self):
+        self.server.stop()
+
+    @mock.patch("neo_haxor_news.hacker_news.click.echo")
+    def print_comments(self, mock_echo):
+        self.hn.print_comments(self.hn.get_item(1))
+        return [call.args[0] for call in mock_echo.call_args_list]
+
+    def test_api_base_url_config(self):
+        assert self.hn.config.api_base_url == "https://hacker-news.firebaseio.com/v0/"
+        self.hn.set_api_base_url("http://127.0.0.1:8000/v0")
+        assert self.hn.hacker_news_api.base_url == "http://127.0.0.1:8000/v0/"
+        assert self.hn.hacker_news_api.item_url == "http://127.0.0.1:8000/v0/item/"
+        assert self.hn.hacker_news_api.user_url == "http://127.0.0.1:8000/v0/user/"
+
+    def test_print_comments(self):
+        lines = self.print_comments()
+        assert sum("Comment" in line for line in lines) == 200
+        assert self.server.requests_served == 201
+
+    def test_print_comments_with_errors(self):
+        self.server.error_rate = 0.2
+        self.hn.request_scheduler.max_retries = 10
+        lines = self.print_comments()
+        assert sum("Comment" in line for line in lines) == 200
+        assert self.server.errors_injected > 0
+        assert (
+            self.hn.fetch_stats.counters["requests retried"]
+            == self.server.errors_injected
+        )
+
+    def time_out_item(self, item_id):
+        get_item = self.hn.hacker_news_api.get_item
+
+        def timing_out_get_item(requested_id):
+            if requested_id == item_id:
+                raise requests.exceptions.ReadTimeout
+            return get_item(requested_id)
+
+        self.hn.hacker_news_api.get_item = timing_out_get_item
+        self.hn.request_scheduler.max_retries = 0
+
+    def test_print_comments_with_timeout(self):
+        self.time_out_item(5)
+        with mock.patch("neo_haxor_news.hacker_news.click.secho") as mock_secho:
+            lines = self.print_comments()
+        # Only the comment and its replies are missing.
+        subtree = [5]
+        for comment_id in subtree:
+            subtree.extend(self.items[comment_id].get("kids", []))
+        assert sum("Comment" in line for line in lines) == 200 - len(subtree)
+        messages = [call.args[0] for call in mock_secho.call_args_list]
+        assert "Item with id 5 could not be fetched, try again later." in messages
+
+    @mock.patch("neo_haxor_news.hacker_news.click")
+    def test_print_items_with_timeout(self, mock_click):
+        self.time_out_item(2)
+        self.hn.config.show_tip = False
+        with mock.patch.object(self.hn.config, "save_cache"):
+            self.hn.print_items([1, 2])
+        assert self.hn.config.item_ids == [1]
+        mock_click.secho.assert_any_call(
+            "Item with id 2 could not be fetched, try again later.", fg="red"
+        )
+
+    def test_max_connections(self):
+        self.server.stop()
+        self.server = HackerNewsApiServer(
+            self.items, self.users, latency=0.01, max_connections=2
+        ).start()
+        self.hn.set_api_base_url(self.server.base_url)
+        lines = self.print_comments()
+        assert sum("Comment" in line for line in lines) == 200
+        assert self.server.max_in_flight == 2
+
+    def test_get_story_ids(self):
+        assert self.hn.get_story_ids("topstories", 10) == [1]
+
+    def test_deadline(self):
+        self.server.latency = 0.05
+        self.hn = HackerNews(deadline=0.5)
+        self.hn.set_api_base_url(self.server.base_url)
+        self.hn.item_store = ItemStore(os.path.join(self.temp_dir, "deadline.sqlite3"))
+        started_at = time.monotonic()
+        with mock.patch("neo_haxor_news.hacker_news.click.secho") as mock_secho:
+            lines = self.print_comments()
+        assert time.monotonic() - started_at < 1.0
+        num_printed = sum("Comment" in line for line in lines)
+        assert 0 < num_printed < 200
+        summary = [call.args[0] for call in mock_secho.call_args_list]
+        assert "Deadline of 0.5s reached, skipped " in summary[-2]
+        assert summary[-1] == f"Showed {num_printed} of 200 comments."
+
+    def start_hiring_thread(self):
+        self.server.stop()
+        self.items, self.users = synthetic_thread(comments=200, fanout=40)
+        self.server = HackerNewsApiServer(self.items, self.users).start()
+        self.hn.set_api_base_url(self.server.base_url)
+
+    def hiring_and_freelance(self, regex_query, replies, reprint=False):
+        with (
+            mock.patch("neo_haxor_news.hacker_news.click.echo") as mock_echo,
+            mock.patch.object(self.hn.config, "save_cache"),
+        ):
+            self.hn.hiring_and_freelance(regex_query, 1, replies, reprint)
+        return [call.args[0] for call in mock_echo.call_args_list]
+
+    def test_hiring_top_level_only(self):
+        self.start_hiring_thread()
+        lines = self.hiring_and_freelance("Comment 3 ", HackerNews.REPLIES_NONE)
+        assert sum("Comment" in line for line in lines) == 1
+        assert self.server.requests_served == 1 + 40
+
+    def test_hiring_replies_to_matching(self):
+        self.start_hiring_thread()
+        lines = self.hiring_and_freelance("Comment 3 ", HackerNews.REPLIES_MATCHING)
+        assert sum("Comment" in line for line in lines) == 1 + 40
+        assert self.server.requests_served == 1 + 40 + 40
+
+    def test_hiring_all_replies(self):
+        self.start_hiring_thread()
+        lines = self.hiring_and_freelance("Comment 3 ", HackerNews.REPLIES_ALL)
+        assert sum("Comment" in line for line in lines) == 1
+        assert self.server.requests_served == 201
+
+    def test_hiring_new_since_last_run(self):
+        self.start_hiring_thread()
+        self.hiring_and_freelance("Comment 3 ", HackerNews.REPLIES_NONE)
+        self.items[202] = dict(self.items[3], id=202, text="<p>Comment 3 again")
+        self.items[1]["kids"].append(202)
+        self.hn.item_store.apply_updates([1], [])
+        self.server.requests_served = 0
+        with mock.patch("neo_haxor_news.hacker_news.click.secho") as mock_secho:
+            lines = self.hiring_and_freelance("Comment 3 ", HackerNews.REPLIES_NONE)
+        matches = [line for line in lines if "Comment" in line]
+        assert len(matches) == 1
+        assert matches[0].endswith("Comment 3 again")
+        assert self.server.requests_served == 2
+        assert mock_secho.call_args.args[0] == (
+            "\n1 new comments since the last run, 1 earlier matches not shown,"
+            " use -p/--reprint to show them."
+        )
+        self.server.requests_served = 0
+        lines = self.hiring_and_freelance(
+            "Comment 3 ", HackerNews.REPLIES_NONE, reprint=True
+        )
+        assert sum("Comment" in line for line in lines) == 2
+        assert self.server.requests_served == 0
+        lines = self.hiring_and_freelance("Comment 4 ", HackerNews.REPLIES_NONE)
+        assert sum("Comment" in line for line in lines) == 1
+
+    def test_hiring_offline_run_not_recorded(self):
+        self.start_hiring_thread()
+        self.hn.get_item(1)
+        self.hn.offline = True
+        lines = self.hiring_and_freelance("Comment 3 ", HackerNews.REPLIES_NONE)
+        assert not any("Comment" in line for line in lines)
+        self.hn.offline = False
+        with mock.patch("neo_haxor_news.hacker_news.click.secho") as mock_secho:
+            lines = self.hiring_and_freelance("Comment 3 ", HackerNews.REPLIES_NONE)
+        assert sum("Comment" in line for line in lines) == 1
+        assert "since the last run" not in mock_secho.call_args.args[0]
+
+    def print_job_posts(self, job_filter):
+        with (
+            mock.patch("neo_haxor_news.hacker_news.click.echo") as mock_echo,
+            mock.patch("neo_haxor_news.hacker_news.click.secho"),
+            mock.patch.object(self.hn.config, "save_cache"),
+        ):
+            self.hn.hiring_and_freelance(None, 1, job_filter=job_filter)
+        lines = [call.args[0] for call in mock_echo.call_args_list]
+        return [line for line in lines if "|" in line]
+
+    def test_hiring_job_post_filters(self):
+        self.start_hiring_thread()
+        self.items[2]["text"] = "Acme | Remote | $150k-$200k<p>Rust and Python."
+        self.items[3]["text"] = "Bar | Remote | $90k-$120k<p>Rust."
+        self.items[4]["text"] = "Baz | Berlin, Germany | Onsite<p>Rust."
+        lines = self.print_job_posts(
+            JobPostFilter(remote=True, tech=["rust"], min_salary=150000)
+        )
+        assert len(lines) == 1
+        assert "Acme" in lines[0]
+        assert self.server.requests_served == 1 + 40
+        self.server.requests_served = 0
+        lines = self.print_job_posts(JobPostFilter(tech=["rust"]))
+        assert len(lines) == 3
+        lines = self.print_job_posts(JobPostFilter(location="berlin"))
+        assert len(lines) == 1
+        assert "Baz" in lines[0]
+        assert self.server.requests_served == 0
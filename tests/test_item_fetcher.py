@@ -0,0 +1,163 @@
+import random
+import threading
+import time
+import unittest
+
+from hackernews import InvalidItemID
+
+from neo_haxor_news.deadline import Deadline
+from neo_haxor_news.item_fetcher import ItemFetcher
+from tests.mock_hacker_news_api import MockHackerNewsApi
+
+
+class ItemFetcherTest(unittest.TestCase):
+    def setUp(self):
+        self.hacker_news_api = MockHackerNewsApi()
+        self.invalid_id = 9000
+
+    def slow_get_item(self, item_id):
+        time.sleep(random.uniform(0, 0.02))
+        return self.hacker_news_api.get_item(item_id)
+
+    def test_fetch_items_preserves_order(self):
+        item_fetcher = ItemFetcher(self.slow_get_item, max_workers=4)
+        item_ids = [2, 0, 1, 2, 1, 0]
+        results = [
+            (item_id, future.result())
+            for item_id, future in item_fetcher.fetch_items(item_ids)
+        ]
+        assert [item_id for item_id, _ in results] == item_ids
+        assert [item.item_id for _, item in results] == item_ids
+
+    def test_fetch_items_errors(self):
+        item_fetcher = ItemFetcher(self.hacker_news_api.get_item)
+        results = list(item_fetcher.fetch_items([0, self.invalid_id, 1]))
+        assert results[0][1].result().item_id == 0
+        with self.assertRaises(InvalidItemID):
+            results[1][1].result()
+        assert results[2][1].result().item_id == 1
+
+    def test_fetch_items_empty(self):
+        item_fetcher = ItemFetcher(self.hacker_news_api.get_item)
+        assert list(item_fetcher.fetch_items([])) == []
+
+    def test_fetch_items_bounded_concurrency(self):
+        lock = threading.Lock()
+        in_flight = []
+        max_in_flight = []
+
+        def get_item(item_id):
+            with lock:
+                in_flight.append(item_id)
+                max_in_flight.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(item_id)
+            return self.hacker_news_api.get_item(item_id % 3)
+
+        item_fetcher = ItemFetcher(get_item, max_workers=2)
+        results = list(item_fetcher.fetch_items(range(10)))
+        assert len(results) == 10
+        assert max(max_in_flight) <= 2
+
+    def test_fetch_comment_tree(self):
+        item_fetcher = ItemFetcher(self.hacker_news_api.get_item)
+        item = self.hacker_news_api.get_item(0)
+        comment_tree = item_fetcher.fetch_comment_tree(item)
+        assert list(comment_tree) == [1, 2]
+        assert comment_tree[2].result().item_id == 2
+
+    def test_fetch_comment_tree_by_level(self):
+        fetched = []
+
+        def get_item(item_id):
+            fetched.append(item_id)
+            return self.hacker_news_api.get_item(item_id)
+
+        self.hacker_news_api.items[0].kids = [1, 2]
+        self.hacker_news_api.items[1].kids = [self.invalid_id]
+        self.hacker_news_api.items[2].kids = [1]
+        item_fetcher = ItemFetcher(get_item, max_workers=2)
+        comment_tree = item_fetcher.fetch_comment_tree(self.hacker_news_api.items[0])
+        assert sorted(fetched[:2]) == [1, 2]
+        assert fetched[2:] == [self.invalid_id]
+        with self.assertRaises(InvalidItemID):
+            comment_tree[self.invalid_id].result()
+
+    def test_stream_comment_tree(self):
+        item_fetcher = ItemFetcher(self.slow_get_item, max_workers=2)
+        item = self.hacker_news_api.get_item(0)
+        with item_fetcher.stream_comment_tree(item) as comment_stream:
+            comment = comment_stream[1].result()
+            assert comment.item_id == 1
+            assert comment_stream[2].result().item_id == 2
+            assert len(comment_stream) == 2
+
+    def test_stream_comment_tree_prefetches_kids(self):
+        fetched = threading.Event()
+
+        def get_item(item_id):
+            if item_id == 2:
+                fetched.set()
+            return self.hacker_news_api.get_item(item_id)
+
+        item_fetcher = ItemFetcher(get_item)
+        item = self.hacker_news_api.get_item(0)
+        with item_fetcher.stream_comment_tree(item):
+            assert fetched.wait(timeout=1)
+
+    def test_stream_comment_tree_errors(self):
+        item_fetcher = ItemFetcher(self.hacker_news_api.get_item)
+        self.hacker_news_api.items[0].kids = [self.invalid_id, 1]
+        with item_fetcher.stream_comment_tree(
+            self.hacker_news_api.items[0]
+        ) as comment_stream:
+            with self.assertRaises(InvalidItemID):
+                comment_stream[self.invalid_id].result()
+            assert comment_stream[2].result().item_id == 2
+
+    def blocking_get_item(self, release):
+        def get_item(item_id):
+            if item_id == 2:
+                release.wait(timeout=5)
+            return self.hacker_news_api.get_item(item_id)
+
+        return get_item
+
+    def test_fetch_items_deadline(self):
+        release = threading.Event()
+        item_fetcher = ItemFetcher(
+            self.blocking_get_item(release), deadline=Deadline(0.1)
+        )
+        started_at = time.monotonic()
+        results = list(item_fetcher.fetch_items([0, 1, 2, 0]))
+        assert time.monotonic() - started_at < 1
+        release.set()
+        assert [item_id for item_id, _ in results] == [0, 1]
+
+    def test_fetch_comment_tree_deadline(self):
+        release = threading.Event()
+        self.hacker_news_api.items[1].kids = [2]
+        self.hacker_news_api.items[0].kids = [1, self.invalid_id]
+        item_fetcher = ItemFetcher(
+            self.blocking_get_item(release), deadline=Deadline(0.1)
+        )
+        started_at = time.monotonic()
+        comment_tree = item_fetcher.fetch_comment_tree(self.hacker_news_api.items[0])
+        assert time.monotonic() - started_at < 1
+        release.set()
+        assert sorted(comment_tree) == [1, self.invalid_id]
+
+    def test_stream_comment_tree_deadline(self):
+        release = threading.Event()
+        item_fetcher = ItemFetcher(
+            self.blocking_get_item(release), deadline=Deadline(0.1)
+        )
+        started_at = time.monotonic()
+        with item_fetcher.stream_comment_tree(self.hacker_news_api.items[0]) as stream:
+            assert stream[1].result().item_id == 1
+            assert 2 in stream
+            assert 3 not in stream
+            time.sleep(0.15)
+        assert time.monotonic() - started_at < 1
+        release.set()
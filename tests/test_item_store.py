@@ -0,0 +1,223 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import mock
+from hackernews import HTTPError, Item, User
+
+from neo_haxor_news.hacker_news import HackerNews
+from neo_haxor_news.item_store import ItemStore
+from neo_haxor_news.job_post import JobPost, JobPostFilter
+from tests.isolated_home import IsolatedHomeTestCase
+from tests.mock_hacker_news_api import MockHackerNewsApi
+
+
+class ItemStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.item_store = ItemStore(os.path.join(self.cache_dir, ItemStore.DATABASE))
+        self.now = time.time()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def create_item(self, item_id, age):
+        return Item(
+            {
+                "id": item_id,
+                "type": "story",
+                "by": "foo",
+                "time": int(self.now - age),
+                "title": "title foo",
+                "kids": [item_id + 1],
+            }
+        )
+
+    def test_item_ttl(self):
+        assert self.item_store.item_ttl(self.now - 60, self.now) == 2 * 60
+        assert self.item_store.item_ttl(self.now - 2 * 60 * 60, self.now) == 10 * 60
+        assert (
+            self.item_store.item_ttl(self.now - 30 * 24 * 60 * 60, self.now)
+            == ItemStore.OLD_ITEM_TTL
+        )
+
+    def test_put_and_get_item(self):
+        item = self.create_item(1, age=60)
+        self.item_store.put_item(item)
+        cached_item = self.item_store.get_item(1)
+        assert cached_item.item_id == 1
+        assert cached_item.title == item.title
+        assert cached_item.kids == [2]
+        assert self.item_store.get_item(2) is None
+
+    @mock.patch("neo_haxor_news.item_store.time.time")
+    def test_get_item_expired(self, mock_time):
+        mock_time.return_value = self.now
+        self.item_store.put_item(self.create_item(1, age=60))
+        self.item_store.put_item(self.create_item(2, age=7 * 24 * 60 * 60))
+        mock_time.return_value = self.now + 60 * 60
+        assert self.item_store.get_item(1) is None
+        assert self.item_store.get_item(2).item_id == 2
+
+    def test_put_item_without_raw(self):
+        item = MockHackerNewsApi().get_item(0)
+        self.item_store.put_item(item)
+        assert self.item_store.get_item(0) is None
+
+    def test_persists_across_instances(self):
+        self.item_store.put_item(self.create_item(1, age=60))
+        self.item_store.put_user(User({"id": "foo", "karma": 10, "created": 0}))
+        item_store = ItemStore(self.item_store.database_path)
+        assert item_store.get_item(1).item_id == 1
+        assert item_store.get_user("foo").karma == 10
+
+    @mock.patch("neo_haxor_news.item_store.time.time")
+    def test_get_user_expired(self, mock_time):
+        mock_time.return_value = self.now
+        self.item_store.put_user(User({"id": "foo", "karma": 10, "created": 0}))
+        mock_time.return_value = self.now + ItemStore.USER_TTL + 1
+        assert self.item_store.get_user("foo") is None
+
+    def test_put_and_get_listing(self):
+        assert self.item_store.get_listing("topstories") is None
+        self.item_store.put_listing("topstories", [3, 1, 2])
+        assert self.item_store.get_listing("topstories") == [3, 1, 2]
+
+    def test_put_and_get_thread_scan(self):
+        assert self.item_store.get_thread_scan(1, "python") == {}
+        self.item_store.put_thread_scan(1, "python", {2: True, 3: False})
+        self.item_store.put_thread_scan(1, "python", {4: False})
+        self.item_store.put_thread_scan(1, "rust", {2: False})
+        assert self.item_store.get_thread_scan(1, "python") == {
+            2: True,
+            3: False,
+            4: False,
+        }
+        assert self.item_store.get_thread_scan(1, "rust") == {2: False}
+        assert self.item_store.get_thread_scan(5, "python") == {}
+
+    def test_put_and_find_job_posts(self):
+        self.item_store.put_job_posts(
+            1,
+            [
+                JobPost(2, remote=True, salary_max=200000, tech=["python", "rust"]),
+                JobPost(3, location="Berlin, Germany", visa=True, tech=["go"]),
+                JobPost(4, remote=True, salary_max=100000, tech=["rust"]),
+            ],
+        )
+        assert self.item_store.get_job_post_ids(1) == {2, 3, 4}
+        assert self.item_store.get_job_post_ids(5) == set()
+        find = self.item_store.find_job_posts
+        assert find(1, JobPostFilter(remote=True)) == {2, 4}
+        assert find(1, JobPostFilter(tech=["rust"], min_salary=150000)) == {2}
+        assert find(1, JobPostFilter(tech=["Rust", "python"])) == {2}
+        assert find(1, JobPostFilter(tech=["rus"])) == set()
+        assert find(1, JobPostFilter(visa=True, location="berlin")) == {3}
+        assert find(1, JobPostFilter(location="%")) == set()
+        assert find(1, JobPostFilter(location="_")) == set()
+        assert find(5, JobPostFilter(remote=True)) == set()
+
+    @mock.patch("neo_haxor_news.item_store.time.time")
+    def test_get_item_ignore_ttl(self, mock_time):
+        mock_time.return_value = self.now
+        self.item_store.put_item(self.create_item(1, age=60))
+        mock_time.return_value = self.now + 60 * 60
+        assert self.item_store.get_item(1) is None
+        assert self.item_store.get_item(1, ignore_ttl=True).item_id == 1
+
+    def test_apply_updates_invalidates(self):
+        self.item_store.put_item(self.create_item(1, age=7 * 24 * 60 * 60))
+        self.item_store.put_item(self.create_item(2, age=7 * 24 * 60 * 60))
+        self.item_store.put_user(User({"id": "foo", "karma": 10, "created": 0}))
+        self.item_store.apply_updates([1], ["foo"])
+        assert self.item_store.get_item(1) is None
+        assert self.item_store.get_item(1, ignore_ttl=True).item_id == 1
+        assert self.item_store.get_item(2).item_id == 2
+        assert self.item_store.get_user("foo") is None
+        assert self.item_store.get_user("foo", ignore_ttl=True).karma == 10
+
+    @mock.patch("neo_haxor_news.item_store.time.time")
+    def test_updates_do_not_extend_ttl(self, mock_time):
+        mock_time.return_value = self.now
+        self.item_store.apply_updates([], [])
+        self.item_store.put_item(self.create_item(1, age=60))
+        for minutes in range(1, 10):
+            mock_time.return_value = self.now + minutes * 60
+            self.item_store.apply_updates([], [])
+        assert self.item_store.get_item(1) is None
+
+    def test_updates_sync_persisted(self):
+        self.item_store.apply_updates([], [])
+        item_store = ItemStore(self.item_store.database_path)
+        assert item_store.updates_synced_at == self.item_store.updates_synced_at
+
+
+class HackerNewsItemStoreTest(IsolatedHomeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.hn = HackerNews()
+        self.hn.hacker_news_api = mock.Mock()
+        self.item = Item({"id": 1, "by": "foo", "time": int(time.time())})
+
+    def test_get_item_served_from_cache(self):
+        self.hn.hacker_news_api.get_item.return_value = self.item
+        assert self.hn.get_item(1).item_id == 1
+        assert self.hn.get_item(1).item_id == 1
+        self.hn.hacker_news_api.get_item.assert_called_once_with(1)
+        assert self.hn.fetch_stats.counters["item cache hits"] == 1
+
+    def test_get_user_served_from_cache(self):
+        self.hn.hacker_news_api.get_user.return_value = User(
+            {"id": "foo", "submitted": [1, 2]}
+        )
+        assert self.hn.get_user("foo").submitted == [1, 2]
+        assert json.loads(self.hn.get_user("foo").raw)["id"] == "foo"
+        self.hn.hacker_news_api.get_user.assert_called_once_with("foo")
+
+    def test_sync_updates(self):
+        self.hn.item_store.put_item(self.item)
+        self.hn.hacker_news_api.base_url = "https://hacker-news.firebaseio.com/v0/"
+        with mock.patch.object(self.hn, "get_json") as mock_get_json:
+            mock_get_json.return_value = {"items": [1], "profiles": ["foo"]}
+            self.hn.hacker_news_api.get_item.return_value = self.item
+            assert self.hn.get_item(1).item_id == 1
+            assert self.hn.get_item(1).item_id == 1
+        mock_get_json.assert_called_once_with(
+            "https://hacker-news.firebaseio.com/v0/updates.json"
+        )
+        self.hn.hacker_news_api.get_item.assert_called_once_with(1)
+        assert self.hn.fetch_stats.counters["updates synced"] == 1
+
+    def test_sync_updates_skipped_when_recent(self):
+        self.hn.item_store.put_item(self.item)
+        self.hn.item_store.apply_updates([], [])
+        with mock.patch.object(self.hn, "get_json") as mock_get_json:
+            self.hn.sync_updates()
+        assert not mock_get_json.mock_calls
+
+    def test_sync_updates_skipped_offline(self):
+        self.hn.item_store.put_item(self.item)
+        self.hn.offline = True
+        with mock.patch.object(self.hn, "get_json") as mock_get_json:
+            self.hn.sync_updates()
+        assert not mock_get_json.mock_calls
+
+    def test_sync_updates_skipped_without_base_url(self):
+        self.hn.item_store.put_item(Item({"id": 0, "by": "foo", "time": 0}))
+        self.hn.hacker_news_api = MockHackerNewsApi()
+        with mock.patch.object(self.hn, "get_json") as mock_get_json:
+            assert self.hn.get_item(1).item_id == 1
+        assert not mock_get_json.mock_calls
+
+    def test_sync_updates_failure_ignored(self):
+        self.hn.item_store.put_item(self.item)
+        self.hn.hacker_news_api.base_url = "https://hacker-news.firebaseio.com/v0/"
+        self.hn.request_scheduler.max_retries = 0
+        with mock.patch.object(self.hn, "get_json") as mock_get_json:
+            mock_get_json.side_effect = HTTPError
+            self.hn.sync_updates()
+        assert self.hn.item_store.updates_synced_at is None
+        assert self.hn.get_item(1).item_id == 1
@@ -0,0 +1,99 @@
+import unittest
+
+from hackernews import Item
+
+from neo_haxor_news.job_post import (
+    JobPost,
+    JobPostFilter,
+    parse_job_post,
+    parse_salary,
+)
+
+
+def job_post_item(item_id, text):
+    return Item(
+        {"id": item_id, "type": "comment", "by": "foo", "time": 0, "text": text}
+    )
+
+
+class JobPostTest(unittest.TestCase):
+    def test_parse_job_post(self):
+        job_post = parse_job_post(
+            job_post_item(
+                1,
+                "Acme | Senior Engineer | San Francisco, CA | REMOTE (US) | "
+                "$150k - $200k<p>We use Rust and Python on AWS, and can "
+                'sponsor visas. Apply at <a href="https:&#x2F;&#x2F;acme.com">'
+                "acme.com</a>",
+            )
+        )
+        assert job_post == JobPost(
+            comment_id=1,
+            company="Acme",
+            location="San Francisco, CA",
+            remote=True,
+            onsite=False,
+            visa=True,
+            salary_min=150000,
+            salary_max=200000,
+            currency="$",
+            tech=["aws", "python", "rust"],
+        )
+
+    def test_parse_job_post_onsite(self):
+        job_post = parse_job_post(
+            job_post_item(
+                2,
+                "Foo GmbH | Berlin, Germany | Onsite | &euro;70.000 - 90.000"
+                "<p>No remote, and we can't sponsor visas. Node.js, C++ and C#.",
+            )
+        )
+        assert job_post.location == "Berlin, Germany"
+        assert not job_post.remote
+        assert job_post.onsite
+        assert job_post.visa is False
+        assert (job_post.salary_min, job_post.salary_max) == (70000, 90000)
+        assert job_post.currency == "€"
+        assert job_post.tech == ["c#", "c++", "node"]
+
+    def test_parse_job_post_skips_hourly_rates(self):
+        job_post = parse_job_post(
+            job_post_item(3, "SEEKING WORK | Remote | $85/hr or $120k/yr<p>Golang")
+        )
+        assert job_post.company == "SEEKING WORK"
+        assert job_post.location is None
+        assert job_post.visa is None
+        assert (job_post.salary_min, job_post.salary_max) == (120000, 120000)
+        assert job_post.tech == ["go"]
+
+    def test_parse_job_post_ignores_common_words(self):
+        job_post = parse_job_post(
+            job_post_item(4, "Bar | NYC<p>Ready to go? We react fast, swiftly.")
+        )
+        assert job_post.tech == []
+        job_post = parse_job_post(
+            job_post_item(4, "Bar | NYC<p>Go ahead and apply. Go big or go home.")
+        )
+        assert job_post.tech == []
+
+    def test_parse_job_post_go_in_lists(self):
+        for text in ("Go, Python", "Python/Go", "Rust, Go and C", "Go / Rust"):
+            job_post = parse_job_post(job_post_item(6, f"Bar | NYC<p>{text}"))
+            assert "go" in job_post.tech, text
+        assert job_post.salary_min is None
+
+    def test_parse_job_post_without_text(self):
+        assert parse_job_post(job_post_item(5, None)) == JobPost(comment_id=5)
+
+    def test_parse_salary(self):
+        assert parse_salary("150k") == 150000
+        assert parse_salary("150000") == 150000
+        assert parse_salary("92.5K") == 92500
+        with self.assertRaises(ValueError):
+            parse_salary("lots")
+
+    def test_job_post_filter_is_set(self):
+        assert not JobPostFilter().is_set()
+        assert JobPostFilter(remote=True).is_set()
+        assert JobPostFilter(tech=["rust"]).is_set()
+        assert JobPostFilter(min_salary=0).is_set()
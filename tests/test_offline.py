@@ -0,0 +1,75 @@
+import time
+
+import mock
+from hackernews import InvalidItemID, InvalidUserID, Item, User
+
+from neo_haxor_news.hacker_news import HackerNews
+from tests.isolated_home import IsolatedHomeTestCase
+
+
+class OfflineTest(IsolatedHomeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.hn = HackerNews(offline=True)
+        self.hn.hacker_news_api = mock.Mock()
+        self.hn.transport = mock.Mock()
+        self.hn.item_store.put_item(
+            Item(
+                {
+                    "id": 1,
+                    "by": "foo",
+                    "time": int(time.time()) - 365 * 24 * 60 * 60,
+                    "title": "title foo",
+                    "kids": [2, 3],
+                }
+            )
+        )
+        self.hn.item_store.put_item(
+            Item({"id": 2, "by": "bar", "time": int(time.time()), "text": "text bar"})
+        )
+
+    def test_get_item_offline(self):
+        assert self.hn.get_item(1).title == "title foo"
+        with self.assertRaises(InvalidItemID):
+            self.hn.get_item(3)
+        assert not self.hn.hacker_news_api.mock_calls
+
+    def test_get_user_offline(self):
+        self.hn.item_store.put_user(User({"id": "foo", "submitted": [1]}))
+        assert self.hn.get_user("foo").submitted == [1]
+        with self.assertRaises(InvalidUserID):
+            self.hn.get_user("bar")
+        assert not self.hn.hacker_news_api.mock_calls
+
+    def test_get_story_ids_offline(self):
+        assert self.hn.get_story_ids("topstories", 10) is None
+        self.hn.item_store.put_listing("topstories", [1, 2, 3])
+        assert self.hn.get_story_ids("topstories", 2) == [1, 2]
+        assert not self.hn.transport.mock_calls
+
+    def test_get_story_ids_online_cached(self):
+        self.hn.offline = False
+        self.hn.hacker_news_api.base_url = "https://example.com/v0/"
+        self.hn.transport.get.return_value.status_code = 200
+        self.hn.transport.get.return_value.json.return_value = [5, 6, 7]
+        assert self.hn.get_story_ids("beststories", 2) == [5, 6]
+        self.hn.transport.get.assert_called_with(
+            "https://example.com/v0/beststories.json"
+        )
+        assert self.hn.item_store.get_listing("beststories") == [5, 6, 7]
+
+    @mock.patch("neo_haxor_news.hacker_news.click")
+    def test_top_offline_without_listing(self, mock_click):
+        with mock.patch.object(self.hn, "print_items") as mock_print_items:
+            self.hn.top(10)
+        assert not mock_print_items.mock_calls
+        assert mock_click.secho.mock_calls
+
+    @mock.patch("neo_haxor_news.hacker_news.click.echo")
+    @mock.patch("neo_haxor_news.hacker_news.click.secho")
+    def test_print_comments_marks_missing(self, mock_click_secho, mock_click_echo):
+        self.hn.print_comments(self.hn.get_item(1), regex_query=None)
+        mock_click_echo.assert_any_call("  text bar", color=True)
+        mock_click_secho.assert_any_call(
+            "Item with id 3 is not cached [offline].", fg="red"
+        )
@@ -0,0 +1,68 @@
+import sys
+
+import mock
+
+from neo_haxor_news import prefetch
+from neo_haxor_news.hacker_news import HackerNews
+from tests.isolated_home import IsolatedHomeTestCase
+from tests.mock_hacker_news_api import MockHackerNewsApi
+
+
+class PrefetchTest(IsolatedHomeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.hn = HackerNews()
+        self.hn.hacker_news_api = MockHackerNewsApi()
+
+    @mock.patch("neo_haxor_news.hacker_news.subprocess.Popen")
+    def test_prefetch_disabled_by_default(self, mock_popen):
+        self.hn.start_comments_prefetch([0, 1, 2])
+        assert not mock_popen.mock_calls
+
+    @mock.patch("neo_haxor_news.hacker_news.subprocess.Popen")
+    def test_start_comments_prefetch(self, mock_popen):
+        self.hn.config.prefetch_comments = 2
+        self.hn.start_comments_prefetch([0, 1, 2])
+        args = mock_popen.call_args.args[0]
+        assert args == [sys.executable, "-m", "neo_haxor_news.prefetch", "0", "1"]
+
+    @mock.patch("neo_haxor_news.hacker_news.subprocess.Popen")
+    def test_start_comments_prefetch_bounded(self, mock_popen):
+        self.hn.config.prefetch_comments = 1000
+        self.hn.start_comments_prefetch(list(range(100)))
+        args = mock_popen.call_args.args[0]
+        assert len(args) == 3 + HackerNews.MAX_PREFETCH_COMMENTS
+
+    @mock.patch("neo_haxor_news.hacker_news.subprocess.Popen")
+    @mock.patch("neo_haxor_news.hacker_news.click")
+    @mock.patch("neo_haxor_news.config.Config.save_cache")
+    def test_print_items_starts_prefetch(self, mock_save_cache, mock_click, mock_popen):
+        self.hn.config.prefetch_comments = 1
+        self.hn.print_items([2, 1, 0])
+        args = mock_popen.call_args.args[0]
+        assert args[3:] == ["2"]
+
+    def test_prefetch_comments(self):
+        fetched = []
+        get_item = self.hn.hacker_news_api.get_item
+
+        def record_get_item(item_id):
+            fetched.append(item_id)
+            return get_item(item_id)
+
+        self.hn.hacker_news_api.get_item = record_get_item
+        self.hn.prefetch_comments([0, 9000])
+        assert fetched == [0, 1, 2, 9000]
+
+    @mock.patch("neo_haxor_news.prefetch.os")
+    @mock.patch("neo_haxor_news.prefetch.HackerNews")
+    def test_main(self, mock_hacker_news, mock_os):
+        mock_hacker_news.return_value.config.max_workers = 8
+        prefetch.main(["3", "4"])
+        assert mock_hacker_news.return_value.item_fetcher.max_workers == 4
+        request_scheduler = mock_hacker_news.return_value.request_scheduler
+        assert request_scheduler.max_concurrency == 4
+        assert request_scheduler.concurrency_limit == 4
+        mock_os.nice.assert_called_with(19)
+        item_ids = mock_hacker_news.return_value.prefetch_comments.call_args.args[0]
+        assert list(item_ids) == [3, 4]
@@ -0,0 +1,105 @@
+import threading
+import time
+import unittest
+
+import mock
+from hackernews import HTTPError, InvalidItemID
+
+from neo_haxor_news.deadline import Deadline
+from neo_haxor_news.request_scheduler import RequestScheduler, TokenBucket
+
+
+class TokenBucketTest(unittest.TestCase):
+    @mock.patch("neo_haxor_news.request_scheduler.time")
+    def test_acquire_waits_for_tokens(self, mock_time):
+        clock = [0.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        mock_time.sleep.side_effect = sleep
+        token_bucket = TokenBucket(rate=10, capacity=2)
+        for _ in range(4):
+            token_bucket.acquire()
+        assert clock[0] == 0.2
+
+
+class RequestSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.request_scheduler = RequestScheduler(
+            requests_per_second=1000, max_concurrency=4, backoff_base=0.001
+        )
+
+    def test_call(self):
+        assert self.request_scheduler.call(lambda x, y=0: x + y, 1, y=2) == 3
+
+    def test_call_uncapped(self):
+        request_scheduler = RequestScheduler(requests_per_second=0, max_concurrency=4)
+        assert request_scheduler.token_bucket is None
+        assert request_scheduler.call(lambda: "item") == "item"
+
+    def test_call_retries_transient_errors(self):
+        func = mock.Mock(side_effect=[HTTPError, HTTPError, "item"])
+        assert self.request_scheduler.call(func, 1) == "item"
+        assert func.call_count == 3
+        assert self.request_scheduler.fetch_stats.counters["requests retried"] == 2
+
+    def test_call_gives_up(self):
+        func = mock.Mock(side_effect=HTTPError)
+        with self.assertRaises(HTTPError):
+            self.request_scheduler.call(func)
+        assert func.call_count == self.request_scheduler.max_retries + 1
+        assert self.request_scheduler.fetch_stats.counters["requests failed"] == 1
+
+    def test_call_does_not_retry_invalid_item(self):
+        func = mock.Mock(side_effect=InvalidItemID)
+        with self.assertRaises(InvalidItemID):
+            self.request_scheduler.call(func)
+        assert func.call_count == 1
+
+    def test_aimd(self):
+        func = mock.Mock(side_effect=[HTTPError, HTTPError, "item"])
+        self.request_scheduler.call(func)
+        assert self.request_scheduler.concurrency_limit == 2
+        for _ in range(20):
+            self.request_scheduler.call(lambda: None)
+        assert self.request_scheduler.concurrency_limit == 4
+
+    def test_backoff_bounded(self):
+        for attempt in range(20):
+            backoff = self.request_scheduler.backoff(attempt)
+            assert 0 <= backoff <= self.request_scheduler.backoff_max
+
+    def test_concurrency_bounded(self):
+        lock = threading.Lock()
+        in_flight = [0]
+        max_in_flight = [0]
+
+        def func():
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+
+        self.request_scheduler.max_concurrency = 2
+        self.request_scheduler.concurrency_limit = 2
+        threads = [
+            threading.Thread(target=self.request_scheduler.call, args=(func,))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert max_in_flight[0] == 2
+
+    def test_call_stops_retrying_at_deadline(self):
+        self.request_scheduler.deadline = Deadline(0.0)
+        func = mock.Mock(side_effect=[HTTPError, "item"])
+        with self.assertRaises(HTTPError):
+            self.request_scheduler.call(func, 1)
+        assert func.call_count == 1
+        assert self.request_scheduler.fetch_stats.counters["requests failed"] == 1
@@ -0,0 +1,113 @@
+import os
+import sqlite3
+import time
+
+import mock
+from hackernews import Item
+
+from neo_haxor_news.hacker_news import HackerNews
+from neo_haxor_news.item_store import ItemStore, plain_text
+from tests.isolated_home import IsolatedHomeTestCase
+
+
+class SearchTest(IsolatedHomeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.database_path = os.path.join(self.temp_dir, ItemStore.DATABASE)
+        self.item_store = ItemStore(self.database_path)
+        self.item_store.put_item(self.story(1, "Rust compiler internals"))
+        self.item_store.put_item(
+            self.comment(2, "<p>The <i>rust</i> borrow checker &amp; C++ templates")
+        )
+        self.item_store.put_item(self.comment(3, "Postgres vacuum tuning"))
+
+    def story(self, item_id, title, text=None):
+        return Item(
+            {
+                "id": item_id,
+                "type": "story",
+                "by": "foo",
+                "time": int(time.time()),
+                "title": title,
+                "text": text,
+                "score": 1,
+            }
+        )
+
+    def comment(self, item_id, text):
+        return Item(
+            {
+                "id": item_id,
+                "type": "comment",
+                "by": "bar",
+                "time": int(time.time()),
+                "text": text,
+                "parent": 1,
+            }
+        )
+
+    def search_ids(self, query, limit=10):
+        return [item.item_id for item in self.item_store.search(query, limit)]
+
+    def test_plain_text(self):
+        assert plain_text('<p>a <a href="x">b</a> &gt; c') == " a  b  > c"
+        assert plain_text(None) == ""
+
+    def test_search(self):
+        assert self.search_ids("rust") == [1, 2]
+        assert self.search_ids("RUST borrow") == [2]
+        assert self.search_ids("vacuum") == [3]
+        assert self.search_ids("mysql") == []
+        assert self.search_ids("") == []
+        assert self.search_ids("rust", limit=1) == [1]
+
+    def test_search_ignores_markup_and_syntax(self):
+        assert self.search_ids("amp") == []
+        assert self.search_ids("c++") == [2]
+        assert self.search_ids('"templates') == [2]
+        assert self.search_ids("NOT rust") == []
+
+    def test_put_item_reindexes(self):
+        self.item_store.put_item(self.comment(3, "Mysql replication"))
+        assert self.search_ids("vacuum") == []
+        assert self.search_ids("mysql") == [3]
+
+    def test_prune_mirrored_items_unindexes(self):
+        self.item_store.put_item(self.story(1, "Rust compiler internals"), True)
+        self.item_store.put_item(self.comment(3, "Postgres vacuum tuning"), True)
+        assert self.item_store.prune_mirrored_items(4) == 2
+        assert self.search_ids("rust") == [2]
+        assert self.search_ids("vacuum") == []
+
+    def test_index_created_for_existing_cache(self):
+        connection = sqlite3.connect(self.database_path)
+        connection.execute("DROP TABLE items_fts")
+        connection.commit()
+        connection.close()
+        item_store = ItemStore(self.database_path)
+        assert [item.item_id for item in item_store.search("rust")] == [1, 2]
+
+    @mock.patch("neo_haxor_news.hacker_news.click")
+    @mock.patch("neo_haxor_news.config.Config.save_cache")
+    def test_hacker_news_search(self, mock_save_cache, mock_click):
+        hn = HackerNews()
+        hn.item_store = self.item_store
+        hn.config.show_tip = False
+        mock_format_comment = mock.Mock(return_value=("heading", "comment"))
+        with (
+            mock.patch.object(hn, "format_item") as mock_format_item,
+            mock.patch.object(hn, "format_comment", mock_format_comment),
+        ):
+            hn.search("rust", 10)
+        assert hn.config.item_ids == [1, 2]
+        assert mock_format_item.call_args.args[0].item_id == 1
+        assert mock_format_item.call_args.args[1] == 1
+        assert mock_format_comment.call_args.args[0].item_id == 2
+        mock_save_cache.assert_called_once_with()
+
+    @mock.patch("neo_haxor_news.hacker_news.click")
+    def test_hacker_news_search_no_match(self, mock_click):
+        hn = HackerNews()
+        hn.item_store = self.item_store
+        hn.search("mysql", 10)
+        mock_click.secho.assert_called_with("No cached item matches mysql.", fg="red")
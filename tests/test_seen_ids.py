@@ -0,0 +1,87 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from neo_haxor_news.seen_ids import SeenIds
+
+
+class SeenIdsTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "state", "seen_ids")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_add_and_contains(self):
+        seen_ids = SeenIds([5, 70000])
+        assert seen_ids.add(3)
+        assert not seen_ids.add(3)
+        assert not seen_ids.add("5")
+        assert 3 in seen_ids
+        assert "70000" in seen_ids
+        assert 4 not in seen_ids
+        assert 70001 not in seen_ids
+        assert "foo" not in seen_ids
+        assert len(seen_ids) == 3
+        assert list(seen_ids) == [3, 5, 70000]
+        with self.assertRaises(ValueError):
+            seen_ids.add(-1)
+
+    def test_dense_chunk_becomes_bitmap(self):
+        item_ids = range(40000000, 40000000 + 3 * SeenIds.ARRAY_MAX, 3)
+        seen_ids = SeenIds(item_ids)
+        assert len(seen_ids) == len(item_ids)
+        assert all(item_id in seen_ids for item_id in item_ids)
+        assert 40000001 not in seen_ids
+        assert not seen_ids.add(40000003)
+        assert list(seen_ids) == list(item_ids)
+
+    def test_save_and_load(self):
+        item_ids = list(range(0, 10000, 2)) + [65536, 123456789]
+        seen_ids = SeenIds(item_ids)
+        seen_ids.save(self.path)
+        assert not seen_ids.dirty
+        loaded = SeenIds.load(self.path)
+        assert len(loaded) == len(item_ids)
+        assert list(loaded) == item_ids
+        assert not loaded.dirty
+        assert loaded.add(1)
+
+    def test_dirty(self):
+        seen_ids = SeenIds([1])
+        assert seen_ids.dirty
+        assert seen_ids.added == [1]
+        seen_ids.save(self.path)
+        assert not seen_ids.dirty
+        assert not seen_ids.add(1)
+        assert not seen_ids.dirty
+        seen_ids.add(2)
+        seen_ids.add(3)
+        assert seen_ids.added == [2, 3]
+        seen_ids.mark_saved()
+        assert not seen_ids.dirty
+
+    def test_load_missing_or_corrupt(self):
+        assert len(SeenIds.load(self.path)) == 0
+        seen_ids = SeenIds([1, 2])
+        seen_ids.save(self.path)
+        with open(self.path, "r+b") as seen_ids_file:
+            seen_ids_file.truncate(len(SeenIds.MAGIC) + 4)
+        assert len(SeenIds.load(self.path)) == 0
+        with open(self.path, "wb") as seen_ids_file:
+            seen_ids_file.write(b"[1, 2]")
+        assert len(SeenIds.load(self.path)) == 0
+
+    def test_clear(self):
+        seen_ids = SeenIds([1])
+        seen_ids.save(self.path)
+        seen_ids.add(2)
+        seen_ids.clear()
+        assert seen_ids.cleared
+        assert seen_ids.added == []
+        assert 1 not in seen_ids
+        assert len(seen_ids) == 0
+        seen_ids.add(3)
+        assert seen_ids.added == [3]
@@ -0,0 +1,108 @@
+import threading
+import unittest
+
+import mock
+from hackernews import InvalidItemID
+
+from neo_haxor_news.hacker_news import HackerNews
+from neo_haxor_news.single_flight import SingleFlight
+from tests.isolated_home import IsolatedHomeTestCase
+from tests.mock_hacker_news_api import MockHackerNewsApi
+
+
+class SingleFlightTest(unittest.TestCase):
+    def setUp(self):
+        self.single_flight = SingleFlight()
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = []
+
+    def slow_call(self, value):
+        self.calls.append(value)
+        self.started.set()
+        self.release.wait(timeout=1)
+        if value is None:
+            raise InvalidItemID
+        return value
+
+    def run_concurrently(self, key, value, num_callers=4):
+        results = []
+
+        def caller():
+            try:
+                results.append(self.single_flight.do(key, self.slow_call, value))
+            except InvalidItemID as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=caller) for _ in range(num_callers)]
+        for thread in threads:
+            thread.start()
+        self.started.wait(timeout=1)
+        # Give the other callers time to join the in-flight call.
+        threading.Event().wait(0.05)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_do_shares_call(self):
+        results = self.run_concurrently(1, "item")
+        assert self.calls == ["item"]
+        assert sorted(results) == [
+            ("item", False),
+            ("item", True),
+            ("item", True),
+            ("item", True),
+        ]
+
+    def test_do_shares_error(self):
+        results = self.run_concurrently(1, None, num_callers=3)
+        assert self.calls == [None]
+        assert all(isinstance(result, InvalidItemID) for result in results)
+
+    def test_do_not_cached(self):
+        self.release.set()
+        assert self.single_flight.do(1, self.slow_call, "a") == ("a", False)
+        assert self.single_flight.do(1, self.slow_call, "b") == ("b", False)
+        assert self.calls == ["a", "b"]
+
+
+class HackerNewsSingleFlightTest(IsolatedHomeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.hn = HackerNews()
+        self.hn.hacker_news_api = MockHackerNewsApi()
+
+    def test_get_item_coalesced(self):
+        release = threading.Event()
+        get_item = self.hn.hacker_news_api.get_item
+        api_calls = []
+
+        def slow_get_item(item_id):
+            api_calls.append(item_id)
+            release.wait(timeout=1)
+            return get_item(item_id)
+
+        self.hn.hacker_news_api.get_item = slow_get_item
+        items = []
+        threads = [
+            threading.Thread(target=lambda: items.append(self.hn.get_item(1)))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        threading.Event().wait(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert api_calls == [1]
+        assert items[0] is items[1] is items[2]
+        assert self.hn.fetch_stats.counters["requests coalesced"] == 2
+
+    @mock.patch("neo_haxor_news.hacker_news.click")
+    def test_print_fetch_stats(self, mock_click):
+        self.hn.get_item(1)
+        self.hn.print_fetch_stats()
+        report = mock_click.secho.call_args.args[0]
+        assert "items fetched: 1" in report
+        assert "connections opened: 0" in report
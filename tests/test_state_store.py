@@ -0,0 +1,244 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from neo_haxor_news.config import Config
+from neo_haxor_news.hacker_news import HackerNews
+from neo_haxor_news.state_store import StateStore
+from tests.isolated_home import IsolatedHomeTestCase
+from tests.mock_hacker_news_api import MockHackerNewsApi
+
+
+class StateStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.state_dir = os.path.join(self.temp_dir, "haxor-news")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def read_journal(self):
+        with open(os.path.join(self.state_dir, StateStore.JOURNAL)) as journal:
+            return journal.read().splitlines()
+
+    def test_save_appends_changes_only(self):
+        state_store = StateStore(self.state_dir)
+        state_store.seen_ids.update([1, 2])
+        state_store.save({"item_ids": [3, 4], "hiring_id": 5})
+        state_store.save({"item_ids": [3, 4], "hiring_id": 5})
+        state_store.seen_ids.add(6)
+        state_store.save({"item_ids": [7], "hiring_id": 5})
+        assert self.read_journal() == [
+            '{"seen_ids":[1,2],"set":{"item_ids":[3,4],"hiring_id":5}}',
+            '{"seen_ids":[6],"set":{"item_ids":[7]}}',
+        ]
+        state_store = StateStore(self.state_dir)
+        assert state_store.values == {"item_ids": [7], "hiring_id": 5}
+        assert list(state_store.seen_ids) == [1, 2, 6]
+        assert not state_store.seen_ids.dirty
+
+    def test_clear_seen_ids(self):
+        state_store = StateStore(self.state_dir)
+        state_store.seen_ids.update([1, 2])
+        state_store.save({})
+        state_store.seen_ids.clear()
+        state_store.seen_ids.add(3)
+        state_store.save({})
+        assert list(StateStore(self.state_dir).seen_ids) == [3]
+
+    @mock.patch.object(StateStore, "MAX_JOURNAL_BYTES", 100)
+    def test_compaction(self):
+        state_store = StateStore(self.state_dir)
+        for item_id in range(0, 40, 4):
+            state_store.seen_ids.update(range(item_id, item_id + 4))
+            state_store.save({"item_ids": [item_id]})
+        assert os.path.getsize(state_store.journal_path) <= 100
+        assert len(self.read_journal()) < 10
+        state_store = StateStore(self.state_dir)
+        assert list(state_store.seen_ids) == list(range(40))
+        assert state_store.values == {"item_ids": [36]}
+
+    def test_replay_over_newer_snapshot(self):
+        state_store = StateStore(self.state_dir)
+        state_store.seen_ids.update([1, 2])
+        state_store.save({})
+        state_store.seen_ids.clear()
+        state_store.seen_ids.add(3)
+        state_store.save({"item_ids": [4]})
+        with open(state_store.journal_path, "rb") as journal:
+            uncompacted = journal.read()
+        state_store.compact()
+        with open(state_store.journal_path, "wb") as journal:
+            journal.write(uncompacted)
+        state_store = StateStore(self.state_dir)
+        assert list(state_store.seen_ids) == [3]
+        assert state_store.values == {"item_ids": [4]}
+
+    def test_cut_and_invalid_lines_skipped(self):
+        os.makedirs(self.state_dir)
+        with open(os.path.join(self.state_dir, StateStore.JOURNAL), "w") as journal:
+            journal.write(
+                '{"set":{"item_ids":[1]}}\n["foo"]\n{"seen_ids":["bar"]}\n'
+                '{"seen_ids":[2],"set":{"item_id'
+            )
+        state_store = StateStore(self.state_dir)
+        assert state_store.values == {"item_ids": [1]}
+        state_store.save({"hiring_id": 3})
+        state_store = StateStore(self.state_dir)
+        assert state_store.values == {"item_ids": [1], "hiring_id": 3}
+
+    @mock.patch.object(StateStore, "MAX_JOURNAL_BYTES", 200)
+    def test_concurrent_saves_merged(self):
+        processes = 4
+        pids = []
+        for process in range(processes):
+            pid = os.fork()
+            if pid == 0:
+                status = 1
+                try:
+                    state_store = StateStore(self.state_dir)
+                    for item_id in range(process, 400, processes):
+                        state_store.seen_ids.add(item_id)
+                        state_store.save({f"last_{process}": item_id})
+                    status = 0
+                finally:
+                    os._exit(status)
+            pids.append(pid)
+        for pid in pids:
+            assert os.waitpid(pid, 0)[1] == 0
+        state_store = StateStore(self.state_dir)
+        assert list(state_store.seen_ids) == list(range(400))
+        assert state_store.values == {
+            f"last_{process}": 400 - processes + process for process in range(processes)
+        }
+        for name in os.listdir(self.state_dir):
+            assert not name.endswith(".tmp")
+
+    def test_stale_process_does_not_drop_merged_state(self):
+        first = StateStore(self.state_dir)
+        second = StateStore(self.state_dir)
+        first.seen_ids.add(1)
+        first.save({"item_ids": [1]})
+        second.seen_ids.add(2)
+        second.save({"hiring_id": 3})
+        second.compact()
+        state_store = StateStore(self.state_dir)
+        assert list(state_store.seen_ids) == [1, 2]
+        assert state_store.values == {"item_ids": [1], "hiring_id": 3}
+
+
+class ConfigStateTest(IsolatedHomeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.config_path = os.path.join(self.temp_dir, Config.CONFIG)
+
+    def read_config(self):
+        with open(self.config_path) as config_file:
+            return config_file.read()
+
+    def test_state_dir(self):
+        assert Config().get_state_dir() == os.path.join(
+            self.temp_dir, "state", "haxor-news"
+        )
+
+    def test_legacy_state_moved_to_state_store(self):
+        with open(self.config_path, "w") as config_file:
+            config_file.write(
+                "[haxor-news]\nitem_ids = ['1', '2']\n"
+                "item_cache = ['3', 4, '5']\nhiring_id = 6\nfreelance_id = 7\n"
+                "show_tip = False\nmax_workers = 3\n"
+            )
+        config = Config()
+        assert config.item_ids == [1, 2]
+        assert list(config.seen_ids) == [3, 4, 5]
+        assert (config.hiring_id, config.freelance_id) == (6, 7)
+        assert config.settings_changed
+        config.save_cache()
+        settings = self.read_config()
+        for option in Config.LEGACY_STATE:
+            assert option not in settings
+        assert "show_tip = False" in settings
+        assert "max_workers = 3" in settings
+        state_store = StateStore(config.get_state_dir())
+        assert state_store.values == {
+            "item_ids": [1, 2],
+            "hiring_id": 6,
+            "freelance_id": 7,
+        }
+        assert list(state_store.seen_ids) == [3, 4, 5]
+
+    def test_settings_written_only_when_needed(self):
+        config = Config()
+        config.save_cache()
+        assert "show_tip" in self.read_config()
+        os.remove(self.config_path)
+        config.item_ids = [1]
+        config.save_cache()
+        assert not os.path.exists(self.config_path)
+        assert StateStore(config.get_state_dir()).values["item_ids"] == [1]
+
+    def test_sections_loaded_lazily(self):
+        state_store = StateStore(Config().get_state_dir())
+        state_store.seen_ids.add(1)
+        state_store.save({"item_ids": [2], "hiring_id": 3})
+        config = Config()
+        assert not any(
+            config.is_loaded(name)
+            for name in ("state_store", "seen_ids", "clr_link") + Config.LAZY_STATE
+        )
+        assert config.hiring_id == 3
+        assert config.is_loaded("state_store")
+        assert "seen_ids" not in config.state_store.__dict__
+        assert config.item_ids == [2]
+        assert config.clr_link == "green"
+        assert not config.is_loaded("seen_ids")
+        assert list(config.seen_ids) == [1]
+        assert not hasattr(config, "foo")
+
+    def test_save_only_loaded_state(self):
+        config = Config()
+        config.item_ids = [1]
+        config.save_cache()
+        assert not config.is_loaded("seen_ids")
+        assert StateStore(config.get_state_dir()).values == {"item_ids": [1]}
+        config = Config()
+        config.save_cache()
+        assert not config.is_loaded("state_store")
+
+    def test_colors_saved_and_reloaded(self):
+        config = Config()
+        config.clr_tag = "none"
+        config.clr_user = "foo"
+        config.save_settings()
+        config = Config()
+        assert config.clr_general is None
+        assert config.clr_tag is None
+        assert config.clr_link == "green"
+        assert config.clr_user == "cyan"
+
+    def test_hacker_news_loads_colors_lazily(self):
+        hn = HackerNews()
+        assert not hn.config.is_loaded("clr_link")
+        hn.format_comment(MockHackerNewsApi().items[2], 0, "yellow", "")
+        assert hn.config.is_loaded("clr_link")
+
+    @mock.patch("neo_haxor_news.hacker_news.click.echo")
+    def test_comment_unseen_only_once(self, mock_click_echo):
+        hn = HackerNews()
+        hn.hacker_news_api = MockHackerNewsApi()
+        item = hn.hacker_news_api.items[2]
+        hn.print_comment(item, regex_query=None)
+        hn.print_comment(item, regex_query=None)
+        headings = [
+            call.args[0]
+            for call in mock_click_echo.mock_calls
+            if "baz -" in call.args[0]
+        ]
+        assert len(headings) == 2
+        assert headings[0].endswith(f"{hn.COMMENT_UNSEEN}\x1b[0m")
+        assert hn.COMMENT_UNSEEN not in headings[1]
+        hn.config.save_cache()
+        assert item.item_id in StateStore(hn.config.get_state_dir()).seen_ids
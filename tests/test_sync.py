@@ -0,0 +1,114 @@
+import time
+
+import mock
+from hackernews import HTTPError, InvalidItemID, Item
+
+from neo_haxor_news.hacker_news import HackerNews
+from tests.isolated_home import IsolatedHomeTestCase
+
+
+class SyncTest(IsolatedHomeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.hn = HackerNews()
+        self.hn.config.sync_updates = False
+        self.hn.hacker_news_api = mock.Mock()
+        self.hn.hacker_news_api.base_url = "https://hacker-news.firebaseio.com/v0/"
+        self.hn.hacker_news_api.get_item.side_effect = self.get_item
+        self.hn.request_scheduler.max_retries = 0
+        self.failing_ids = set()
+        self.max_item_id = 100
+
+    def get_item(self, item_id):
+        if item_id in self.failing_ids:
+            raise HTTPError
+        if item_id % 10 == 0:
+            raise InvalidItemID
+        return Item({"id": item_id, "by": "foo", "time": int(time.time())})
+
+    def sync(self, lookback=None):
+        with (
+            mock.patch.object(self.hn, "get_json") as mock_get_json,
+            mock.patch("neo_haxor_news.hacker_news.click") as mock_click,
+        ):
+            mock_get_json.return_value = self.max_item_id
+            self.hn.sync(lookback)
+        mock_get_json.assert_called_once_with(
+            "https://hacker-news.firebaseio.com/v0/maxitem.json"
+        )
+        return mock_click.secho.call_args.args[0]
+
+    def fetched_ids(self):
+        return sorted(
+            call.args[0] for call in self.hn.hacker_news_api.get_item.call_args_list
+        )
+
+    def test_sync(self):
+        message = self.sync(lookback=20)
+        assert self.fetched_ids() == list(range(81, 101))
+        assert self.hn.item_store.get_item(81).item_id == 81
+        assert self.hn.item_store.get_meta(HackerNews.SYNC_CHECKPOINT) == "100"
+        assert message.startswith("Synced 18 items in ")
+        assert "items/sec" in message
+
+    def test_sync_resumes_from_checkpoint(self):
+        self.sync(lookback=20)
+        self.hn.hacker_news_api.get_item.reset_mock()
+        self.max_item_id = 105
+        self.sync(lookback=20)
+        assert self.fetched_ids() == list(range(101, 106))
+
+    def test_sync_checkpoint_stops_at_failure(self):
+        self.failing_ids = {95}
+        message = self.sync(lookback=20)
+        assert self.hn.item_store.get_meta(HackerNews.SYNC_CHECKPOINT) == "94"
+        assert "1 failed" in message
+        self.failing_ids = set()
+        self.hn.hacker_news_api.get_item.reset_mock()
+        self.sync(lookback=20)
+        assert self.fetched_ids() == [95, 100]
+        assert self.hn.item_store.get_meta(HackerNews.SYNC_CHECKPOINT) == "100"
+
+    def test_sync_prunes_below_window(self):
+        self.sync(lookback=20)
+        self.max_item_id = 110
+        message = self.sync(lookback=20)
+        assert self.hn.item_store.get_item(89) is None
+        assert self.hn.item_store.get_item(91).item_id == 91
+        assert "9 pruned" in message
+
+    def test_sync_keeps_items_cached_otherwise(self):
+        self.hn.get_item(85)
+        self.sync(lookback=20)
+        self.max_item_id = 110
+        message = self.sync(lookback=20)
+        assert self.hn.item_store.get_item(85).item_id == 85
+        assert self.hn.item_store.get_item(89) is None
+        assert "8 pruned" in message
+
+    def test_sync_refresh_keeps_items_cached_otherwise(self):
+        self.hn.get_item(85)
+        with mock.patch.object(self.hn.item_store, "item_ttl", return_value=-1):
+            self.sync(lookback=20)
+        assert self.fetched_ids().count(85) == 2
+        self.max_item_id = 110
+        self.sync(lookback=20)
+        assert self.hn.item_store.get_item(85, ignore_ttl=True).item_id == 85
+
+    def test_sync_counts_fetched_items_only(self):
+        for item_id in range(81, 90):
+            self.hn.get_item(item_id)
+        message = self.sync(lookback=20)
+        assert message.startswith("Synced 9 items in ")
+
+    def test_sync_lookback_config(self):
+        self.hn.config.sync_lookback = 5
+        self.sync()
+        assert self.fetched_ids() == list(range(96, 101))
+
+    @mock.patch("neo_haxor_news.hacker_news.click")
+    def test_sync_offline(self, mock_click):
+        self.hn.offline = True
+        self.hn.sync()
+        mock_click.secho.assert_called_with("hn sync needs network access.", fg="red")
+        assert not self.hn.hacker_news_api.get_item.mock_calls
@@ -0,0 +1,73 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import mock
+
+from neo_haxor_news.hacker_news import HackerNews
+from neo_haxor_news.transport import Transport
+from neo_haxor_news.web_viewer import WebViewer
+from tests.isolated_home import IsolatedHomeTestCase
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TransportTest(IsolatedHomeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/v0/item/1.json"
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.server_thread.join()
+
+    def test_connections_reused(self):
+        transport = Transport(pool_size=2)
+        for _ in range(5):
+            assert transport.get(self.url).json() == {"ok": True}
+        assert transport.stats() == {
+            "http requests": 5,
+            "connections opened": 1,
+            "connections reused": 4,
+        }
+
+    def test_keep_alive_disabled(self):
+        transport = Transport(keep_alive=False)
+        for _ in range(3):
+            transport.get(self.url)
+        assert transport.stats()["connections opened"] == 3
+        assert transport.stats()["connections reused"] == 0
+
+    def test_default_timeout(self):
+        transport = Transport(timeout=1.5)
+        with mock.patch("requests.Session.send") as mock_send:
+            transport.session.get(self.url)
+        assert mock_send.call_args.kwargs["timeout"] == 1.5
+
+    def test_web_viewer_uses_transport(self):
+        transport = Transport()
+        web_viewer = WebViewer(transport)
+        web_viewer.generate_url_contents(self.url)
+        web_viewer.generate_url_contents(self.url)
+        assert transport.stats()["connections reused"] == 1
+
+    def test_hacker_news_shares_transport(self):
+        hn = HackerNews()
+        assert hn.hacker_news_api.session is hn.transport.session
+        assert hn.web_viewer.transport is hn.transport
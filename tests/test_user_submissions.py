@@ -0,0 +1,86 @@
+import time
+
+import mock
+from hackernews import InvalidItemID, Item, User
+
+from neo_haxor_news.hacker_news import HackerNews
+from tests.isolated_home import IsolatedHomeTestCase
+
+
+class UserSubmissionsTest(IsolatedHomeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.hn = HackerNews()
+        self.hn.config.sync_updates = False
+        self.hn.hacker_news_api = mock.Mock()
+        self.hn.hacker_news_api.get_item.side_effect = self.get_item
+        # Every third submission is a story, the rest are comments.
+        self.submitted = list(range(100, 0, -1))
+        self.hn.hacker_news_api.get_user.return_value = User(
+            {"id": "foo", "karma": 10, "created": 0, "submitted": self.submitted}
+        )
+
+    def get_item(self, item_id):
+        if item_id == 99:
+            raise InvalidItemID
+        data = {"id": item_id, "by": "foo", "time": int(time.time()) - 10**6}
+        if item_id % 3 == 0:
+            data.update(type="story", title=f"story {item_id}")
+        else:
+            data.update(type="comment", text=f"comment {item_id}", parent=1)
+            data["deleted"] = item_id == 98
+        return Item(data)
+
+    def fetched_ids(self):
+        return [
+            call.args[0] for call in self.hn.hacker_news_api.get_item.call_args_list
+        ]
+
+    def test_find_stories(self):
+        stories = self.hn.find_submissions(self.submitted, 5)
+        assert [story.item_id for story in stories] == [96, 93, 90, 87, 84]
+        assert len(self.fetched_ids()) < len(self.submitted)
+
+    def test_find_comments(self):
+        comments = self.hn.find_submissions(self.submitted, 3, comments=True)
+        assert [comment.item_id for comment in comments] == [100, 97, 95]
+
+    def test_find_submissions_stops_early(self):
+        self.hn.item_fetcher.max_workers = 1
+        self.hn.find_submissions(self.submitted, 2)
+        assert sorted(self.fetched_ids(), reverse=True) == list(range(100, 92, -1))
+
+    def test_find_submissions_exhausted(self):
+        stories = self.hn.find_submissions([100, 99, 98, 97], 5)
+        assert stories == []
+        assert len(self.fetched_ids()) == 4
+
+    def test_find_submissions_bounded(self):
+        self.hn.MAX_SUBMISSIONS_SCANNED = 10
+        stories = self.hn.find_submissions(self.submitted, 50)
+        assert [story.item_id for story in stories] == [96, 93]
+        assert len(self.fetched_ids()) == 10
+
+    def test_find_submissions_cached(self):
+        self.hn.find_submissions(self.submitted, 5)
+        num_fetched = len(self.fetched_ids())
+        stories = self.hn.find_submissions(self.submitted, 5)
+        assert len(stories) == 5
+        # Only the missing item is asked for again.
+        assert self.fetched_ids()[num_fetched:] == [99]
+
+    @mock.patch("neo_haxor_news.hacker_news.click")
+    @mock.patch("neo_haxor_news.hacker_news.HackerNews.print_items")
+    def test_user_stories(self, mock_print_items, mock_click):
+        self.hn.user("foo", 3)
+        mock_print_items.assert_called_with([96, 93, 90])
+
+    @mock.patch("neo_haxor_news.hacker_news.click")
+    @mock.patch("neo_haxor_news.hacker_news.HackerNews.print_comment")
+    def test_user_comments(self, mock_print_comment, mock_click):
+        self.hn.user("foo", 2, comments=True)
+        comment_ids = [call.args[0].item_id for call in mock_print_comment.mock_calls]
+        assert comment_ids == [100, 97]
+        for call in mock_print_comment.mock_calls:
+            assert call.kwargs == {"regex_query": None, "depth": 1}
+        assert self.hn.config.item_ids == [100, 97]